@@ -1,22 +1,87 @@
 """Authentication dependencies for FastAPI routes."""
 
-import uuid
+import time
+from collections import OrderedDict
 from typing import Annotated
 
 from fastapi import Depends, Header
+from sqlalchemy import bindparam, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, load_only
 from sqlmodel import select
 
 from app.database import get_session
+from app.dependencies import get_redis_client
 from app.exceptions import UnauthorizedError
 from app.users.models import User
 
-from .tokens import TokenPayload, decode_token
+from .revocation import is_revoked, sync_revocation
+from .tokens import TokenPayload, decode_token, hash_token
+
+# Built once so SQLAlchemy reuses the cached statement and compiled SQL per request.
+# Only the columns routes read from the current user are loaded, and the selectin
+# relationships are skipped; services that need them load them explicitly.
+_active_user_by_id = lambda_stmt(
+    lambda: (
+        select(User)
+        .options(
+            load_only(
+                User.id,  # type: ignore[arg-type]
+                User.email,  # type: ignore[arg-type]
+                User.is_active,  # type: ignore[arg-type]
+                User.is_verified,  # type: ignore[arg-type]
+                User.created_at,  # type: ignore[arg-type]
+            ),
+            lazyload("*"),
+        )
+        .where(
+            User.id == bindparam("user_id"),
+            User.is_active == True,  # noqa: E712
+        )
+    )
+)
 
+# Bounded TTL cache of decoded access tokens, keyed by hash_token() of the raw
+# token so bearer strings are never retained in memory.
+_TOKEN_CACHE_MAXSIZE = 4096
+_TOKEN_CACHE_TTL_SECONDS = 300
+_token_cache: OrderedDict[bytes, tuple[float, TokenPayload]] = OrderedDict()
 
-async def get_token_from_header(
-    authorization: Annotated[str | None, Header()] = None,
-) -> str:
+
+def _get_cached_payload(key: bytes) -> TokenPayload | None:
+    """Return a cached payload if present and not yet expired."""
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, payload = entry
+    if expires_at <= time.time():
+        _token_cache.pop(key, None)
+        return None
+
+    _token_cache.move_to_end(key)
+    return payload
+
+
+def _cache_payload(key: bytes, payload: TokenPayload) -> None:
+    """Cache a verified payload until min(TTL, token expiry)."""
+    now = time.time()
+    expires_at = min(now + _TOKEN_CACHE_TTL_SECONDS, payload.exp.timestamp())
+    if expires_at <= now:
+        return
+
+    _token_cache[key] = (expires_at, payload)
+    _token_cache.move_to_end(key)
+    while len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+        _token_cache.popitem(last=False)
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token payloads."""
+    _token_cache.clear()
+
+
+def get_token_from_header(authorization: str | None) -> str:
     """Extract token from Authorization header.
 
     Args:
@@ -39,25 +104,41 @@ async def get_token_from_header(
 
 
 async def get_current_token_payload(
-    token: Annotated[str, Depends(get_token_from_header)],
+    authorization: Annotated[str | None, Header()] = None,
 ) -> TokenPayload:
-    """Validate token and return payload.
+    """Validate the Bearer token and return its payload.
+
+    Header parsing is a plain function call rather than a separate dependency,
+    so each request resolves one fewer dependency node.
 
     Args:
-        token: The Bearer token to validate.
+        authorization: The Authorization header value.
 
     Returns:
         The decoded token payload.
 
     Raises:
-        UnauthorizedError: If token is invalid or expired.
+        UnauthorizedError: If header is missing or token is invalid or expired.
     """
-    payload = decode_token(token)
+    token = get_token_from_header(authorization)
+    cache_key = hash_token(token)
+    payload = _get_cached_payload(cache_key)
     if payload is None:
-        raise UnauthorizedError("Invalid or expired token")
+        payload = decode_token(token)
+        if payload is None:
+            raise UnauthorizedError("Invalid or expired token")
 
-    if payload.token_type != "access":
-        raise UnauthorizedError("Invalid token type")
+        if payload.token_type != "access":
+            raise UnauthorizedError("Invalid token type")
+
+        await sync_revocation(payload, get_redis_client())
+
+        # Only successfully verified access tokens are cached
+        _cache_payload(cache_key, payload)
+
+    # Checked on cache hits too, so logout-all takes effect immediately
+    if is_revoked(payload):
+        raise UnauthorizedError("Token has been revoked")
 
     return payload
 
@@ -78,12 +159,8 @@ async def get_current_user(
     Raises:
         UnauthorizedError: If user not found or inactive.
     """
-    user_id = uuid.UUID(payload.sub)
-
-    result = await session.execute(
-        select(User).where(User.id == user_id, User.is_active == True)  # noqa: E712
-    )
-    user = result.scalar_one_or_none()
+    result = await session.execute(_active_user_by_id, {"user_id": payload.sub})
+    user: User | None = result.scalar_one_or_none()
 
     if user is None:
         raise UnauthorizedError("User not found or inactive")
@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, ForeignKey, Index, String, text
+from sqlalchemy import Column, ForeignKey, Index, LargeBinary, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlmodel import Field, SQLModel
 
@@ -16,7 +16,13 @@ class RefreshToken(SQLModel, table=True):
     __tablename__ = "refresh_token"
     __table_args__ = (
         Index("ix_refresh_token_user_id", "user_id"),
-        Index("ix_refresh_token_token_hash", "token_hash"),
+        # Only live tokens are looked up by hash, so keep revoked rows out of the index
+        Index(
+            "ix_refresh_token_active",
+            "token_hash",
+            unique=True,
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
     )
 
     id: uuid.UUID = Field(
@@ -30,8 +36,8 @@ class RefreshToken(SQLModel, table=True):
             nullable=False,
         ),
     )
-    token_hash: str = Field(
-        sa_column=Column(String(255), nullable=False),
+    token_hash: bytes = Field(
+        sa_column=Column(LargeBinary(16), nullable=False),
     )
     expires_at: datetime = Field(nullable=False)
     revoked_at: datetime | None = Field(default=None)
@@ -1,17 +1,50 @@
 """Password hashing service using Argon2id."""
 
-from passlib.context import CryptContext
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+ARGON2_MEMORY_COST = 65536  # 64 MB
+ARGON2_TIME_COST = 3
+ARGON2_PARALLELISM = 4
 
 # Configure Argon2id as the password hashing algorithm
 # These parameters follow OWASP recommendations for Argon2id
-pwd_context = CryptContext(
-    schemes=["argon2"],
-    deprecated="auto",
-    argon2__memory_cost=65536,  # 64 MB
-    argon2__time_cost=3,
-    argon2__parallelism=4,
+_hasher = PasswordHasher(
+    memory_cost=ARGON2_MEMORY_COST,
+    time_cost=ARGON2_TIME_COST,
+    parallelism=ARGON2_PARALLELISM,
+    hash_len=32,
+    salt_len=16,
 )
 
+# Verified against when a login email is unknown so both paths cost one Argon2 verify
+DUMMY_PASSWORD_HASH = _hasher.hash("x" * 16)
+
+# Dedicated pool for Argon2 work. Each hash already runs ARGON2_PARALLELISM
+# lanes, so the pool is sized to avoid oversubscribing the available CPUs.
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the password hashing thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        max_workers = max(1, (os.cpu_count() or 1) // ARGON2_PARALLELISM)
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="argon2")
+    return _executor
+
+
+def shutdown_password_executor() -> None:
+    """Shut down the password hashing thread pool."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
 
 def hash_password(password: str) -> str:
     """Hash a password using Argon2id.
@@ -22,7 +55,7 @@ def hash_password(password: str) -> str:
     Returns:
         The hashed password string.
     """
-    return pwd_context.hash(password)
+    return _hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -35,4 +68,48 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if the password matches, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return _hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was created with outdated Argon2 parameters.
+
+    Args:
+        hashed_password: The stored password hash.
+
+    Returns:
+        True if the password should be re-hashed with current parameters.
+    """
+    return _hasher.check_needs_rehash(hashed_password)
+
+
+async def ahash_password(password: str) -> str:
+    """Hash a password without blocking the event loop.
+
+    Args:
+        password: The plain text password to hash.
+
+    Returns:
+        The hashed password string.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), hash_password, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop.
+
+    Args:
+        plain_password: The plain text password to verify.
+        hashed_password: The hashed password to check against.
+
+    Returns:
+        True if the password matches, False otherwise.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), verify_password, plain_password, hashed_password
+    )
@@ -0,0 +1,146 @@
+"""Access token revocation for logout-all.
+
+Access tokens are stateless JWTs, so revoking them means remembering, per user,
+the time before which issued tokens are no longer honored. The record is kept
+in-process for an O(1) check on every request (including token cache hits),
+published over Redis pub/sub so every worker applies it, and stored in Redis
+so workers that start later still see it on a cache miss.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    from .tokens import TokenPayload
+
+logger = structlog.get_logger()
+
+REVOCATION_CHANNEL = "auth:revocations"
+_REVOKED_KEY_PREFIX = "auth:revoked_before:"
+
+# user_id -> (revoked_before epoch seconds, record expiry epoch seconds)
+_revoked_before: dict[uuid.UUID, tuple[int, float]] = {}
+
+
+def _record_ttl_seconds() -> int:
+    """Revocation records only need to outlive the access tokens they cover."""
+    return get_settings().access_token_expire_minutes * 60
+
+
+def _apply_revocation(user_id: uuid.UUID, revoked_before: int) -> None:
+    """Record a revocation locally, keeping the latest cutoff per user."""
+    now = time.time()
+    current = _revoked_before.get(user_id)
+    if current is None or current[0] < revoked_before or current[1] <= now:
+        _revoked_before[user_id] = (revoked_before, now + _record_ttl_seconds())
+
+
+def is_revoked(payload: TokenPayload) -> bool:
+    """Check whether a token was issued before its user's revocation cutoff.
+
+    JWT ``iat`` has one-second resolution, so tokens issued within the same
+    second as the logout-all call are still honored; this avoids rejecting a
+    login performed immediately afterwards.
+
+    Args:
+        payload: The decoded token payload.
+
+    Returns:
+        True if the token has been revoked.
+    """
+    entry = _revoked_before.get(payload.sub)
+    if entry is None:
+        return False
+
+    revoked_before, record_expires_at = entry
+    if record_expires_at <= time.time():
+        _revoked_before.pop(payload.sub, None)
+        return False
+
+    return int(payload.iat.timestamp()) < revoked_before
+
+
+async def sync_revocation(payload: TokenPayload, redis_client: Any | None) -> None:
+    """Load a user's revocation cutoff from Redis into the local record.
+
+    Called only when a token is decoded (cache miss), so workers that missed a
+    pub/sub message still learn about revocations without a Redis round trip
+    on every request.
+
+    Args:
+        payload: The decoded token payload.
+        redis_client: Redis client, or None if unavailable.
+    """
+    if not redis_client:
+        return
+    try:
+        value = await redis_client.get(f"{_REVOKED_KEY_PREFIX}{payload.sub}")
+    except Exception:
+        logger.exception("revocation_get_error", user_id=str(payload.sub))
+        return
+    if value is not None:
+        _apply_revocation(payload.sub, int(value))
+
+
+async def revoke_user_tokens(user_id: uuid.UUID, redis_client: Any | None) -> None:
+    """Revoke every access token issued to a user before now.
+
+    Args:
+        user_id: The user whose tokens are revoked.
+        redis_client: Redis client, or None if unavailable.
+    """
+    revoked_before = int(time.time())
+    _apply_revocation(user_id, revoked_before)
+
+    if not redis_client:
+        return
+    try:
+        await redis_client.set(
+            f"{_REVOKED_KEY_PREFIX}{user_id}",
+            revoked_before,
+            ex=_record_ttl_seconds(),
+        )
+        await redis_client.publish(REVOCATION_CHANNEL, f"{user_id}:{revoked_before}")
+    except Exception:
+        logger.exception("revocation_publish_error", user_id=str(user_id))
+
+
+async def listen_for_revocations(redis_client: Any) -> None:
+    """Apply revocations published by other workers until cancelled.
+
+    Args:
+        redis_client: Redis client used for the pub/sub subscription.
+    """
+    pubsub = redis_client.pubsub()
+    try:
+        await pubsub.subscribe(REVOCATION_CHANNEL)
+        async for message in pubsub.listen():
+            if message.get("type") == "message":
+                _handle_revocation_message(message["data"])
+    except Exception:
+        # Local records and the Redis lookup on cache misses still apply
+        logger.exception("revocation_listener_error")
+    finally:
+        await pubsub.aclose()
+
+
+def _handle_revocation_message(data: bytes | str) -> None:
+    """Apply a ``<user_id>:<revoked_before>`` revocation message."""
+    raw = data.decode() if isinstance(data, bytes) else data
+    user_id, _, revoked_before = raw.partition(":")
+    try:
+        _apply_revocation(uuid.UUID(user_id), int(revoked_before))
+    except ValueError:
+        logger.warning("revocation_message_invalid", data=raw)
+
+
+def clear_revocations() -> None:
+    """Drop all local revocation records."""
+    _revoked_before.clear()
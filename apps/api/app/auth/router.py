@@ -2,12 +2,15 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.responses import model_response
 from app.database import get_session
+from app.dependencies import RedisClient
 
 from .dependencies import CurrentUser
+from .revocation import revoke_user_tokens
 from .schemas import (
     LoginRequest,
     MessageResponse,
@@ -21,26 +24,32 @@ from .service import AuthService
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
-def get_client_info(request: Request) -> tuple[str | None, str | None]:
+async def get_client_info(
+    request: Request,
+    user_agent: Annotated[str | None, Header()] = None,
+) -> tuple[str | None, str | None]:
     """Extract client IP and user agent from request.
 
     Args:
         request: The FastAPI request object.
+        user_agent: The User-Agent header value.
 
     Returns:
         Tuple of (ip_address, user_agent).
     """
     ip_address = request.client.host if request.client else None
-    user_agent = request.headers.get("user-agent")
     return ip_address, user_agent
 
 
+ClientInfo = Annotated[tuple[str | None, str | None], Depends(get_client_info)]
+
+
 @router.post("/register", response_model=TokenResponse, status_code=201)
 async def register(
     data: RegisterRequest,
-    request: Request,
+    client_info: ClientInfo,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> TokenResponse:
+) -> Response:
     """Register a new user account.
 
     Creates a new user with email and password, initializes empty profile,
@@ -49,7 +58,7 @@ async def register(
     """
     from app.users.consent_service import UserConsentService
 
-    ip_address, user_agent = get_client_info(request)
+    ip_address, user_agent = client_info
     service = AuthService(session)
 
     user, token_pair = await service.register(data, ip_address, user_agent)
@@ -64,59 +73,44 @@ async def register(
         user_agent=user_agent,
     )
 
-    return TokenResponse(
-        access_token=token_pair.access_token,
-        refresh_token=token_pair.refresh_token,
-        token_type=token_pair.token_type,
-        expires_in=token_pair.expires_in,
-    )
+    return model_response(token_pair, status_code=201)
 
 
 @router.post("/login", response_model=TokenResponse)
 async def login(
     data: LoginRequest,
-    request: Request,
+    client_info: ClientInfo,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> TokenResponse:
+) -> Response:
     """Authenticate and receive tokens.
 
     Validates email and password, returns JWT access and refresh tokens.
     """
-    ip_address, user_agent = get_client_info(request)
+    ip_address, user_agent = client_info
     service = AuthService(session)
 
     _, token_pair = await service.login(data, ip_address, user_agent)
 
-    return TokenResponse(
-        access_token=token_pair.access_token,
-        refresh_token=token_pair.refresh_token,
-        token_type=token_pair.token_type,
-        expires_in=token_pair.expires_in,
-    )
+    return model_response(token_pair)
 
 
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh(
     data: RefreshRequest,
-    request: Request,
+    client_info: ClientInfo,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> TokenResponse:
+) -> Response:
     """Refresh access token using refresh token.
 
     Performs token rotation: invalidates the old refresh token and
     issues a new token pair.
     """
-    ip_address, user_agent = get_client_info(request)
+    ip_address, user_agent = client_info
     service = AuthService(session)
 
     token_pair = await service.refresh_tokens(data.refresh_token, ip_address, user_agent)
 
-    return TokenResponse(
-        access_token=token_pair.access_token,
-        refresh_token=token_pair.refresh_token,
-        token_type=token_pair.token_type,
-        expires_in=token_pair.expires_in,
-    )
+    return model_response(token_pair)
 
 
 @router.post("/logout", response_model=MessageResponse)
@@ -138,14 +132,16 @@ async def logout(
 async def logout_all(
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis_client: RedisClient,
 ) -> MessageResponse:
     """Logout from all devices by invalidating all refresh tokens.
 
     Requires authentication. Revokes all active refresh tokens for
-    the current user.
+    the current user and rejects access tokens issued before this call.
     """
     service = AuthService(session)
     count = await service.logout_all(current_user.id)
+    await revoke_user_tokens(current_user.id, redis_client)
 
     return MessageResponse(message=f"Logged out from {count} sessions")
 
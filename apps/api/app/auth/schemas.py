@@ -1,10 +1,14 @@
 """Authentication request/response schemas."""
 
-import re
+import string
 from typing import Annotated
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_SPECIALS = frozenset("!@#$%^&*(),.?\":{}|<>-_=+[]\\;'/`~")
+
 
 def _validate_password_complexity(password: str) -> str:
     """Validate password meets complexity requirements.
@@ -24,13 +28,28 @@ def _validate_password_complexity(password: str) -> str:
     Raises:
         ValueError: If password doesn't meet complexity requirements.
     """
-    if not re.search(r"[A-Z]", password):
+    has_upper = has_lower = has_digit = has_special = False
+    for ch in password:
+        if ch in _UPPERCASE:
+            has_upper = True
+        elif ch in _LOWERCASE:
+            has_lower = True
+        elif ch.isdecimal():
+            has_digit = True
+        elif ch in _SPECIALS:
+            has_special = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit and has_special:
+            return password
+
+    if not has_upper:
         raise ValueError("Password must contain at least one uppercase letter")
-    if not re.search(r"[a-z]", password):
+    if not has_lower:
         raise ValueError("Password must contain at least one lowercase letter")
-    if not re.search(r"\d", password):
+    if not has_digit:
         raise ValueError("Password must contain at least one digit")
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>\-_=+\[\]\\;'/`~]", password):
+    if not has_special:
         raise ValueError("Password must contain at least one special character")
     return password
 
@@ -3,6 +3,8 @@
 import uuid
 from datetime import datetime
 
+from sqlalchemy import bindparam, insert, lambda_stmt, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -10,10 +12,20 @@ from app.exceptions import ConflictError, UnauthorizedError
 from app.users.models import DietPreferences, User, UserGoal, UserProfile
 
 from .models import RefreshToken
-from .password import hash_password, verify_password
+from .password import DUMMY_PASSWORD_HASH, ahash_password, averify_password
 from .schemas import LoginRequest, RegisterRequest
 from .tokens import TokenPair, create_token_pair, decode_token, hash_token
 
+# Hot-path lookups built once so SQLAlchemy reuses the cached statement and compiled SQL
+_user_by_email = lambda_stmt(lambda: select(User).where(User.email == bindparam("email")))
+_user_by_id = lambda_stmt(lambda: select(User).where(User.id == bindparam("user_id")))
+_active_user_by_id = lambda_stmt(
+    lambda: select(User).where(
+        User.id == bindparam("user_id"),
+        User.is_active == True,  # noqa: E712
+    )
+)
+
 
 class AuthService:
     """Authentication service for user management."""
@@ -45,25 +57,24 @@ class AuthService:
         Raises:
             ConflictError: If email already registered.
         """
-        # Check for existing user
-        existing = await self.session.execute(select(User).where(User.email == data.email.lower()))
-        if existing.scalar_one_or_none():
-            raise ConflictError("Email already registered")
-
-        # Create user
-        user = User(
-            email=data.email.lower(),
-            hashed_password=hash_password(data.password),
+        # Hash before touching the database so no connection is held while Argon2 runs
+        hashed_password = await ahash_password(data.password)
+
+        # Create user, letting the unique email constraint detect duplicates atomically
+        new_user = User(email=data.email.lower(), hashed_password=hashed_password)
+        result = await self.session.scalars(
+            pg_insert(User)
+            .values(**new_user.model_dump())
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User)
         )
-        self.session.add(user)
-        await self.session.flush()
-
-        # Create associated records
-        profile = UserProfile(user_id=user.id)
-        goal = UserGoal(user_id=user.id)
-        preferences = DietPreferences(user_id=user.id)
+        user = result.one_or_none()
+        if user is None:
+            raise ConflictError("Email already registered")
 
-        self.session.add_all([profile, goal, preferences])
+        # Create associated records as Core inserts; the ORM objects aren't needed here
+        for model in (UserProfile, UserGoal, DietPreferences):
+            await self.session.execute(insert(model).values(**model(user_id=user.id).model_dump()))
 
         # Create tokens
         token_pair, refresh_expires, refresh_hash = create_token_pair(user.id, user.email)
@@ -79,7 +90,6 @@ class AuthService:
         self.session.add(refresh_token)
 
         await self.session.commit()
-        await self.session.refresh(user)
 
         return user, token_pair
 
@@ -102,10 +112,15 @@ class AuthService:
         Raises:
             UnauthorizedError: If credentials are invalid.
         """
-        result = await self.session.execute(select(User).where(User.email == data.email.lower()))
+        result = await self.session.execute(_user_by_email, {"email": data.email.lower()})
         user = result.scalar_one_or_none()
 
-        if not user or not verify_password(data.password, user.hashed_password):
+        # End the read transaction so the connection returns to the pool while Argon2 runs
+        await self.session.commit()
+
+        # Always run one Argon2 verify so response time doesn't reveal whether the email exists
+        hashed_password = user.hashed_password if user else DUMMY_PASSWORD_HASH
+        if not await averify_password(data.password, hashed_password) or not user:
             raise UnauthorizedError("Invalid email or password")
 
         if not user.is_active:
@@ -151,29 +166,26 @@ class AuthService:
         if payload is None or payload.token_type != "refresh":
             raise UnauthorizedError("Invalid refresh token")
 
-        # Find token in database
+        # Revoke the stored token (token rotation) and fetch its owner in one statement
+        now = datetime.utcnow()
         token_hash = hash_token(refresh_token_str)
-        token_result = await self.session.execute(
-            select(RefreshToken).where(
-                RefreshToken.token_hash == token_hash,
-                RefreshToken.revoked_at == None,  # noqa: E711
+        revoke_result = await self.session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,  # type: ignore[arg-type]
+                RefreshToken.revoked_at == None,  # type: ignore[arg-type]  # noqa: E711
+                RefreshToken.expires_at > now,  # type: ignore[arg-type]
             )
+            .values(revoked_at=now)
+            .returning(RefreshToken.user_id)  # type: ignore[call-overload]
         )
-        stored_token = token_result.scalar_one_or_none()
+        user_id = revoke_result.scalar_one_or_none()
 
-        if not stored_token or not stored_token.is_valid:
+        if user_id is None:
             raise UnauthorizedError("Refresh token is invalid or expired")
 
-        # Revoke old token (token rotation)
-        stored_token.revoked_at = datetime.utcnow()
-
         # Get user
-        user_result = await self.session.execute(
-            select(User).where(
-                User.id == stored_token.user_id,
-                User.is_active == True,  # noqa: E712
-            )
-        )
+        user_result = await self.session.execute(_active_user_by_id, {"user_id": user_id})
         user = user_result.scalar_one_or_none()
 
         if not user:
@@ -201,14 +213,17 @@ class AuthService:
         Args:
             refresh_token_str: The refresh token to revoke.
         """
-        token_hash = hash_token(refresh_token_str)
+        # Revoke in one UPDATE; unknown or already revoked tokens match no rows
         result = await self.session.execute(
-            select(RefreshToken).where(RefreshToken.token_hash == token_hash)
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == hash_token(refresh_token_str),  # type: ignore[arg-type]
+                RefreshToken.revoked_at == None,  # type: ignore[arg-type]  # noqa: E711
+            )
+            .values(revoked_at=datetime.utcnow())
         )
-        stored_token = result.scalar_one_or_none()
 
-        if stored_token and stored_token.revoked_at is None:
-            stored_token.revoked_at = datetime.utcnow()
+        if result.rowcount:  # type: ignore[attr-defined]
             await self.session.commit()
 
     async def logout_all(self, user_id: uuid.UUID) -> int:
@@ -220,20 +235,17 @@ class AuthService:
         Returns:
             Number of tokens revoked.
         """
+        # One UPDATE instead of loading every token and flushing one UPDATE per row
         result = await self.session.execute(
-            select(RefreshToken).where(
-                RefreshToken.user_id == user_id,
-                RefreshToken.revoked_at == None,  # noqa: E711
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id == user_id,  # type: ignore[arg-type]
+                RefreshToken.revoked_at == None,  # type: ignore[arg-type]  # noqa: E711
             )
+            .values(revoked_at=datetime.utcnow())
         )
-        tokens = result.scalars().all()
-
-        now = datetime.utcnow()
-        for token in tokens:
-            token.revoked_at = now
-
         await self.session.commit()
-        return len(tokens)
+        return result.rowcount  # type: ignore[attr-defined,no-any-return]
 
     async def change_password(
         self,
@@ -251,16 +263,19 @@ class AuthService:
         Raises:
             UnauthorizedError: If current password is incorrect.
         """
-        result = await self.session.execute(select(User).where(User.id == user_id))
+        result = await self.session.execute(_user_by_id, {"user_id": user_id})
         user = result.scalar_one_or_none()
 
         if not user:
             raise UnauthorizedError("User not found")
 
-        if not verify_password(current_password, user.hashed_password):
+        # End the read transaction so the connection returns to the pool while Argon2 runs
+        await self.session.commit()
+
+        if not await averify_password(current_password, user.hashed_password):
             raise UnauthorizedError("Current password is incorrect")
 
-        user.hashed_password = hash_password(new_password)
+        user.hashed_password = await ahash_password(new_password)
         user.updated_at = datetime.utcnow()
 
         await self.session.commit()
@@ -1,20 +1,158 @@
 """JWT token service for access and refresh tokens."""
 
+import base64
 import hashlib
+import hmac
 import secrets
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
 
-from jose import JWTError, jwt
-from pydantic import BaseModel
+import jwt
+import orjson
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from app.config import get_settings
 
 
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT codec that encodes and parses claims with orjson.
+
+    Claims parsing dominates the cost of decoding a token; the header is small
+    and left to PyJWT.
+    """
+
+    def _encode_payload(
+        self,
+        payload: dict[str, Any],
+        headers: dict[str, Any] | None = None,  # noqa: ARG002
+        json_encoder: Any = None,  # noqa: ARG002
+    ) -> bytes:
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> dict[str, Any]:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT()
+
+# HS256 tokens are minted and verified directly: the header never changes, so it
+# is encoded once
+_HS256_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+
+@lru_cache(maxsize=1)
+def _hmac_template(key: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 state, built once per secret and copied per signature."""
+    return hmac.new(key.encode(), digestmod=hashlib.sha256)
+
+
+def _hs256_signature(key: str, signing_input: bytes) -> bytes:
+    """Compute an HS256 signature without re-keying HMAC on every call."""
+    mac = _hmac_template(key).copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+
+def _encode_token(payload: dict[str, Any]) -> str:
+    """Sign a JWT with the configured algorithm.
+
+    HS256 skips PyJWT's per-call header serialization and key preparation;
+    the output is byte-for-byte what PyJWT produces. Other algorithms go
+    through PyJWT.
+
+    Args:
+        payload: The claims, with ``exp`` and ``iat`` as integer timestamps.
+
+    Returns:
+        The encoded token.
+    """
+    settings = get_settings()
+    if settings.jwt_algorithm != "HS256":
+        return _jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+
+    signing_input = (
+        _HS256_HEADER_B64 + b"." + base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
+    )
+    signature = _hs256_signature(settings.jwt_secret_key, signing_input)
+    return (signing_input + b"." + base64.urlsafe_b64encode(signature).rstrip(b"=")).decode()
+
+
+def _naive_utc(timestamp: int) -> datetime:
+    """Convert epoch seconds to the naive UTC datetimes the app stores."""
+    return datetime.fromtimestamp(timestamp, UTC).replace(tzinfo=None)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Strictly decode an unpadded base64url segment."""
+    return base64.b64decode(segment + "=" * (-len(segment) % 4), altchars=b"-_", validate=True)
+
+
+def _decode_hs256(token: str, key: str) -> dict[str, Any]:
+    """Verify an HS256 token and return its claims.
+
+    Applies the same checks PyJWT does for our tokens: the header must name
+    HS256, the signature is compared in constant time, ``exp`` must be in the
+    future and ``iat``/``nbf`` must not be.
+
+    Args:
+        token: The encoded token.
+        key: The HMAC secret.
+
+    Returns:
+        The verified claims.
+
+    Raises:
+        jwt.InvalidTokenError: If the token is malformed, forged or expired.
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = orjson.loads(_b64url_decode(header_b64))
+        signature = _b64url_decode(signature_b64)
+    except ValueError as e:
+        raise jwt.DecodeError("Invalid token structure") from e
+
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    signing_input = f"{header_b64}.{payload_b64}".encode()
+    if not hmac.compare_digest(signature, _hs256_signature(key, signing_input)):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(_b64url_decode(payload_b64))
+    except ValueError as e:
+        raise jwt.DecodeError("Invalid payload string") from e
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+
+    now = time.time()
+    try:
+        if int(payload["exp"]) <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        if int(payload["iat"]) > now or int(payload.get("nbf", 0)) > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid")
+    except (KeyError, TypeError, ValueError, OverflowError) as e:
+        raise jwt.DecodeError("Invalid time claims") from e
+
+    return payload
+
+
 class TokenPayload(BaseModel):
     """Token payload structure."""
 
-    sub: str  # user_id
+    # Frozen so cached payloads can be shared safely across requests
+    model_config = ConfigDict(frozen=True)
+
+    sub: uuid.UUID  # user_id, parsed once at decode time
     email: str
     token_type: str  # "access" or "refresh"
     exp: datetime
@@ -32,72 +170,74 @@ class TokenPair(BaseModel):
 
 
 def create_access_token(
-    user_id: uuid.UUID,
+    user_id: uuid.UUID | str,
     email: str,
 ) -> tuple[str, datetime]:
     """Create a new access token.
 
     Args:
-        user_id: The user's unique identifier.
+        user_id: The user's unique identifier, or its string form.
         email: The user's email address.
 
     Returns:
         Tuple of (token_string, expiration_datetime).
     """
     settings = get_settings()
-    now = datetime.utcnow()
-    expires = now + timedelta(minutes=settings.access_token_expire_minutes)
+    # Integer epoch seconds are what the token carries, so no datetime conversion is needed
+    now = int(time.time())
+    expires_at = now + settings.access_token_expire_minutes * 60
 
     payload = {
         "sub": str(user_id),
         "email": email,
         "token_type": "access",
-        "exp": expires,
+        "exp": expires_at,
         "iat": now,
         "jti": secrets.token_urlsafe(16),
     }
 
-    token = jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
-    return token, expires
+    token = _encode_token(payload)
+    return token, _naive_utc(expires_at)
 
 
 def create_refresh_token(
-    user_id: uuid.UUID,
+    user_id: uuid.UUID | str,
     email: str,
-) -> tuple[str, datetime, str]:
+) -> tuple[str, datetime, bytes]:
     """Create a new refresh token.
 
     Args:
-        user_id: The user's unique identifier.
+        user_id: The user's unique identifier, or its string form.
         email: The user's email address.
 
     Returns:
         Tuple of (token_string, expiration_datetime, token_hash).
     """
     settings = get_settings()
-    now = datetime.utcnow()
-    expires = now + timedelta(days=settings.refresh_token_expire_days)
+    # Integer epoch seconds are what the token carries, so no datetime conversion is needed
+    now = int(time.time())
+    expires_at = now + settings.refresh_token_expire_days * 86400
     jti = secrets.token_urlsafe(32)
 
     payload = {
         "sub": str(user_id),
         "email": email,
         "token_type": "refresh",
-        "exp": expires,
+        "exp": expires_at,
         "iat": now,
         "jti": jti,
     }
 
-    token = jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    token = _encode_token(payload)
     token_hash = hash_token(token)
 
-    return token, expires, token_hash
+    return token, _naive_utc(expires_at), token_hash
 
 
 def create_token_pair(
     user_id: uuid.UUID,
     email: str,
-) -> tuple[TokenPair, datetime, str]:
+) -> tuple[TokenPair, datetime, bytes]:
     """Create both access and refresh tokens.
 
     Args:
@@ -107,8 +247,10 @@ def create_token_pair(
     Returns:
         Tuple of (TokenPair, refresh_expires, refresh_hash).
     """
-    access_token, access_expires = create_access_token(user_id, email)
-    refresh_token, refresh_expires, refresh_hash = create_refresh_token(user_id, email)
+    # Format the UUID once for both tokens' sub claim
+    sub = str(user_id)
+    access_token, access_expires = create_access_token(sub, email)
+    refresh_token, refresh_expires, refresh_hash = create_refresh_token(sub, email)
 
     expires_in = int((access_expires - datetime.utcnow()).total_seconds())
 
@@ -132,11 +274,16 @@ def decode_token(token: str) -> TokenPayload | None:
     """
     settings = get_settings()
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        if settings.jwt_algorithm == "HS256":
+            payload = _decode_hs256(token, settings.jwt_secret_key)
+        else:
+            payload = _jwt.decode(
+                token,
+                settings.jwt_secret_key,
+                algorithms=[settings.jwt_algorithm],
+            )
+        # Validated rather than model_construct()ed: this is what parses sub into a
+        # UUID and rejects signed tokens with malformed claims
         return TokenPayload(
             sub=payload["sub"],
             email=payload["email"],
@@ -145,17 +292,17 @@ def decode_token(token: str) -> TokenPayload | None:
             iat=datetime.fromtimestamp(payload["iat"]),
             jti=payload["jti"],
         )
-    except JWTError:
+    except (jwt.PyJWTError, KeyError, ValidationError):
         return None
 
 
-def hash_token(token: str) -> str:
-    """Create a SHA-256 hash of a token for storage.
+def hash_token(token: str) -> bytes:
+    """Create a BLAKE2b-128 digest of a token for storage.
 
     Args:
         token: The token string to hash.
 
     Returns:
-        The hexadecimal hash string.
+        The 16-byte digest.
     """
-    return hashlib.sha256(token.encode()).hexdigest()
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
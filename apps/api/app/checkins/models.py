@@ -17,6 +17,14 @@ class CheckIn(SQLModel, table=True):
     __table_args__ = (
         Index("ix_check_in_user_id", "user_id"),
         Index("ix_check_in_user_date", "user_id", "date", unique=True),
+        # Covers the weight trend query with an index-only scan
+        Index(
+            "ix_check_in_user_date_weight",
+            "user_id",
+            "date",
+            postgresql_include=["weight_kg"],
+            postgresql_where=text("weight_kg IS NOT NULL"),
+        ),
     )
 
     id: uuid.UUID = Field(
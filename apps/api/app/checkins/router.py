@@ -1,16 +1,20 @@
 """Check-in API endpoints."""
 
 from datetime import date
-from typing import Annotated, cast
+from typing import TYPE_CHECKING, Annotated, cast
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import CurrentUser
+from app.coach_ai.context_builder import invalidate_cached_context
+from app.core.responses import model_response
 from app.database import get_session
+from app.dependencies import RedisClient
 
 from .schemas import (
     CheckInCreate,
+    CheckInDashboardResponse,
     CheckInListResponse,
     CheckInResponse,
     CheckInSyncRequest,
@@ -20,6 +24,9 @@ from .schemas import (
 )
 from .service import CheckInService
 
+if TYPE_CHECKING:
+    from .models import CheckIn
+
 router = APIRouter(prefix="/checkins", tags=["Check-ins"])
 
 
@@ -28,6 +35,7 @@ async def create_checkin(
     data: CheckInCreate,
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis_client: RedisClient,
 ) -> CheckInResponse:
     """Create or update a check-in.
 
@@ -35,7 +43,8 @@ async def create_checkin(
     """
     service = CheckInService(session)
     checkin = await service.create_or_update(current_user.id, data)
-    return CheckInResponse.model_validate(checkin, from_attributes=True)
+    await invalidate_cached_context(current_user.id, redis_client)
+    return CheckInResponse.from_row(checkin)
 
 
 @router.get("", response_model=CheckInListResponse)
@@ -46,10 +55,13 @@ async def list_checkins(
     to_date: Annotated[date | None, Query(alias="to")] = None,
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-) -> CheckInListResponse:
+    before: Annotated[date | None, Query()] = None,
+) -> Response:
     """List check-ins within date range.
 
-    Defaults to the last 30 days if no dates specified.
+    Defaults to the last 30 days if no dates specified. Pass the previous
+    page's ``next_before`` as ``before`` to page with a keyset cursor, which
+    stays fast on deep pages; ``offset`` is kept for existing clients.
     """
     service = CheckInService(session)
     items, total = await service.get_by_date_range(
@@ -58,12 +70,19 @@ async def list_checkins(
         to_date=to_date,
         limit=limit,
         offset=offset,
+        before=before,
     )
-    return CheckInListResponse(
-        items=[CheckInResponse.model_validate(c, from_attributes=True) for c in items],
-        total=total,
-        limit=limit,
-        offset=offset,
+    if before:
+        offset = 0
+    has_more = total > offset + len(items)
+    return model_response(
+        CheckInListResponse(
+            items=[CheckInResponse.from_row(c) for c in items],
+            total=total,
+            limit=limit,
+            offset=offset,
+            next_before=items[-1].date if items and has_more else None,
+        )
     )
 
 
@@ -76,7 +95,7 @@ async def get_latest_checkin(
     service = CheckInService(session)
     checkin = await service.get_latest(current_user.id)
     if checkin:
-        return CheckInResponse.model_validate(checkin, from_attributes=True)
+        return CheckInResponse.from_row(checkin)
     return None
 
 
@@ -85,10 +104,33 @@ async def get_weight_trends(
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
     days: int = Query(30, ge=7, le=365),
-) -> WeightTrendResponse:
+) -> Response:
     """Get weight trend analysis with 7-day moving average."""
     service = CheckInService(session)
-    return await service.calculate_weight_trend(current_user.id, days)
+    return model_response(await service.calculate_weight_trend(current_user.id, days))
+
+
+@router.get("/dashboard", response_model=CheckInDashboardResponse)
+async def get_checkin_dashboard(
+    current_user: CurrentUser,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    days: int = Query(30, ge=7, le=365),
+) -> Response:
+    """Get the latest check-in and the weight trend in one request.
+
+    Saves the dashboard a second request, and with it a second token check
+    and user lookup. The two queries share the request's session, so they
+    run one after the other.
+    """
+    service = CheckInService(session)
+    latest = await service.get_latest(current_user.id)
+    trend = await service.calculate_weight_trend(current_user.id, days)
+    return model_response(
+        CheckInDashboardResponse(
+            latest=CheckInResponse.from_row(latest) if latest else None,
+            trend=trend,
+        )
+    )
 
 
 @router.post("/sync", response_model=CheckInSyncResponse)
@@ -96,26 +138,30 @@ async def sync_checkins(
     data: CheckInSyncRequest,
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
-) -> CheckInSyncResponse:
+    redis_client: RedisClient,
+) -> Response:
     """Sync batch of check-ins for offline support.
 
     Uses last-write-wins conflict resolution with server timestamp comparison.
     """
     service = CheckInService(session)
     results = await service.sync_checkins(current_user.id, data.checkins)
+    await invalidate_cached_context(current_user.id, redis_client)
 
     sync_results = [
         CheckInSyncResult(
             date=cast("date", r["date"]),
             status=cast("str", r["status"]),
-            server_version=CheckInResponse.model_validate(r["server_version"], from_attributes=True)
+            server_version=CheckInResponse.from_row(cast("CheckIn", r["server_version"]))
             if r["server_version"]
             else None,
         )
         for r in results
     ]
 
-    return CheckInSyncResponse(
-        results=sync_results,
-        conflicts=sum(1 for r in sync_results if r.status == "conflict"),
+    return model_response(
+        CheckInSyncResponse(
+            results=sync_results,
+            conflicts=sum(1 for r in sync_results if r.status == "conflict"),
+        )
     )
@@ -2,11 +2,15 @@
 
 import uuid
 from datetime import date, datetime
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field, field_validator
 
 from app.core.datetime_utils import normalize_to_naive_utc
 
+if TYPE_CHECKING:
+    from .models import CheckIn
+
 
 class CheckInCreate(BaseModel):
     """Create or update check-in request."""
@@ -65,6 +69,35 @@ class CheckInResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_row(cls, checkin: "CheckIn") -> "CheckInResponse":
+        """Build a response from a check-in row without re-validating it.
+
+        Database rows already satisfy the schema, so fields are copied directly;
+        only the Numeric columns need converting from Decimal.
+
+        Args:
+            checkin: The check-in row.
+
+        Returns:
+            The check-in response.
+        """
+        return cls.model_construct(
+            id=checkin.id,
+            date=checkin.date,
+            weight_kg=None if checkin.weight_kg is None else float(checkin.weight_kg),
+            notes=checkin.notes,
+            energy_level=checkin.energy_level,
+            sleep_quality=checkin.sleep_quality,
+            mood=checkin.mood,
+            adherence_score=(
+                None if checkin.adherence_score is None else float(checkin.adherence_score)
+            ),
+            client_updated_at=checkin.client_updated_at,
+            created_at=checkin.created_at,
+            updated_at=checkin.updated_at,
+        )
+
 
 class CheckInListResponse(BaseModel):
     """List of check-ins response."""
@@ -73,6 +106,7 @@ class CheckInListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_before: date | None = None  # keyset cursor for the next page, if any
 
 
 class WeightTrendData(BaseModel):
@@ -93,6 +127,13 @@ class WeightTrendResponse(BaseModel):
     current_weight: float | None
 
 
+class CheckInDashboardResponse(BaseModel):
+    """Latest check-in and weight trend, as shown together on the dashboard."""
+
+    latest: CheckInResponse | None
+    trend: WeightTrendResponse
+
+
 class CheckInSyncResult(BaseModel):
     """Single check-in sync result."""
 
@@ -1,15 +1,41 @@
 """Check-in business logic service."""
 
 import uuid
+from collections.abc import Sequence
 from datetime import date, datetime, timedelta
+from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import Float, Row, bindparam, cast, func, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from .models import CheckIn
 from .schemas import CheckInCreate, CheckInSyncItem, WeightTrendData, WeightTrendResponse
 
+_CHECKIN_COLUMNS = tuple(CheckIn.__table__.columns.keys())  # type: ignore[attr-defined]
+# Columns a sync upsert may overwrite; identity and creation time are kept
+_SYNC_UPSERT_COLUMNS = tuple(
+    column for column in _CHECKIN_COLUMNS if column not in ("id", "user_id", "date", "created_at")
+)
+
+# Built once so SQLAlchemy reuses the cached statement and compiled SQL on every
+# coach context load
+_wellness_since = lambda_stmt(
+    lambda: (
+        select(  # type: ignore[call-overload]
+            CheckIn.date,
+            cast(CheckIn.weight_kg, Float).label("weight_kg"),
+            CheckIn.energy_level,
+            CheckIn.sleep_quality,
+            CheckIn.mood,
+            cast(CheckIn.adherence_score, Float).label("adherence_score"),
+        )
+        .where(CheckIn.user_id == bindparam("user_id"), CheckIn.date >= bindparam("from_date"))
+        .order_by(CheckIn.date.desc())  # type: ignore[attr-defined]
+    )
+)
+
 
 class CheckInService:
     """Check-in service."""
@@ -36,28 +62,25 @@ class CheckInService:
         Returns:
             The created or updated check-in.
         """
-        result = await self.session.execute(
-            select(CheckIn).where(
-                CheckIn.user_id == user_id,
-                CheckIn.date == data.date,
-            )
+        # Single INSERT ... ON CONFLICT DO UPDATE instead of read-modify-write;
+        # an update only overwrites the fields the client sent. updated_at is bound as
+        # naive UTC, like the model default: the database clock would be in its session
+        # time zone and skew sync conflict checks
+        stmt = pg_insert(CheckIn).values(
+            **CheckIn(user_id=user_id, **data.model_dump()).model_dump()
         )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            update_data = data.model_dump(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(existing, field, value)
-            existing.updated_at = datetime.utcnow()
-            await self.session.commit()
-            await self.session.refresh(existing)
-            return existing
-        else:
-            checkin = CheckIn(user_id=user_id, **data.model_dump())
-            self.session.add(checkin)
-            await self.session.commit()
-            await self.session.refresh(checkin)
-            return checkin
+        update_fields = data.model_dump(exclude_unset=True).keys() - {"date"}
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "date"],
+            set_={field: stmt.excluded[field] for field in update_fields}
+            | {"updated_at": datetime.utcnow()},
+        )
+        result = await self.session.scalars(
+            stmt.returning(CheckIn).execution_options(populate_existing=True)
+        )
+        checkin = result.one()
+        await self.session.commit()
+        return checkin
 
     async def get_by_date_range(
         self,
@@ -66,6 +89,7 @@ class CheckInService:
         to_date: date | None = None,
         limit: int = 100,
         offset: int = 0,
+        before: date | None = None,
     ) -> tuple[list[CheckIn], int]:
         """Get check-ins within date range.
 
@@ -74,44 +98,74 @@ class CheckInService:
             from_date: Start date filter (defaults to 30 days ago).
             to_date: End date filter (defaults to today).
             limit: Maximum number of results.
-            offset: Number of results to skip.
+            offset: Number of results to skip; ignored when ``before`` is given.
+            before: Keyset cursor; only check-ins dated before it are returned.
 
         Returns:
-            Tuple of (list of check-ins, total count).
+            Tuple of (list of check-ins, total count). With ``before``, the total
+            counts the check-ins in range that are older than the cursor.
         """
         if from_date is None:
             from_date = date.today() - timedelta(days=30)
         if to_date is None:
             to_date = date.today()
-
-        count_query = (
-            select(func.count())
-            .select_from(CheckIn)
-            .where(
-                CheckIn.user_id == user_id,
-                CheckIn.date >= from_date,
-                CheckIn.date <= to_date,
-            )
+        if before is not None:
+            # Keyset page: an index seek past the cursor instead of skipping rows.
+            # Dates are unique per user, so "date < before" is an inclusive bound.
+            to_date = min(to_date, before - timedelta(days=1))
+            offset = 0
+
+        filters = (
+            CheckIn.user_id == user_id,
+            CheckIn.date >= from_date,
+            CheckIn.date <= to_date,
         )
-        total_result = await self.session.execute(count_query)
-        total_count = total_result.scalar() or 0
 
+        # The total rides along on every row as a window count, saving a second query
         query = (
-            select(CheckIn)
-            .where(
-                CheckIn.user_id == user_id,
-                CheckIn.date >= from_date,
-                CheckIn.date <= to_date,
-            )
+            select(CheckIn, func.count().over().label("total"))
+            .where(*filters)
             .order_by(CheckIn.date.desc())  # type: ignore[attr-defined]
             .limit(limit)
             .offset(offset)
         )
         result = await self.session.execute(query)
-        items = list(result.scalars().all())
+        rows = result.all()
+        items = [row[0] for row in rows]
+
+        if rows:
+            total_count = rows[0].total
+        elif offset:
+            # Paged past the end: no rows to carry the window count
+            count_result = await self.session.execute(
+                select(func.count()).select_from(CheckIn).where(*filters)
+            )
+            total_count = count_result.scalar() or 0
+        else:
+            total_count = 0
 
         return items, total_count
 
+    async def get_since(self, user_id: uuid.UUID, from_date: date) -> Sequence[Row[Any]]:
+        """Get the wellness fields of every check-in on or after a date, newest first.
+
+        Returns plain rows rather than CheckIn instances, with the Numeric
+        columns cast to floats by the database, so no ORM objects or Decimals
+        are built for read-only summaries.
+
+        Args:
+            user_id: The user's unique identifier.
+            from_date: Earliest date to include.
+
+        Returns:
+            Rows of date, weight_kg, energy_level, sleep_quality, mood and
+            adherence_score.
+        """
+        result = await self.session.execute(
+            _wellness_since, {"user_id": user_id, "from_date": from_date}
+        )
+        return result.all()
+
     async def get_latest(self, user_id: uuid.UUID) -> CheckIn | None:
         """Get most recent check-in.
 
@@ -145,8 +199,19 @@ class CheckInService:
         """
         from_date = date.today() - timedelta(days=days)
 
+        # The database computes the moving average with a window function, so only
+        # (date, weight, average, window size) rows come back instead of full check-ins
+        window = {
+            "order_by": CheckIn.date.asc(),  # type: ignore[attr-defined]
+            "rows": (-6, 0),
+        }
         result = await self.session.execute(
-            select(CheckIn)
+            select(  # type: ignore[call-overload]
+                CheckIn.date,
+                CheckIn.weight_kg,
+                func.avg(CheckIn.weight_kg).over(**window).label("ma_7d"),
+                func.count().over(**window).label("window_size"),
+            )
             .where(
                 CheckIn.user_id == user_id,
                 CheckIn.date >= from_date,
@@ -154,9 +219,9 @@ class CheckInService:
             )
             .order_by(CheckIn.date.asc())  # type: ignore[attr-defined]
         )
-        checkins = list(result.scalars().all())
+        rows = result.all()
 
-        if not checkins:
+        if not rows:
             return WeightTrendResponse(
                 data=[],
                 weekly_rate_of_change=None,
@@ -165,25 +230,19 @@ class CheckInService:
                 current_weight=None,
             )
 
-        weights = [float(c.weight_kg) for c in checkins]  # type: ignore[arg-type]
-        data: list[WeightTrendData] = []
-
-        for i, checkin in enumerate(checkins):
-            window_start = max(0, i - 6)
-            window = weights[window_start : i + 1]
-            ma_7d = sum(window) / len(window) if len(window) >= 3 else None
-
-            data.append(
-                WeightTrendData(
-                    date=checkin.date,
-                    weight_kg=float(checkin.weight_kg),  # type: ignore[arg-type]
-                    moving_average_7d=round(ma_7d, 2) if ma_7d else None,
-                )
+        data = [
+            WeightTrendData(
+                date=row.date,
+                weight_kg=float(row.weight_kg),
+                moving_average_7d=round(float(row.ma_7d), 2) if row.window_size >= 3 else None,
             )
+            for row in rows
+        ]
+        weights = [point.weight_kg for point in data]
 
         first_weight = weights[0]
         last_weight = weights[-1]
-        days_elapsed = (checkins[-1].date - checkins[0].date).days
+        days_elapsed = (data[-1].date - data[0].date).days
 
         weekly_rate = None
         if days_elapsed > 0:
@@ -213,64 +272,52 @@ class CheckInService:
         Returns:
             List of sync results with status for each item.
         """
-        results: list[dict[str, object]] = []
+        # Fetch every existing row for the batch in one round trip
+        existing_result = await self.session.execute(
+            select(CheckIn).where(
+                CheckIn.user_id == user_id,
+                CheckIn.date.in_({item.date for item in items}),  # type: ignore[attr-defined]
+            )
+        )
+        server_versions: dict[date, CheckIn] = {c.date: c for c in existing_result.scalars().all()}
+
+        statuses: list[tuple[date, str]] = []
+        to_upsert: dict[date, dict[str, Any]] = {}
 
         for item in items:
-            db_result = await self.session.execute(
-                select(CheckIn).where(
-                    CheckIn.user_id == user_id,
-                    CheckIn.date == item.date,
-                )
-            )
-            existing = db_result.scalar_one_or_none()
-
-            if existing:
-                if existing.updated_at > item.client_updated_at:
-                    results.append(
-                        {
-                            "date": item.date,
-                            "status": "conflict",
-                            "server_version": existing,
-                        }
-                    )
-                elif existing.updated_at == item.client_updated_at:
-                    results.append(
-                        {
-                            "date": item.date,
-                            "status": "unchanged",
-                            "server_version": existing,
-                        }
-                    )
-                else:
-                    update_data = item.model_dump(exclude_unset=True)
-                    for field, value in update_data.items():
-                        setattr(existing, field, value)
-                    existing.updated_at = datetime.utcnow()
-                    results.append(
-                        {
-                            "date": item.date,
-                            "status": "updated",
-                            "server_version": existing,
-                        }
-                    )
+            existing = server_versions.get(item.date)
+
+            if existing is None:
+                statuses.append((item.date, "created"))
+                to_upsert[item.date] = CheckIn(user_id=user_id, **item.model_dump()).model_dump()
+            elif existing.updated_at > item.client_updated_at:
+                statuses.append((item.date, "conflict"))
+            elif existing.updated_at == item.client_updated_at:
+                statuses.append((item.date, "unchanged"))
             else:
-                checkin = CheckIn(
-                    user_id=user_id,
-                    **item.model_dump(),
-                )
-                self.session.add(checkin)
-                results.append(
-                    {
-                        "date": item.date,
-                        "status": "created",
-                        "server_version": checkin,
-                    }
-                )
+                statuses.append((item.date, "updated"))
+                row = {column: getattr(existing, column) for column in _CHECKIN_COLUMNS}
+                row.update(item.model_dump(exclude_unset=True))
+                to_upsert[item.date] = row
+
+        # Write all creates and updates in a single upsert, reading rows back via RETURNING;
+        # updated rows get a naive UTC updated_at, the same clock new rows default to
+        if to_upsert:
+            stmt = pg_insert(CheckIn).values(list(to_upsert.values()))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "date"],
+                set_={column: stmt.excluded[column] for column in _SYNC_UPSERT_COLUMNS}
+                | {"updated_at": datetime.utcnow()},
+            )
+            upserted = await self.session.scalars(
+                stmt.returning(CheckIn).execution_options(populate_existing=True)
+            )
+            for checkin in upserted:
+                server_versions[checkin.date] = checkin
 
         await self.session.commit()
 
-        for sync_result in results:
-            if sync_result["server_version"]:
-                await self.session.refresh(sync_result["server_version"])
-
-        return results
+        return [
+            {"date": item_date, "status": status, "server_version": server_versions.get(item_date)}
+            for item_date, status in statuses
+        ]
@@ -2,16 +2,89 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+import json
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+import structlog
+
 from app.coach_ai.policies.base import UserContext
 
 if TYPE_CHECKING:
-    import uuid
+    from collections.abc import AsyncIterator, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = structlog.get_logger()
+
+# Cached contexts are keyed by a per-user version that every write to the
+# underlying data bumps, so invalidation never has to find old keys
+CONTEXT_CACHE_TTL_SECONDS = 600
+_CONTEXT_CACHE_PREFIX = "coach_context:"
+_CONTEXT_VERSION_PREFIX = "coach_context_version:"
+
 
-    from sqlalchemy.ext.asyncio import AsyncSession
+async def invalidate_cached_context(user_id: uuid.UUID, redis_client: Any | None) -> None:
+    """Invalidate a user's cached coach contexts after their data changes.
+
+    The version is a timestamp rather than a counter, so it never repeats
+    once its key expires; the key outlives every entry cached under it.
+
+    Args:
+        user_id: The user whose data changed.
+        redis_client: Redis client, or None if unavailable.
+    """
+    if not redis_client:
+        return
+    try:
+        await redis_client.set(
+            f"{_CONTEXT_VERSION_PREFIX}{user_id}",
+            time.time_ns(),
+            ex=CONTEXT_CACHE_TTL_SECONDS,
+        )
+    except Exception:
+        logger.exception("context_cache_invalidate_error", user_id=str(user_id))
+
+
+@lru_cache(maxsize=4096)
+def _calculate_targets(
+    weight_kg: float,
+    height_cm: float,
+    age: int,
+    sex: str,
+    activity_level: str,
+    goal_type: str,
+    pace: str,
+) -> tuple[int, int, int, int, int, int, int]:
+    """Calculate rounded BMR, TDEE and macro targets for one set of inputs.
+
+    The calculators are pure and these inputs rarely change, so results are
+    memoized; a tuple is returned so cached values can't be mutated.
+
+    Returns:
+        Tuple of (bmr, tdee, target_calories, protein_g, carbs_g, fat_g,
+        deficit_surplus).
+    """
+    from app.nutrition.calculator import calculate_bmr, calculate_macro_targets, calculate_tdee
+
+    bmr = calculate_bmr(weight_kg, height_cm, age, sex)
+    tdee = calculate_tdee(bmr, activity_level)
+    targets = calculate_macro_targets(tdee, weight_kg, goal_type, pace, sex)
+    return (
+        round(targets.bmr),
+        round(targets.tdee),
+        round(targets.target_calories),
+        round(targets.protein_g),
+        round(targets.carbs_g),
+        round(targets.fat_g),
+        round(targets.deficit_surplus),
+    )
 
 
 @dataclass
@@ -170,13 +243,118 @@ class CoachContext:
 class ContextBuilder:
     """Builds context for coach interactions."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        redis_client: Any | None = None,
+    ) -> None:
         """Initialize the context builder.
 
         Args:
             session: Database session.
+            session_factory: Optional factory for per-loader sessions. When given,
+                the database loaders run concurrently, each on its own session,
+                since a single AsyncSession cannot run statements concurrently.
+            redis_client: Optional Redis client for caching built contexts.
         """
         self.session = session
+        self.session_factory = session_factory
+        self._redis = redis_client
+
+    @asynccontextmanager
+    async def _loader_session(self) -> AsyncIterator[AsyncSession]:
+        """Yield the session a loader should query with."""
+        if self.session_factory is None:
+            yield self.session
+            return
+        async with self.session_factory() as session:
+            yield session
+
+    async def build_context_cached(
+        self,
+        user_id: uuid.UUID,
+        include_nutrition: bool = True,
+        include_weight_trend: bool = True,
+        include_adherence: bool = True,
+        include_targets: bool = True,
+        days: int = 14,
+    ) -> CoachContext:
+        """Build context for a user, reusing a cached copy when one is current.
+
+        Takes the same arguments as ``build_context``. Without Redis every call
+        builds the context.
+
+        Returns:
+            CoachContext with all requested data.
+        """
+        cache_key = await self._context_cache_key(
+            user_id,
+            days,
+            (include_nutrition, include_weight_trend, include_adherence, include_targets),
+        )
+        if cache_key is not None:
+            cached = await self._get_cached_context(cache_key)
+            if cached is not None:
+                return cached
+
+        context = await self.build_context(
+            user_id,
+            include_nutrition=include_nutrition,
+            include_weight_trend=include_weight_trend,
+            include_adherence=include_adherence,
+            include_targets=include_targets,
+            days=days,
+        )
+        if cache_key is not None:
+            await self._set_cached_context(cache_key, context)
+        return context
+
+    async def _context_cache_key(
+        self, user_id: uuid.UUID, days: int, flags: tuple[bool, ...]
+    ) -> str | None:
+        """Build the cache key for a context, or None if Redis is unavailable.
+
+        The date is part of the key because the look-back window moves daily.
+        """
+        if not self._redis:
+            return None
+        try:
+            version = await self._redis.get(f"{_CONTEXT_VERSION_PREFIX}{user_id}")
+        except Exception:
+            logger.exception("context_cache_get_error", user_id=str(user_id))
+            return None
+        flag_bits = "".join("1" if flag else "0" for flag in flags)
+        return (
+            f"{_CONTEXT_CACHE_PREFIX}{user_id}:{int(version or 0)}:"
+            f"{date.today().isoformat()}:{days}:{flag_bits}"
+        )
+
+    async def _get_cached_context(self, key: str) -> CoachContext | None:
+        """Get a cached context."""
+        if not self._redis:
+            return None
+        try:
+            data = await self._redis.get(key)
+        except Exception:
+            logger.exception("context_cache_get_error", key=key)
+            return None
+        if not data:
+            return None
+        fields = json.loads(data)
+        fields["user_id"] = uuid.UUID(fields["user_id"])
+        return CoachContext(**fields)
+
+    async def _set_cached_context(self, key: str, context: CoachContext) -> None:
+        """Cache a built context."""
+        if not self._redis:
+            return
+        try:
+            await self._redis.setex(
+                key, CONTEXT_CACHE_TTL_SECONDS, json.dumps(asdict(context), default=str)
+            )
+        except Exception:
+            logger.exception("context_cache_set_error", key=key)
 
     async def build_context(
         self,
@@ -202,19 +380,21 @@ class ContextBuilder:
         """
         context = CoachContext(user_id=user_id)
 
-        # Get user profile and related data
-        await self._load_user_data(context)
-
-        # Get recent check-ins
-        await self._load_checkins(context, days)
+        # Profile, check-ins (with the weight trend) and nutrition are independent queries
+        loaders = [
+            self._load_user_data(context),
+            self._load_checkins(context, days, include_weight_trend=include_weight_trend),
+        ]
+        if include_nutrition:
+            loaders.append(self._load_nutrition(context, days))
 
-        # Get weight trend if requested
-        if include_weight_trend:
-            await self._load_weight_trend(context, days)
+        if self.session_factory is None:
+            for loader in loaders:
+                await loader
+        else:
+            await asyncio.gather(*loaders)
 
-        # Get nutrition data if requested
-        if include_nutrition:
-            await self._load_nutrition(context, days)
+        # Adherence and targets are derived from the loaded data
 
         # Get adherence metrics if requested
         if include_adherence:
@@ -230,8 +410,9 @@ class ContextBuilder:
         """Load user profile, goal, and preferences."""
         from app.users.service import UserService
 
-        service = UserService(self.session)
-        user = await service.get_user_with_relations(context.user_id)
+        async with self._loader_session() as session:
+            service = UserService(session)
+            user = await service.get_user_with_relations(context.user_id)
 
         if not user:
             return
@@ -268,72 +449,90 @@ class ContextBuilder:
                 "meals_per_day": user.diet_preferences.meals_per_day,
             }
 
-    async def _load_checkins(self, context: CoachContext, days: int) -> None:
-        """Load recent check-ins."""
+    async def _load_checkins(
+        self,
+        context: CoachContext,
+        days: int,
+        include_weight_trend: bool = True,
+    ) -> None:
+        """Load recent check-ins and, from the same rows, the weight trend."""
         from app.checkins.service import CheckInService
 
-        service = CheckInService(self.session)
-        from_date = date.today() - timedelta(days=days)
-        to_date = date.today()
-
-        checkins, _ = await service.get_by_date_range(
-            user_id=context.user_id,
-            from_date=from_date,
-            to_date=to_date,
-            limit=days,
-            offset=0,
-        )
+        today = date.today()
+        async with self._loader_session() as session:
+            service = CheckInService(session)
+            checkins = await service.get_since(context.user_id, today - timedelta(days=days))
 
+        # Numeric columns arrive as floats, cast in the query
         context.recent_checkins = [
             {
                 "date": str(c.date),
-                "weight_kg": float(c.weight_kg) if c.weight_kg else None,
+                "weight_kg": c.weight_kg or None,
                 "energy_level": c.energy_level,
                 "sleep_quality": c.sleep_quality,
                 "mood": c.mood,
-                "adherence_score": float(c.adherence_score) if c.adherence_score else None,
+                "adherence_score": c.adherence_score or None,
             }
             for c in checkins
-        ]
+            if c.date <= today
+        ][:days]
 
-    async def _load_weight_trend(self, context: CoachContext, days: int) -> None:
-        """Load weight trend analysis."""
-        from app.checkins.service import CheckInService
+        if include_weight_trend:
+            context.weight_trend = self._weight_trend_from_checkins(checkins)
 
-        service = CheckInService(self.session)
-        try:
-            trend = await service.calculate_weight_trend(context.user_id, days)
-            context.weight_trend = {
-                "weekly_rate_of_change_kg": trend.weekly_rate_of_change,
-                "total_change_kg": trend.total_change,
-                "start_weight_kg": trend.start_weight,
-                "current_weight_kg": trend.current_weight,
-                "data_points": len(trend.data),
+    @staticmethod
+    def _weight_trend_from_checkins(checkins: Sequence[Any]) -> dict[str, Any]:
+        """Summarize the weight trend of check-ins ordered newest first.
+
+        Gives the same figures as ``CheckInService.calculate_weight_trend``
+        over the same rows, without querying them again.
+        """
+        weighed = [c for c in checkins if c.weight_kg is not None]
+        if not weighed:
+            return {
+                "weekly_rate_of_change_kg": None,
+                "total_change_kg": None,
+                "start_weight_kg": None,
+                "current_weight_kg": None,
+                "data_points": 0,
             }
-        except Exception:
-            context.weight_trend = None
+
+        first, last = weighed[-1], weighed[0]
+        first_weight, last_weight = first.weight_kg, last.weight_kg
+        days_elapsed = (last.date - first.date).days
+        return {
+            "weekly_rate_of_change_kg": round((last_weight - first_weight) / days_elapsed * 7, 3)
+            if days_elapsed > 0
+            else None,
+            "total_change_kg": round(last_weight - first_weight, 2),
+            "start_weight_kg": first_weight,
+            "current_weight_kg": last_weight,
+            "data_points": len(weighed),
+        }
 
     async def _load_nutrition(self, context: CoachContext, days: int) -> None:
         """Load recent nutrition data."""
         from app.nutrition.service import NutritionService
 
-        service = NutritionService(self.session)
-        from_date = date.today() - timedelta(days=days)
-        to_date = date.today()
+        async with self._loader_session() as session:
+            service = NutritionService(session)
+            from_date = date.today() - timedelta(days=days)
+            to_date = date.today()
 
-        nutrition_days = await service.get_by_date_range(
-            user_id=context.user_id,
-            from_date=from_date,
-            to_date=to_date,
-        )
+            nutrition_days = await service.get_macros_by_date_range(
+                user_id=context.user_id,
+                from_date=from_date,
+                to_date=to_date,
+            )
 
+        # Numeric columns arrive as floats, cast in the query
         context.recent_nutrition = [
             {
                 "date": str(n.date),
                 "calories": n.calories,
-                "protein_g": float(n.protein_g) if n.protein_g else None,
-                "carbs_g": float(n.carbs_g) if n.carbs_g else None,
-                "fat_g": float(n.fat_g) if n.fat_g else None,
+                "protein_g": n.protein_g or None,
+                "carbs_g": n.carbs_g or None,
+                "fat_g": n.fat_g or None,
             }
             for n in nutrition_days
         ]
@@ -352,17 +551,14 @@ class ContextBuilder:
         nutrition_days = len(context.recent_nutrition)
         nutrition_rate = nutrition_days / days if days > 0 else 0
 
-        # Calculate streak
-        sorted_checkins = sorted(context.recent_checkins, key=lambda x: x["date"], reverse=True)
+        # Calculate streak: count back from today through the logged dates,
+        # which needs neither sorting nor parsing the check-ins
+        logged_dates = {c["date"] for c in context.recent_checkins}
         streak = 0
         expected_date = date.today()
-        for checkin in sorted_checkins:
-            checkin_date = date.fromisoformat(checkin["date"])
-            if checkin_date == expected_date:
-                streak += 1
-                expected_date -= timedelta(days=1)
-            else:
-                break
+        while expected_date.isoformat() in logged_dates:
+            streak += 1
+            expected_date -= timedelta(days=1)
 
         context.adherence_metrics = {
             "days_analyzed": days,
@@ -374,29 +570,20 @@ class ContextBuilder:
 
     async def _load_targets(self, context: CoachContext) -> None:
         """Load calculated TDEE and macro targets."""
-        from app.nutrition.calculator import calculate_bmr, calculate_macro_targets, calculate_tdee
-
         if not context.user_profile:
             return
 
-        # Get current weight
-        current_weight = None
-        if context.weight_trend and context.weight_trend.get("current_weight_kg"):
-            current_weight = context.weight_trend["current_weight_kg"]
-        elif context.recent_checkins:
-            for checkin in context.recent_checkins:
-                if checkin.get("weight_kg"):
-                    current_weight = checkin["weight_kg"]
-                    break
-
+        # Same lookups the policy context uses
+        current_weight = context._get_current_weight()
         if not current_weight:
             return
 
         try:
             # Get profile data
             height_cm = context.user_profile.get("height_cm", 170)
-            birth_year = context.user_profile.get("birth_year")
-            age = datetime.now().year - birth_year if birth_year else 30
+            age = context._calculate_age()
+            if age is None:
+                age = 30
             sex = context.user_profile.get("sex", "male")
             activity_level = context.user_profile.get("activity_level", "moderate")
 
@@ -412,18 +599,20 @@ class ContextBuilder:
             )
 
             # Calculate
-            bmr = calculate_bmr(current_weight, height_cm, age, sex)
-            tdee = calculate_tdee(bmr, activity_level)
-            targets = calculate_macro_targets(tdee, current_weight, goal_type, pace, sex)
+            bmr, tdee, target_calories, protein_g, carbs_g, fat_g, deficit_surplus = (
+                _calculate_targets(
+                    current_weight, height_cm, age, sex, activity_level, goal_type, pace
+                )
+            )
 
             context.calculated_targets = {
-                "bmr": round(targets.bmr),
-                "tdee": round(targets.tdee),
-                "target_calories": round(targets.target_calories),
-                "protein_g": round(targets.protein_g),
-                "carbs_g": round(targets.carbs_g),
-                "fat_g": round(targets.fat_g),
-                "deficit_surplus": round(targets.deficit_surplus),
+                "bmr": bmr,
+                "tdee": tdee,
+                "target_calories": target_calories,
+                "protein_g": protein_g,
+                "carbs_g": carbs_g,
+                "fat_g": fat_g,
+                "deficit_surplus": deficit_surplus,
             }
         except Exception:
             context.calculated_targets = None
@@ -11,6 +11,8 @@ from sqlalchemy import JSON, Column, ForeignKey, Index, Integer, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlmodel import Field, SQLModel
 
+from app.core.ids import uuid7
+
 # Create a portable JSON type that works with both PostgreSQL and SQLite
 PortableJSON = JSONB().with_variant(JSON(), "sqlite")
 
@@ -50,7 +52,7 @@ class AISession(SQLModel, table=True):
     __table_args__ = (Index("ix_ai_session_user_id", "user_id"),)
 
     id: uuid.UUID = Field(
-        default_factory=uuid.uuid4,
+        default_factory=uuid7,
         sa_column=Column(UUID(as_uuid=True), primary_key=True, nullable=False),
     )
     user_id: uuid.UUID = Field(
@@ -61,8 +63,9 @@ class AISession(SQLModel, table=True):
         ),
     )
     status: SessionStatus = Field(default=SessionStatus.ACTIVE)
-    started_at: datetime.datetime = Field(
-        default_factory=datetime.datetime.utcnow,
+    # Filled in by the database on insert and read back with RETURNING
+    started_at: datetime.datetime | None = Field(
+        default=None,
         sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")},
     )
     last_message_at: datetime.datetime = Field(
@@ -84,8 +87,8 @@ class AISession(SQLModel, table=True):
     session_metadata: dict[str, str] | None = Field(
         default=None, sa_column=Column(PortableJSON, name="metadata")
     )
-    created_at: datetime.datetime = Field(
-        default_factory=datetime.datetime.utcnow,
+    created_at: datetime.datetime | None = Field(
+        default=None,
         sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")},
     )
 
@@ -100,7 +103,7 @@ class AIToolCallLog(SQLModel, table=True):
     )
 
     id: uuid.UUID = Field(
-        default_factory=uuid.uuid4,
+        default_factory=uuid7,
         sa_column=Column(UUID(as_uuid=True), primary_key=True, nullable=False),
     )
     session_id: uuid.UUID = Field(
@@ -126,8 +129,8 @@ class AIToolCallLog(SQLModel, table=True):
     error_message: str | None = Field(default=None, max_length=500)
     latency_ms: int = Field(default=0)
     cached: bool = Field(default=False)
-    created_at: datetime.datetime = Field(
-        default_factory=datetime.datetime.utcnow,
+    created_at: datetime.datetime | None = Field(
+        default=None,
         sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")},
     )
 
@@ -139,7 +142,7 @@ class AIPolicyViolationLog(SQLModel, table=True):
     __table_args__ = (Index("ix_ai_policy_violation_log_user_id", "user_id"),)
 
     id: uuid.UUID = Field(
-        default_factory=uuid.uuid4,
+        default_factory=uuid7,
         sa_column=Column(UUID(as_uuid=True), primary_key=True, nullable=False),
     )
     session_id: uuid.UUID | None = Field(
@@ -162,7 +165,7 @@ class AIPolicyViolationLog(SQLModel, table=True):
     trigger_content: str | None = Field(default=None, sa_column=Column(Text))
     action_taken: str = Field(max_length=100)
     details: dict[str, Any] | None = Field(default=None, sa_column=Column(PortableJSON))
-    created_at: datetime.datetime = Field(
-        default_factory=datetime.datetime.utcnow,
+    created_at: datetime.datetime | None = Field(
+        default=None,
         sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")},
     )
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import itertools
 import json
 import time
 import uuid
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
 
 from app.coach_ai.models import AISession, AIToolCallLog, ToolCallStatus
@@ -27,14 +31,101 @@ if TYPE_CHECKING:
     from collections.abc import AsyncIterator
     from typing import Any
 
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
     from app.coach_ai.context_builder import CoachContext
-    from app.coach_ai.tools.base import BaseTool
+    from app.coach_ai.tools.base import BaseTool, ToolResult
 
 logger = structlog.get_logger()
 
 
+# Providers shared across requests, one per model tier. Created on first use and
+# closed by close_providers() at shutdown
+_providers: dict[str, OpenAIProvider] = {}
+
+
+def _provider_for(tier: str) -> OpenAIProvider:
+    """Get the provider for a model tier, shared across requests.
+
+    Each provider owns an HTTP client, so sharing it keeps its connection
+    pool (and TLS sessions) warm instead of starting over on every turn.
+    """
+    provider = _providers.get(tier)
+    if provider is None:
+        provider = OpenAIProvider(
+            config=get_model_config(tier), api_key=get_settings().openai_api_key
+        )
+        _providers[tier] = provider
+    return provider
+
+
+async def close_providers() -> None:
+    """Close the shared providers' HTTP clients."""
+    providers = list(_providers.values())
+    _providers.clear()
+    for provider in providers:
+        await provider.close()
+
+
+# System prompts are fixed strings, looked up once
+_COACH_SYSTEM_PROMPT = get_system_prompt("coach")
+_PLAN_SYSTEM_PROMPT = get_system_prompt("plan")
+
+# Conversation history sent with each turn. Tokens are estimated at ~4 characters
+# each, which is close enough for a budget and needs no tokenizer
+_HISTORY_MAX_MESSAGES = 6
+_HISTORY_TOKEN_BUDGET = 1500
+_CHARS_PER_TOKEN = 4
+
+# Tool output values summarized by their length rather than their contents
+_COLLECTION_TYPES = (list, dict, tuple)
+
+# Streamed tokens are sent in small batches rather than one event per token
+_TOKEN_FLUSH_CHARS = 32
+_TOKEN_FLUSH_SECONDS = 0.025
+
+
+async def _coalesce_tokens(
+    chunks: AsyncIterator[str | dict[str, Any]],
+) -> AsyncIterator[str | dict[str, Any]]:
+    """Merge consecutive text chunks from a provider stream.
+
+    The first chunk is passed through at once to keep time-to-first-token.
+    After that, text is buffered until it reaches _TOKEN_FLUSH_CHARS or
+    _TOKEN_FLUSH_SECONDS have passed since the last flush. The buffer is
+    also flushed before any non-text chunk and at the end of the stream.
+    The time check runs as chunks arrive, so it needs no timer task.
+    """
+    buffer: list[str] = []
+    buffered_chars = 0
+    last_flush: float | None = None
+
+    async for chunk in chunks:
+        if not isinstance(chunk, str):
+            if buffer:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+            yield chunk
+            continue
+
+        buffer.append(chunk)
+        buffered_chars += len(chunk)
+        now = time.monotonic()
+        if (
+            last_flush is None
+            or buffered_chars >= _TOKEN_FLUSH_CHARS
+            or now - last_flush >= _TOKEN_FLUSH_SECONDS
+        ):
+            yield "".join(buffer)
+            buffer.clear()
+            buffered_chars = 0
+            last_flush = now
+
+    if buffer:
+        yield "".join(buffer)
+
+
 @dataclass
 class OrchestratorResult:
     """Result from orchestrator processing."""
@@ -52,43 +143,106 @@ class CoachOrchestrator:
         self,
         session: AsyncSession,
         redis_client: Any | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
     ) -> None:
         """Initialize the orchestrator.
 
         Args:
             session: Database session.
             redis_client: Optional Redis client for caching.
+            session_factory: Optional session factory. When given, the tool calls
+                of one LLM round run concurrently, each on its own session.
         """
         self.session = session
+        self.session_factory = session_factory
         self._redis_client = redis_client
         self._provider: OpenAIProvider | None = None
         self._tool_registry: ToolRegistry | None = None
 
     def _get_provider(self, tier: str = "standard") -> OpenAIProvider:
         """Get or create LLM provider."""
-        settings = get_settings()
-        config = get_model_config(tier)
-        return OpenAIProvider(config=config, api_key=settings.openai_api_key)
+        return _provider_for(tier)
 
     def _get_tool_registry(self) -> ToolRegistry:
         """Get or create tool registry with registered tools."""
         if self._tool_registry is None:
-            self._tool_registry = ToolRegistry(redis_client=self._redis_client)
-
-            # Register internal tools
-            tools: list[BaseTool] = [
-                GetUserProfileTool(self.session),
-                GetRecentCheckinsTool(self.session),
-                GetWeightTrendTool(self.session),
-                GetNutritionSummaryTool(self.session),
-                CalculateTDEETool(self.session),
-                GetAdherenceMetricsTool(self.session),
+            self._tool_registry = self._build_tool_registry(self.session)
+
+        return self._tool_registry
+
+    def _build_tool_registry(self, session: AsyncSession) -> ToolRegistry:
+        """Create a tool registry whose tools query the given session."""
+        registry = ToolRegistry(redis_client=self._redis_client)
+
+        # Register internal tools
+        tools: list[BaseTool] = [
+            GetUserProfileTool(session),
+            GetRecentCheckinsTool(session),
+            GetWeightTrendTool(session),
+            GetNutritionSummaryTool(session),
+            CalculateTDEETool(session),
+            GetAdherenceMetricsTool(session),
+        ]
+
+        for tool in tools:
+            registry.register(tool)
+
+        return registry
+
+    async def _execute_tool_calls(
+        self,
+        registry: ToolRegistry,
+        user_id: uuid.UUID,
+        tool_calls: list[dict[str, Any]],
+    ) -> list[tuple[dict[str, Any], ToolResult, int]]:
+        """Execute one round of tool calls.
+
+        Without a session factory the calls run one after another on the shared
+        session. With one, they run concurrently, each on its own session and
+        registry, since a single AsyncSession cannot run statements concurrently.
+
+        Returns:
+            (arguments, result, latency_ms) for each call, in call order.
+        """
+        calls = [
+            (call["function"]["name"], parse_tool_arguments(call["function"]["arguments"]))
+            for call in tool_calls
+        ]
+
+        if self.session_factory is None or len(calls) < 2:
+            return [
+                await self._timed_tool_call(registry, user_id, name, arguments)
+                for name, arguments in calls
             ]
 
-            for tool in tools:
-                self._tool_registry.register(tool)
+        session_factory = self.session_factory
 
-        return self._tool_registry
+        async def execute_on_own_session(
+            name: str, arguments: dict[str, Any]
+        ) -> tuple[dict[str, Any], ToolResult, int]:
+            async with session_factory() as session:
+                return await self._timed_tool_call(
+                    self._build_tool_registry(session), user_id, name, arguments
+                )
+
+        return list(
+            await asyncio.gather(
+                *(execute_on_own_session(name, arguments) for name, arguments in calls)
+            )
+        )
+
+    @staticmethod
+    async def _timed_tool_call(
+        registry: ToolRegistry,
+        user_id: uuid.UUID,
+        tool_name: str,
+        arguments: dict[str, Any],
+    ) -> tuple[dict[str, Any], ToolResult, int]:
+        """Execute a tool call and measure its latency in milliseconds."""
+        start_time = time.time()
+        result = await registry.execute_tool(tool_name, str(user_id), arguments)
+        latency_ms = int((time.time() - start_time) * 1000)
+        return arguments, result, latency_ms
 
     async def process_message(
         self,
@@ -153,31 +307,34 @@ class CoachOrchestrator:
                 )
             )
 
-            for tool_call in response.tool_calls:
+            # Execute the round's tools, then handle results in call order, which
+            # is the order the API expects the tool messages in
+            executed = await self._execute_tool_calls(registry, user_id, response.tool_calls)
+
+            for tool_call, (arguments, result, latency_ms) in zip(
+                response.tool_calls, executed, strict=True
+            ):
                 tool_name = tool_call["function"]["name"]
-                arguments_str = tool_call["function"]["arguments"]
                 tool_call_id = tool_call["id"]
 
-                # Parse arguments
-                arguments = parse_tool_arguments(arguments_str)
-
-                # Execute tool
-                start_time = time.time()
-                result = await registry.execute_tool(tool_name, str(user_id), arguments)
-                latency_ms = int((time.time() - start_time) * 1000)
+                tool = registry.get_tool(tool_name)
+                output_summary = (
+                    self._summarize_output(result.data) if result.success else result.error
+                )
 
                 # Log tool call
                 await self._log_tool_call(
                     session_id=session.id,
                     user_id=user_id,
+                    tool=tool,
                     tool_name=tool_name,
                     arguments=arguments,
                     result=result,
+                    output_summary=output_summary,
                     latency_ms=latency_ms,
                 )
 
                 # Build tool trace for explainability
-                tool = registry.get_tool(tool_name)
                 tool_traces.append(
                     {
                         "name": tool_name,
@@ -185,9 +342,7 @@ class CoachOrchestrator:
                         "input_summary": tool.get_input_summary(**arguments)
                         if tool
                         else str(arguments),
-                        "output_summary": self._summarize_output(result.data)
-                        if result.success
-                        else result.error,
+                        "output_summary": output_summary,
                         "latency_ms": latency_ms,
                         "cached": result.cached,
                     }
@@ -195,7 +350,9 @@ class CoachOrchestrator:
 
                 # Add tool result to messages
                 result_content = (
-                    json.dumps(result.data) if result.success else f"Error: {result.error}"
+                    orjson.dumps(result.data, option=orjson.OPT_NON_STR_KEYS).decode()
+                    if result.success
+                    else f"Error: {result.error}"
                 )
                 messages.append(
                     Message(
@@ -244,22 +401,26 @@ class CoachOrchestrator:
         tool_definitions = registry.get_tool_definitions(str(user_id), include_external=False)
 
         # Stream response
-        accumulated_content = ""
+        content_parts: list[str] = []
         accumulated_tool_calls: list[dict[str, Any]] = []
 
-        async for chunk in provider.chat_stream(
-            messages=messages,
-            tools=tool_definitions if tool_definitions else None,
+        async for chunk in _coalesce_tokens(
+            provider.chat_stream(
+                messages=messages,
+                tools=tool_definitions if tool_definitions else None,
+            )
         ):
             if isinstance(chunk, str):
-                accumulated_content += chunk
+                content_parts.append(chunk)
                 yield StreamEvent(type="token", data=chunk)
             elif isinstance(chunk, dict) and "tool_calls" in chunk:
                 accumulated_tool_calls = chunk["tool_calls"]
 
         # If we have tool calls, execute them and continue
         if accumulated_tool_calls:
-            # Add assistant message with tool calls
+            # Add assistant message with tool calls; the streamed text is only
+            # joined here, where it's needed
+            accumulated_content = "".join(content_parts)
             messages.append(
                 Message(
                     role="assistant",
@@ -268,25 +429,28 @@ class CoachOrchestrator:
                 )
             )
 
-            # Execute each tool call
+            # Execute the tool calls, announcing them all before they start
             for tool_call in accumulated_tool_calls:
-                tool_name = tool_call["function"]["name"]
-                arguments_str = tool_call["function"]["arguments"]
-                tool_call_id = tool_call["id"]
+                yield StreamEvent(type="tool_start", data={"tool": tool_call["function"]["name"]})
 
-                yield StreamEvent(type="tool_start", data={"tool": tool_name})
+            executed = await self._execute_tool_calls(registry, user_id, accumulated_tool_calls)
 
-                arguments = parse_tool_arguments(arguments_str)
-                start_time = time.time()
-                result = await registry.execute_tool(tool_name, str(user_id), arguments)
-                latency_ms = int((time.time() - start_time) * 1000)
+            for tool_call, (arguments, result, latency_ms) in zip(
+                accumulated_tool_calls, executed, strict=True
+            ):
+                tool_name = tool_call["function"]["name"]
+                tool_call_id = tool_call["id"]
 
                 await self._log_tool_call(
                     session_id=session.id,
                     user_id=user_id,
+                    tool=registry.get_tool(tool_name),
                     tool_name=tool_name,
                     arguments=arguments,
                     result=result,
+                    output_summary=(
+                        self._summarize_output(result.data) if result.success else result.error
+                    ),
                     latency_ms=latency_ms,
                 )
 
@@ -301,7 +465,9 @@ class CoachOrchestrator:
 
                 # Add tool result
                 result_content = (
-                    json.dumps(result.data) if result.success else f"Error: {result.error}"
+                    orjson.dumps(result.data, option=orjson.OPT_NON_STR_KEYS).decode()
+                    if result.success
+                    else f"Error: {result.error}"
                 )
                 messages.append(
                     Message(
@@ -313,7 +479,9 @@ class CoachOrchestrator:
                 )
 
             # Get final response after tool execution
-            async for chunk in provider.chat_stream(messages=messages, tools=None):
+            async for chunk in _coalesce_tokens(
+                provider.chat_stream(messages=messages, tools=None)
+            ):
                 if isinstance(chunk, str):
                     yield StreamEvent(type="token", data=chunk)
 
@@ -341,7 +509,7 @@ class CoachOrchestrator:
         context_summary = user_context.get_context_summary()
 
         # Build plan prompt
-        system_prompt = get_system_prompt("plan")
+        system_prompt = _PLAN_SYSTEM_PROMPT
         user_prompt = f"""Based on this user's data, create a weekly plan:
 
 {context_summary}
@@ -365,8 +533,8 @@ Format your response as JSON with keys: daily_targets, focus_areas, recommendati
 
         # Parse response
         try:
-            plan_data = json.loads(response.content or "{}")
-        except json.JSONDecodeError:
+            plan_data = orjson.loads(response.content or "{}")
+        except orjson.JSONDecodeError:
             # Default plan if parsing fails
             plan_data = {
                 "daily_targets": user_context.calculated_targets or {},
@@ -401,12 +569,15 @@ Format your response as JSON with keys: daily_targets, focus_areas, recommendati
         """Build the message list for the LLM.
 
         Uses compact context summary for token efficiency and limits
-        conversation history to last 6 messages (3 rounds).
+        conversation history to last 6 messages (3 rounds), fewer when they
+        would exceed the history token budget.
         """
         messages: list[Message] = []
 
-        # System prompt with compact context (saves ~40% tokens)
-        system_content = get_system_prompt("coach")
+        # System prompt with compact context (saves ~40% tokens). Everything that
+        # varies per turn comes after it, so the provider's prefix cache can reuse
+        # the system prompt and context across a session's turns
+        system_content = _COACH_SYSTEM_PROMPT
         context_summary = context.get_compact_summary()
         if context_summary:
             system_content += f"\n\n## User Context\n{context_summary}"
@@ -414,10 +585,18 @@ Format your response as JSON with keys: daily_targets, focus_areas, recommendati
         messages.append(Message(role="system", content=system_content))
 
         # Add conversation history - limit to last 6 messages (3 rounds)
-        # This saves significant tokens while maintaining conversation coherence
+        # This saves significant tokens while maintaining conversation coherence.
+        # Long messages also count against a token budget, newest first, so a few
+        # long replies can't crowd out the rest of the prompt
         if history:
-            recent_history = history[-6:]
-            for msg in recent_history:
+            budget = _HISTORY_TOKEN_BUDGET * _CHARS_PER_TOKEN
+            kept = 0
+            for msg in reversed(history[-_HISTORY_MAX_MESSAGES:]):
+                budget -= len(msg.content)
+                if budget < 0:
+                    break
+                kept += 1
+            for msg in history[len(history) - kept :]:
                 messages.append(Message(role=msg.role, content=msg.content))
 
         # Add current user message
@@ -429,19 +608,24 @@ Format your response as JSON with keys: daily_targets, focus_areas, recommendati
         self,
         session_id: uuid.UUID,
         user_id: uuid.UUID,
+        tool: BaseTool | None,
         tool_name: str,
         arguments: dict[str, Any],
         result: Any,
+        output_summary: str | None,
         latency_ms: int,
     ) -> None:
-        """Log a tool call to the database."""
-        import hashlib
+        """Log a tool call to the database.
 
-        tool = self._get_tool_registry().get_tool(tool_name)
-
-        input_hash = hashlib.sha256(
-            json.dumps(arguments, sort_keys=True, default=str).encode()
-        ).hexdigest()[:64]
+        The tool is the one the caller already resolved, or None if unknown,
+        and the output summary is the one it already built for the trace.
+        The input hash only identifies repeated inputs, so it uses BLAKE2b,
+        which is faster than SHA-256 on short inputs, at the same 64 hex
+        characters.
+        """
+        input_hash = hashlib.blake2b(
+            orjson.dumps(arguments, default=str, option=orjson.OPT_SORT_KEYS), digest_size=32
+        ).hexdigest()
 
         log_entry = AIToolCallLog(
             session_id=session_id,
@@ -452,9 +636,7 @@ Format your response as JSON with keys: daily_targets, focus_areas, recommendati
             input_summary=tool.get_input_summary(**arguments)[:500]
             if tool
             else str(arguments)[:500],
-            output_summary=self._summarize_output(result.data)[:1000]
-            if result.success
-            else result.error,
+            output_summary=output_summary[:1000] if output_summary else output_summary,
             status=ToolCallStatus.SUCCESS if result.success else ToolCallStatus.FAILED,
             error_message=result.error[:500] if result.error else None,
             latency_ms=latency_ms,
@@ -471,9 +653,9 @@ Format your response as JSON with keys: daily_targets, focus_areas, recommendati
         if isinstance(data, dict):
             # Extract key information
             summary_parts = []
-            for key, value in list(data.items())[:5]:  # First 5 items
+            for key, value in itertools.islice(data.items(), 5):  # First 5 items
                 if value is not None:
-                    if isinstance(value, (list, dict)):
+                    if isinstance(value, _COLLECTION_TYPES):
                         summary_parts.append(f"{key}: {len(value)} items")
                     else:
                         summary_parts.append(f"{key}: {value}")
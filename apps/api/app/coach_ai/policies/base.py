@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 
 
 class PolicySeverity(str, Enum):
@@ -50,6 +52,11 @@ class UserContext:
     target_calories: int | None = None
     target_weight_kg: float | None = None
 
+    @cached_property
+    def user_uuid(self) -> uuid.UUID:
+        """The user ID as a UUID, parsed once however many violations are logged."""
+        return uuid.UUID(self.user_id)
+
 
 class BasePolicy(ABC):
     """Abstract base class for safety policies."""
@@ -57,14 +64,21 @@ class BasePolicy(ABC):
     name: str
     description: str
     severity: PolicySeverity
+    # Lowercase substrings at least one of which any input the policy acts on
+    # contains, so the engine can skip inputs with none of them. None means the
+    # policy can't say, and every input is checked
+    input_triggers: tuple[str, ...] | None = None
 
     @abstractmethod
-    def check_input(self, user_input: str, context: UserContext) -> PolicyResult:
+    def check_input(
+        self, user_input: str, context: UserContext, *, text_lower: str | None = None
+    ) -> PolicyResult:
         """Check user input against policy.
 
         Args:
             user_input: The user's message.
             context: User context for evaluation.
+            text_lower: ``user_input.lower()``, if the caller already has it.
 
         Returns:
             PolicyResult indicating if the check passed and any actions to take.
@@ -72,12 +86,15 @@ class BasePolicy(ABC):
         pass
 
     @abstractmethod
-    def check_output(self, llm_output: str, context: UserContext) -> PolicyResult:
+    def check_output(
+        self, llm_output: str, context: UserContext, *, text_lower: str | None = None
+    ) -> PolicyResult:
         """Check LLM output against policy.
 
         Args:
             llm_output: The LLM's response.
             context: User context for evaluation.
+            text_lower: ``llm_output.lower()``, if the caller already has it.
 
         Returns:
             PolicyResult indicating if the check passed and any actions to take.
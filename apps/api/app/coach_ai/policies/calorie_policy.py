@@ -17,6 +17,33 @@ MIN_CALORIES_FEMALE = 1200
 MIN_CALORIES_MALE = 1500
 MAX_DEFICIT = 1000
 
+# Patterns for extremely low calorie requests, compiled once at import
+_INPUT_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\b(\d{2,3})\s*(?:cal|calories|kcal)",  # 2-3 digit calorie numbers
+        r"under\s*(\d{3,4})\s*(?:cal|calories|kcal)",
+        r"only\s*(\d{3,4})\s*(?:cal|calories|kcal)",
+        r"less\s*than\s*(\d{3,4})\s*(?:cal|calories|kcal)",
+    )
+)
+
+# Every input pattern needs "cal" (which "kcal" and "calories" contain), and every
+# output pattern needs one of these substrings, so text without them skips the regexes
+_INPUT_TRIGGERS = ("cal",)
+_OUTPUT_TRIGGERS = ("cal", "eat", "target", "aim")
+
+# Patterns extracting calorie recommendations from LLM output
+_OUTPUT_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"(\d{3,4})\s*(?:cal|kcal|calories)",
+        r"eat\s*(?:around|about|approximately)?\s*(\d{3,4})",
+        r"target\s*(?:of)?\s*(\d{3,4})",
+        r"aim\s*for\s*(\d{3,4})",
+    )
+)
+
 
 class CaloriePolicy(BasePolicy):
     """Policy for minimum/maximum calorie recommendations."""
@@ -24,23 +51,20 @@ class CaloriePolicy(BasePolicy):
     name = "calorie_policy"
     description = "Ensures calorie recommendations are within safe limits"
     severity = PolicySeverity.BLOCKED
+    input_triggers = _INPUT_TRIGGERS
 
-    def check_input(self, user_input: str, context: UserContext) -> PolicyResult:
+    def check_input(
+        self, user_input: str, context: UserContext, *, text_lower: str | None = None
+    ) -> PolicyResult:
         """Check if user is requesting dangerous calorie levels."""
-        input_lower = user_input.lower()
-
-        # Patterns for extremely low calorie requests
-        patterns = [
-            r"\b(\d{2,3})\s*(?:cal|calories|kcal)",  # 2-3 digit calorie numbers
-            r"under\s*(\d{3,4})\s*(?:cal|calories|kcal)",
-            r"only\s*(\d{3,4})\s*(?:cal|calories|kcal)",
-            r"less\s*than\s*(\d{3,4})\s*(?:cal|calories|kcal)",
-        ]
+        input_lower = user_input.lower() if text_lower is None else text_lower
+        if not any(trigger in input_lower for trigger in _INPUT_TRIGGERS):
+            return PolicyResult(passed=True, action=PolicyAction.ALLOW)
 
         min_cal = MIN_CALORIES_FEMALE if context.sex == "female" else MIN_CALORIES_MALE
 
-        for pattern in patterns:
-            match = re.search(pattern, input_lower)
+        for pattern in _INPUT_PATTERNS:
+            match = pattern.search(input_lower)
             if match:
                 try:
                     calories = int(match.group(1))
@@ -62,25 +86,21 @@ class CaloriePolicy(BasePolicy):
 
         return PolicyResult(passed=True, action=PolicyAction.ALLOW)
 
-    def check_output(self, llm_output: str, context: UserContext) -> PolicyResult:
+    def check_output(
+        self, llm_output: str, context: UserContext, *, text_lower: str | None = None
+    ) -> PolicyResult:
         """Check if LLM is recommending dangerous calorie levels."""
-        output_lower = llm_output.lower()
-
-        # Extract calorie recommendations from output
-        patterns = [
-            r"(\d{3,4})\s*(?:cal|kcal|calories)",
-            r"eat\s*(?:around|about|approximately)?\s*(\d{3,4})",
-            r"target\s*(?:of)?\s*(\d{3,4})",
-            r"aim\s*for\s*(\d{3,4})",
-        ]
+        output_lower = llm_output.lower() if text_lower is None else text_lower
+        if not any(trigger in output_lower for trigger in _OUTPUT_TRIGGERS):
+            return PolicyResult(passed=True, action=PolicyAction.ALLOW)
 
         min_cal = MIN_CALORIES_FEMALE if context.sex == "female" else MIN_CALORIES_MALE
 
-        for pattern in patterns:
-            matches = re.findall(pattern, output_lower)
-            for match in matches:
+        # Extract calorie recommendations from output, stopping at the first unsafe one
+        for pattern in _OUTPUT_PATTERNS:
+            for match in pattern.finditer(output_lower):
                 try:
-                    calories = int(match)
+                    calories = int(match.group(1))
                     if calories < min_cal:
                         disclaimer = (
                             f"\n\n**Important:** Calorie intake below {min_cal} calories per day "
@@ -44,6 +44,34 @@ ED_PHRASES = [
     r"(?:starve|starving)\s+(?:myself|me)",
 ]
 
+# All keywords in one alternation, so the input is scanned once rather than once
+# per keyword. Unanchored, like the substring checks it replaces: "purged" still
+# matches "purge"
+_ED_KEYWORDS_RE = re.compile("|".join(re.escape(keyword) for keyword in ED_KEYWORDS))
+
+# Phrases and dangerous output patterns are likewise fused into one alternation
+# each; any match gets the same response, so which branch matched doesn't matter
+_ED_PHRASES_RE = re.compile("|".join(f"(?:{pattern})" for pattern in ED_PHRASES))
+
+# Problematic recommendations in LLM output
+_DANGEROUS_OUTPUT_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"skip\s+(?:all\s+)?meals",
+            r"very\s+low\s+calorie",
+            r"extreme\s+(?:diet|restriction|fasting)",
+            r"fast\s+for\s+(?:\d+\s+)?days",
+            r"don'?t\s+eat\s+(?:for|until)",
+            r"restrict\s+(?:heavily|severely)",
+        )
+    )
+)
+
+# Substrings at least one of which every dangerous output pattern contains, so text
+# without them skips the regexes
+_DANGEROUS_OUTPUT_TRIGGERS = ("skip", "calorie", "extreme", "fast", "eat", "restrict")
+
 
 class EatingDisorderPolicy(BasePolicy):
     """Policy for detecting eating disorder signals."""
@@ -51,46 +79,44 @@ class EatingDisorderPolicy(BasePolicy):
     name = "eating_disorder_policy"
     description = "Detects potential eating disorder signals and provides appropriate resources"
     severity = PolicySeverity.CRITICAL
+    # The keywords, plus a word each phrase requires
+    input_triggers = (*ED_KEYWORDS, "eat", "punish", "body", "make", "rid", "starv")
 
-    def check_input(self, user_input: str, _context: UserContext) -> PolicyResult:
+    def check_input(
+        self, user_input: str, _context: UserContext, *, text_lower: str | None = None
+    ) -> PolicyResult:
         """Check for eating disorder signals in user input."""
-        input_lower = user_input.lower()
+        input_lower = user_input.lower() if text_lower is None else text_lower
 
         # Check for keywords
-        for keyword in ED_KEYWORDS:
-            if keyword in input_lower:
-                return self._create_concern_response(keyword)
+        keyword_match = _ED_KEYWORDS_RE.search(input_lower)
+        if keyword_match:
+            return self._create_concern_response(keyword_match.group(0))
 
         # Check for phrases
-        for pattern in ED_PHRASES:
-            if re.search(pattern, input_lower):
-                return self._create_concern_response(pattern)
+        phrase_match = _ED_PHRASES_RE.search(input_lower)
+        if phrase_match:
+            return self._create_concern_response(phrase_match.group(0))
 
         return PolicyResult(passed=True, action=PolicyAction.ALLOW)
 
-    def check_output(self, llm_output: str, _context: UserContext) -> PolicyResult:
+    def check_output(
+        self, llm_output: str, _context: UserContext, *, text_lower: str | None = None
+    ) -> PolicyResult:
         """Ensure LLM output doesn't encourage ED behaviors."""
-        output_lower = llm_output.lower()
+        output_lower = llm_output.lower() if text_lower is None else text_lower
+        if not any(trigger in output_lower for trigger in _DANGEROUS_OUTPUT_TRIGGERS):
+            return PolicyResult(passed=True, action=PolicyAction.ALLOW)
 
         # Check for problematic recommendations
-        dangerous_patterns = [
-            r"skip\s+(?:all\s+)?meals",
-            r"very\s+low\s+calorie",
-            r"extreme\s+(?:diet|restriction|fasting)",
-            r"fast\s+for\s+(?:\d+\s+)?days",
-            r"don'?t\s+eat\s+(?:for|until)",
-            r"restrict\s+(?:heavily|severely)",
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, output_lower):
-                return PolicyResult(
-                    passed=False,
-                    action=PolicyAction.BLOCK,
-                    severity=PolicySeverity.CRITICAL,
-                    violation_type="ed_promotion",
-                    message="I can't provide advice that could be harmful to your health.",
-                )
+        if _DANGEROUS_OUTPUT_RE.search(output_lower):
+            return PolicyResult(
+                passed=False,
+                action=PolicyAction.BLOCK,
+                severity=PolicySeverity.CRITICAL,
+                violation_type="ed_promotion",
+                message="I can't provide advice that could be harmful to your health.",
+            )
 
         return PolicyResult(passed=True, action=PolicyAction.ALLOW)
 
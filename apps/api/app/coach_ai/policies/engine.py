@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-import uuid
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import structlog
 
 from app.coach_ai.models import AIPolicyViolationLog, PolicyViolationType
-from app.coach_ai.policies.base import BasePolicy, PolicyAction, PolicyResult, UserContext
+from app.coach_ai.policies.base import (
+    BasePolicy,
+    PolicyAction,
+    PolicyResult,
+    UserContext,
+)
 from app.coach_ai.policies.calorie_policy import CaloriePolicy
 from app.coach_ai.policies.eating_disorder_policy import EatingDisorderPolicy
 from app.coach_ai.policies.medical_claims_policy import MedicalClaimsPolicy
@@ -19,6 +25,29 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Policy violation type strings mapped to the logged enum
+_VIOLATION_TYPES = {
+    "calorie_minimum": PolicyViolationType.CALORIE_MINIMUM,
+    "calorie_minimum_request": PolicyViolationType.CALORIE_MINIMUM,
+    "calorie_maximum": PolicyViolationType.CALORIE_MAXIMUM,
+    "rapid_weight_loss_request": PolicyViolationType.WEIGHT_LOSS_RATE,
+    "rapid_weight_loss_recommendation": PolicyViolationType.WEIGHT_LOSS_RATE,
+    "eating_disorder_signal": PolicyViolationType.EATING_DISORDER_SIGNAL,
+    "ed_promotion": PolicyViolationType.EATING_DISORDER_SIGNAL,
+    "medical_request": PolicyViolationType.MEDICAL_CLAIM,
+    "medical_diagnosis": PolicyViolationType.MEDICAL_CLAIM,
+}
+
+
+@lru_cache(maxsize=8)
+def _triggers_pattern(triggers: frozenset[str]) -> re.Pattern[str]:
+    """Compile a set of trigger substrings into one alternation, built once per set.
+
+    Case is ignored on top of matching lowercased text, so nothing a
+    case-insensitive policy pattern matches is missed.
+    """
+    return re.compile("|".join(re.escape(trigger) for trigger in sorted(triggers)), re.IGNORECASE)
+
 
 class SafetyPolicyEngine:
     """Coordinates all safety policies."""
@@ -37,6 +66,17 @@ class SafetyPolicyEngine:
             MedicalClaimsPolicy(),
         ]
 
+        # Input with none of the policies' triggers can't fail any of them. Only
+        # usable when every policy declares its triggers
+        self._input_triggers: re.Pattern[str] | None = None
+        triggers: set[str] = set()
+        for policy in self._policies:
+            if policy.input_triggers is None:
+                break
+            triggers.update(policy.input_triggers)
+        else:
+            self._input_triggers = _triggers_pattern(frozenset(triggers))
+
     async def check_input(self, user_input: str, context: UserContext) -> PolicyResult:
         """Check user input against all policies.
 
@@ -47,8 +87,13 @@ class SafetyPolicyEngine:
         Returns:
             PolicyResult with aggregated results.
         """
+        # Lowercased once here and shared with every policy
+        input_lower = user_input.lower()
+        if self._input_triggers is not None and not self._input_triggers.search(input_lower):
+            return PolicyResult(passed=True, action=PolicyAction.ALLOW)
+
         for policy in self._policies:
-            result = policy.check_input(user_input, context)
+            result = policy.check_input(user_input, context, text_lower=input_lower)
             if not result.passed:
                 await self._log_violation(result, context, user_input, is_input=True)
 
@@ -73,10 +118,13 @@ class SafetyPolicyEngine:
             PolicyResult with potentially modified content and disclaimers.
         """
         modified_output = llm_output
-        disclaimers: list[str] = []
+        # Lowercased once and shared with every policy, until one modifies the output
+        output_lower = llm_output.lower()
+        # Insertion-ordered set, so repeated disclaimers are dropped as they arrive
+        disclaimers: dict[str, None] = {}
 
         for policy in self._policies:
-            result = policy.check_output(modified_output, context)
+            result = policy.check_output(modified_output, context, text_lower=output_lower)
 
             if not result.passed:
                 await self._log_violation(result, context, modified_output, is_input=False)
@@ -86,16 +134,14 @@ class SafetyPolicyEngine:
 
                 if result.action == PolicyAction.MODIFY and result.modified_content:
                     modified_output = result.modified_content
+                    output_lower = modified_output.lower()
 
             if result.disclaimer:
-                disclaimers.append(result.disclaimer)
+                disclaimers[result.disclaimer] = None
 
         # Inject disclaimers if any
         if disclaimers:
-            # Deduplicate disclaimers
-            unique_disclaimers = list(dict.fromkeys(disclaimers))
-            disclaimer_text = "\n".join(unique_disclaimers)
-            modified_output = modified_output + disclaimer_text
+            modified_output = modified_output + "\n".join(disclaimers)
 
         return PolicyResult(
             passed=True,
@@ -130,25 +176,12 @@ class SafetyPolicyEngine:
         # Store in database if session available
         if self.session and result.violation_type:
             try:
-                # Map violation type string to enum
-                violation_type_map = {
-                    "calorie_minimum": PolicyViolationType.CALORIE_MINIMUM,
-                    "calorie_minimum_request": PolicyViolationType.CALORIE_MINIMUM,
-                    "calorie_maximum": PolicyViolationType.CALORIE_MAXIMUM,
-                    "rapid_weight_loss_request": PolicyViolationType.WEIGHT_LOSS_RATE,
-                    "rapid_weight_loss_recommendation": PolicyViolationType.WEIGHT_LOSS_RATE,
-                    "eating_disorder_signal": PolicyViolationType.EATING_DISORDER_SIGNAL,
-                    "ed_promotion": PolicyViolationType.EATING_DISORDER_SIGNAL,
-                    "medical_request": PolicyViolationType.MEDICAL_CLAIM,
-                    "medical_diagnosis": PolicyViolationType.MEDICAL_CLAIM,
-                }
-
-                violation_type_enum = violation_type_map.get(
+                violation_type_enum = _VIOLATION_TYPES.get(
                     result.violation_type, PolicyViolationType.UNSAFE_CONTENT
                 )
 
                 log_entry = AIPolicyViolationLog(
-                    user_id=uuid.UUID(context.user_id),
+                    user_id=context.user_uuid,
                     violation_type=violation_type_enum,
                     severity=result.severity.value if result.severity else "warning",
                     trigger_content=content[:500] if content else None,  # Truncate
@@ -37,6 +37,26 @@ MEDICAL_PATTERNS = [
     r"is\s+(?:this|it)\s+(?:\w+\s+)?(?:safe|dangerous)\s+(?:to|for)",
 ]
 
+# Each pattern list is fused into one alternation, so the text is scanned once.
+# Any match gets the same response, so which branch matched doesn't matter.
+# Matching ignores case, so the text is never lowercased
+_MEDICAL_PATTERNS_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in MEDICAL_PATTERNS), re.IGNORECASE
+)
+
+# Diagnostic language in LLM output
+_DIAGNOSTIC_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"you\s+(?:have|may\s+have|might\s+have|probably\s+have)\s+(?:\w+\s+)?(?:diabetes|disorder|disease|condition)",
+            r"this\s+(?:is|sounds\s+like|could\s+be)\s+(?:\w+\s+)?(?:diabetes|disorder|disease|condition)",
+            r"i\s+(?:diagnose|recommend)\s+(?:you|that\s+you)",
+        )
+    ),
+    re.IGNORECASE,
+)
+
 # Medical conditions we should not advise on
 MEDICAL_CONDITIONS = [
     "diabetes",
@@ -56,6 +76,15 @@ MEDICAL_CONDITIONS = [
     "nursing",
 ]
 
+# All conditions in one alternation, so the text is scanned once rather than once
+# per condition. Unanchored, like the substring checks it replaces
+_MEDICAL_CONDITIONS_RE = re.compile(
+    "|".join(re.escape(condition) for condition in MEDICAL_CONDITIONS), re.IGNORECASE
+)
+
+# Phrasings that make a mention of a condition a question about it
+_QUESTION_RE = re.compile("what should|how should|can i|should i", re.IGNORECASE)
+
 
 class MedicalClaimsPolicy(BasePolicy):
     """Policy for detecting and refusing medical claims."""
@@ -63,64 +92,71 @@ class MedicalClaimsPolicy(BasePolicy):
     name = "medical_claims_policy"
     description = "Prevents medical diagnoses and ensures appropriate disclaimers"
     severity = PolicySeverity.BLOCKED
-
-    def check_input(self, user_input: str, _context: UserContext) -> PolicyResult:
+    # The conditions, plus a word each medical pattern requires
+    input_triggers = (
+        *MEDICAL_CONDITIONS,
+        "anorexia",
+        "bulimia",
+        "medic",
+        "prescription",
+        "drug",
+        "safe",
+        "dangerous",
+    )
+
+    def check_input(
+        self,
+        user_input: str,
+        _context: UserContext,
+        *,
+        text_lower: str | None = None,  # noqa: ARG002
+    ) -> PolicyResult:
         """Check if user is requesting medical advice."""
-        input_lower = user_input.lower()
-
         # Check for medical patterns
-        for pattern in MEDICAL_PATTERNS:
-            if re.search(pattern, input_lower):
-                return self._create_medical_referral_response()
-
-        # Check for medical conditions
-        for condition in MEDICAL_CONDITIONS:
-            # Allow general questions but flag for disclaimer
-            if condition in input_lower and (
-                "?" in user_input
-                or any(q in input_lower for q in ["what should", "how should", "can i", "should i"])
-            ):
-                return PolicyResult(
-                    passed=True,
-                    action=PolicyAction.ALLOW,
-                    disclaimer=self._get_medical_disclaimer(),
-                )
+        if _MEDICAL_PATTERNS_RE.search(user_input):
+            return self._create_medical_referral_response()
+
+        # Check for medical conditions; allow general questions but flag for disclaimer
+        if _MEDICAL_CONDITIONS_RE.search(user_input) and (
+            "?" in user_input or _QUESTION_RE.search(user_input)
+        ):
+            return PolicyResult(
+                passed=True,
+                action=PolicyAction.ALLOW,
+                disclaimer=self._get_medical_disclaimer(),
+            )
 
         return PolicyResult(passed=True, action=PolicyAction.ALLOW)
 
-    def check_output(self, llm_output: str, _context: UserContext) -> PolicyResult:
+    def check_output(
+        self,
+        llm_output: str,
+        _context: UserContext,
+        *,
+        text_lower: str | None = None,  # noqa: ARG002
+    ) -> PolicyResult:
         """Check if LLM output makes medical claims."""
-        output_lower = llm_output.lower()
-
         # Check for diagnostic language
-        diagnostic_patterns = [
-            r"you\s+(?:have|may\s+have|might\s+have|probably\s+have)\s+(?:\w+\s+)?(?:diabetes|disorder|disease|condition)",
-            r"this\s+(?:is|sounds\s+like|could\s+be)\s+(?:\w+\s+)?(?:diabetes|disorder|disease|condition)",
-            r"i\s+(?:diagnose|recommend)\s+(?:you|that\s+you)",
-        ]
-
-        for pattern in diagnostic_patterns:
-            if re.search(pattern, output_lower):
-                return PolicyResult(
-                    passed=False,
-                    action=PolicyAction.BLOCK,
-                    severity=PolicySeverity.BLOCKED,
-                    violation_type="medical_diagnosis",
-                    message=(
-                        "I'm not able to provide medical diagnoses or advice. "
-                        "For health concerns, please consult with a healthcare provider "
-                        "who can properly evaluate your situation."
-                    ),
-                )
+        if _DIAGNOSTIC_RE.search(llm_output):
+            return PolicyResult(
+                passed=False,
+                action=PolicyAction.BLOCK,
+                severity=PolicySeverity.BLOCKED,
+                violation_type="medical_diagnosis",
+                message=(
+                    "I'm not able to provide medical diagnoses or advice. "
+                    "For health concerns, please consult with a healthcare provider "
+                    "who can properly evaluate your situation."
+                ),
+            )
 
         # Check if discussing medical conditions - add disclaimer
-        for condition in MEDICAL_CONDITIONS:
-            if condition in output_lower:
-                return PolicyResult(
-                    passed=True,
-                    action=PolicyAction.MODIFY,
-                    disclaimer=self._get_medical_disclaimer(),
-                )
+        if _MEDICAL_CONDITIONS_RE.search(llm_output):
+            return PolicyResult(
+                passed=True,
+                action=PolicyAction.MODIFY,
+                disclaimer=self._get_medical_disclaimer(),
+            )
 
         return PolicyResult(passed=True, action=PolicyAction.ALLOW)
 
@@ -15,6 +15,47 @@ from app.coach_ai.policies.base import (
 # Maximum safe weight loss rate (1% of body weight per week)
 MAX_WEIGHT_LOSS_RATE = 0.01
 
+_KG_PER_POUND = 0.453592
+
+# Patterns for rapid weight loss requests, fused into one alternation so the text
+# is scanned once. Each branch has a single group, the amount, so a match's
+# lastindex points at it whichever branch matched. Matching ignores case, so the
+# text is never lowercased
+_RAPID_LOSS_INPUT_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"lose\s+(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:in|per)\s*(?:a\s+)?week",
+            r"drop\s+(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:fast|quick|rapid)",
+            r"(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:a|per)\s*week",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Patterns for rapid weight loss recommendations in LLM output
+_RAPID_LOSS_OUTPUT_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"lose\s+(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:per|a)\s*week",
+            r"expect\s+(?:to\s+)?(?:lose\s+)?(\d+)\s*(?:lbs?|pounds?|kg|kilos?)",
+            r"(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:weekly|per\s+week)",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+def _amount_kg(match: re.Match[str]) -> float:
+    """Get the amount a rapid weight loss match names, in kilograms."""
+    amount = float(match[match.lastindex or 0])
+    # Convert to kg if in pounds
+    text = match.group(0).lower()
+    if "lb" in text or "pound" in text:
+        return amount * _KG_PER_POUND
+    return amount
+
 
 class WeightLossPolicy(BasePolicy):
     """Policy for safe weight loss rate."""
@@ -22,105 +63,77 @@ class WeightLossPolicy(BasePolicy):
     name = "weight_loss_policy"
     description = "Ensures weight loss recommendations are within safe limits"
     severity = PolicySeverity.WARNING
-
-    def check_input(self, user_input: str, context: UserContext) -> PolicyResult:
+    # Every rapid loss pattern names a unit
+    input_triggers = ("lb", "pound", "kg", "kilo")
+
+    def check_input(
+        self,
+        user_input: str,
+        context: UserContext,
+        *,
+        text_lower: str | None = None,  # noqa: ARG002
+    ) -> PolicyResult:
         """Check if user is requesting dangerous weight loss rates."""
-        input_lower = user_input.lower()
+        # The limit depends only on the user, so it's worked out once per call:
+        # 50% above their safe rate, or more than 1kg/week without weight context
+        safe_rate_kg = (context.current_weight_kg or 0) * MAX_WEIGHT_LOSS_RATE
+        limit_kg = safe_rate_kg * 1.5 if safe_rate_kg else 1.0
 
-        # Patterns for rapid weight loss requests
-        rapid_loss_patterns = [
-            r"lose\s+(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:in|per)\s*(?:a\s+)?week",
-            r"drop\s+(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:fast|quick|rapid)",
-            r"(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:a|per)\s*week",
-        ]
-
-        for pattern in rapid_loss_patterns:
-            match = re.search(pattern, input_lower)
-            if match:
-                try:
-                    amount = float(match.group(1))
-
-                    # Convert to kg if in pounds
-                    if "lb" in pattern or "pound" in pattern:
-                        amount_kg = amount * 0.453592
-                    else:
-                        amount_kg = amount
-
-                    # Check against safe rate if we have user's weight
-                    if context.current_weight_kg:
-                        safe_rate_kg = context.current_weight_kg * MAX_WEIGHT_LOSS_RATE
-                        if amount_kg > safe_rate_kg * 1.5:  # 50% above safe rate
-                            return PolicyResult(
-                                passed=False,
-                                action=PolicyAction.MODIFY,
-                                severity=PolicySeverity.WARNING,
-                                violation_type="rapid_weight_loss_request",
-                                message=(
-                                    f"I understand you want fast results! For sustainable, healthy weight loss, "
-                                    f"experts recommend no more than {safe_rate_kg:.1f} kg ({safe_rate_kg * 2.2:.1f} lbs) "
-                                    f"per week, which is about 1% of your body weight. "
-                                    "Faster loss often leads to muscle loss and rebound weight gain. "
-                                    "Let me help you with a plan that gets lasting results!"
-                                ),
-                            )
-                    else:
-                        # Without weight context, use general guidance
-                        if amount_kg > 1.0:  # More than 1kg/week is concerning
-                            return PolicyResult(
-                                passed=False,
-                                action=PolicyAction.MODIFY,
-                                severity=PolicySeverity.WARNING,
-                                violation_type="rapid_weight_loss_request",
-                                message=(
-                                    "Losing more than 0.5-1 kg (1-2 lbs) per week can lead to muscle loss, "
-                                    "nutrient deficiencies, and rebound weight gain. Let me help you create "
-                                    "a sustainable plan that gets you lasting results!"
-                                ),
-                            )
-                except ValueError:
-                    # Regex matched non-numeric text; skip this match
-                    pass
+        for match in _RAPID_LOSS_INPUT_RE.finditer(user_input):
+            if _amount_kg(match) > limit_kg:
+                return self._rapid_loss_request_response(safe_rate_kg)
 
         return PolicyResult(passed=True, action=PolicyAction.ALLOW)
 
-    def check_output(self, llm_output: str, _context: UserContext) -> PolicyResult:
+    def check_output(
+        self,
+        llm_output: str,
+        _context: UserContext,
+        *,
+        text_lower: str | None = None,  # noqa: ARG002
+    ) -> PolicyResult:
         """Check if LLM is recommending dangerous weight loss rates."""
-        output_lower = llm_output.lower()
-
-        # Patterns for rapid weight loss recommendations
-        rapid_patterns = [
-            r"lose\s+(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:per|a)\s*week",
-            r"expect\s+(?:to\s+)?(?:lose\s+)?(\d+)\s*(?:lbs?|pounds?|kg|kilos?)",
-            r"(\d+)\s*(?:lbs?|pounds?|kg|kilos?)\s*(?:weekly|per\s+week)",
-        ]
-
-        for pattern in rapid_patterns:
-            matches = re.findall(pattern, output_lower)
-            for match in matches:
-                try:
-                    amount = float(match)
-
-                    # Convert to kg if in pounds
-                    if "lb" in pattern or "pound" in pattern:
-                        amount_kg = amount * 0.453592
-                    else:
-                        amount_kg = amount
-
-                    if amount_kg > 1.0:  # More than 1kg/week
-                        disclaimer = (
-                            "\n\n**Note:** For safe, sustainable weight loss, aim for 0.5-1 kg "
-                            "(1-2 lbs) per week. Faster weight loss may lead to muscle loss "
-                            "and is harder to maintain long-term."
-                        )
-                        return PolicyResult(
-                            passed=False,
-                            action=PolicyAction.MODIFY,
-                            severity=PolicySeverity.WARNING,
-                            violation_type="rapid_weight_loss_recommendation",
-                            disclaimer=disclaimer,
-                        )
-                except ValueError:
-                    # Regex matched non-numeric text; skip this match
-                    pass
+        for match in _RAPID_LOSS_OUTPUT_RE.finditer(llm_output):
+            amount_kg = _amount_kg(match)
+
+            if amount_kg > 1.0:  # More than 1kg/week
+                disclaimer = (
+                    "\n\n**Note:** For safe, sustainable weight loss, aim for 0.5-1 kg "
+                    "(1-2 lbs) per week. Faster weight loss may lead to muscle loss "
+                    "and is harder to maintain long-term."
+                )
+                return PolicyResult(
+                    passed=False,
+                    action=PolicyAction.MODIFY,
+                    severity=PolicySeverity.WARNING,
+                    violation_type="rapid_weight_loss_recommendation",
+                    disclaimer=disclaimer,
+                )
 
         return PolicyResult(passed=True, action=PolicyAction.ALLOW)
+
+    def _rapid_loss_request_response(self, safe_rate_kg: float) -> PolicyResult:
+        """Create a response steering a rapid weight loss request to a safe rate."""
+        if safe_rate_kg:
+            message = (
+                f"I understand you want fast results! For sustainable, healthy weight loss, "
+                f"experts recommend no more than {safe_rate_kg:.1f} kg ({safe_rate_kg * 2.2:.1f} lbs) "
+                f"per week, which is about 1% of your body weight. "
+                "Faster loss often leads to muscle loss and rebound weight gain. "
+                "Let me help you with a plan that gets lasting results!"
+            )
+        else:
+            # Without weight context, use general guidance
+            message = (
+                "Losing more than 0.5-1 kg (1-2 lbs) per week can lead to muscle loss, "
+                "nutrient deficiencies, and rebound weight gain. Let me help you create "
+                "a sustainable plan that gets you lasting results!"
+            )
+
+        return PolicyResult(
+            passed=False,
+            action=PolicyAction.MODIFY,
+            severity=PolicySeverity.WARNING,
+            violation_type="rapid_weight_loss_request",
+            message=message,
+        )
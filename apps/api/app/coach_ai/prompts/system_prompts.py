@@ -70,6 +70,13 @@ The plan should be:
 """
 
 
+_PROMPTS = {
+    "coach": COACH_SYSTEM_PROMPT,
+    "insights": INSIGHTS_SYSTEM_PROMPT,
+    "plan": PLAN_SYSTEM_PROMPT,
+}
+
+
 def get_system_prompt(prompt_type: str = "coach") -> str:
     """Get a system prompt by type.
 
@@ -79,9 +86,4 @@ def get_system_prompt(prompt_type: str = "coach") -> str:
     Returns:
         The system prompt string.
     """
-    prompts = {
-        "coach": COACH_SYSTEM_PROMPT,
-        "insights": INSIGHTS_SYSTEM_PROMPT,
-        "plan": PLAN_SYSTEM_PROMPT,
-    }
-    return prompts.get(prompt_type, COACH_SYSTEM_PROMPT)
+    return _PROMPTS.get(prompt_type, COACH_SYSTEM_PROMPT)
@@ -132,6 +132,10 @@ class OpenAIProvider(LLMProvider):
         """Get the model identifier."""
         return self.config.model_name
 
+    async def close(self) -> None:
+        """Close the underlying HTTP client and its connections."""
+        await self.client.close()
+
     def _convert_messages(self, messages: list[Message]) -> list[dict[str, Any]]:
         """Convert internal messages to OpenAI format."""
         result = []
@@ -20,7 +20,7 @@ from app.coach_ai.schemas import (
     WeeklyPlanResponse,
 )
 from app.coach_ai.service import CoachService
-from app.database import get_session
+from app.database import async_session_maker, get_session
 from app.dependencies import RedisClient
 
 router = APIRouter(prefix="/coach", tags=["Coach"])
@@ -51,7 +51,7 @@ async def chat(
     Raises:
         HTTPException: If chat processing fails.
     """
-    service = CoachService(session, redis_client=redis_client)
+    service = CoachService(session, redis_client=redis_client, session_factory=async_session_maker)
 
     try:
         response = await service.chat(
@@ -93,7 +93,7 @@ async def chat_stream(
     Returns:
         StreamingResponse with SSE events.
     """
-    service = CoachService(session, redis_client=redis_client)
+    service = CoachService(session, redis_client=redis_client, session_factory=async_session_maker)
 
     async def event_generator() -> AsyncIterator[str]:
         try:
@@ -148,7 +148,7 @@ async def generate_plan(
     Raises:
         HTTPException: If plan generation fails.
     """
-    service = CoachService(session, redis_client=redis_client)
+    service = CoachService(session, redis_client=redis_client, session_factory=async_session_maker)
 
     try:
         plan = await service.generate_weekly_plan(
@@ -187,7 +187,7 @@ async def get_insights(
     Raises:
         HTTPException: If insight retrieval fails.
     """
-    service = CoachService(session, redis_client=redis_client)
+    service = CoachService(session, redis_client=redis_client, session_factory=async_session_maker)
 
     try:
         insights = await service.get_insights(user_id=current_user.id)
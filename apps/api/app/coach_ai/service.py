@@ -27,7 +27,7 @@ if TYPE_CHECKING:
     import uuid
     from collections.abc import AsyncIterator
 
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 logger = structlog.get_logger()
 
@@ -39,17 +39,24 @@ class CoachService:
         self,
         session: AsyncSession,
         redis_client: Any | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
     ) -> None:
         """Initialize the coach service.
 
         Args:
             session: Database session.
             redis_client: Optional Redis client for caching.
+            session_factory: Optional session factory that lets context loaders
+                and tool calls run concurrently.
         """
         self.session = session
-        self.context_builder = ContextBuilder(session)
+        self.context_builder = ContextBuilder(
+            session, session_factory=session_factory, redis_client=redis_client
+        )
         self.policy_engine = SafetyPolicyEngine(session)
-        self.orchestrator = CoachOrchestrator(session, redis_client=redis_client)
+        self.orchestrator = CoachOrchestrator(
+            session, redis_client=redis_client, session_factory=session_factory
+        )
 
     async def chat(
         self,
@@ -71,7 +78,7 @@ class CoachService:
         ai_session = await self._get_or_create_session(user_id, session_id)
 
         # Build user context
-        user_context = await self.context_builder.build_context(user_id)
+        user_context = await self.context_builder.build_context_cached(user_id)
         policy_context = user_context.to_policy_context()
 
         # Check input against safety policies
@@ -111,18 +118,19 @@ class CoachService:
         ai_session.message_count += 2  # User + assistant
         ai_session.tokens_used += result.tokens_used
         ai_session.last_message_at = datetime.utcnow()
-
-        # Store conversation history
-        if ai_session.conversation_history is None:
-            ai_session.conversation_history = []
-
-        ai_session.conversation_history.append({"role": "user", "content": message})
-        ai_session.conversation_history.append({"role": "assistant", "content": final_response})
-
-        # Keep only last 12 messages (6 rounds) to optimize token usage
-        # The orchestrator uses last 6, but we keep 12 for potential context
-        if len(ai_session.conversation_history) > 12:
-            ai_session.conversation_history = ai_session.conversation_history[-12:]
+        # The user context this turn's prompt was built on
+        ai_session.context_summary = user_context.get_compact_summary()
+
+        # Store conversation history, keeping only the last 12 messages (6 rounds)
+        # to optimize token usage; the orchestrator uses last 6, but we keep 12 for
+        # potential context. The list is reassigned rather than appended to in
+        # place, since in-place changes to a JSON column aren't detected and
+        # wouldn't be written
+        ai_session.conversation_history = [
+            *(ai_session.conversation_history or []),
+            {"role": "user", "content": message},
+            {"role": "assistant", "content": final_response},
+        ][-12:]
 
         await self.session.commit()
 
@@ -174,7 +182,7 @@ class CoachService:
         ai_session = await self._get_or_create_session(user_id, session_id)
 
         # Build user context
-        user_context = await self.context_builder.build_context(user_id)
+        user_context = await self.context_builder.build_context_cached(user_id)
         policy_context = user_context.to_policy_context()
 
         # Check input against safety policies
@@ -208,18 +216,14 @@ class CoachService:
         # Update session after streaming completes
         ai_session.message_count += 2
         ai_session.last_message_at = datetime.utcnow()
+        ai_session.context_summary = user_context.get_compact_summary()
 
-        if ai_session.conversation_history is None:
-            ai_session.conversation_history = []
-
-        ai_session.conversation_history.append({"role": "user", "content": message})
-        ai_session.conversation_history.append(
-            {"role": "assistant", "content": accumulated_response}
-        )
-
-        # Keep only last 12 messages (6 rounds) to optimize token usage
-        if len(ai_session.conversation_history) > 12:
-            ai_session.conversation_history = ai_session.conversation_history[-12:]
+        # Reassigned, trimmed to the last 12 messages, so the change is written
+        ai_session.conversation_history = [
+            *(ai_session.conversation_history or []),
+            {"role": "user", "content": message},
+            {"role": "assistant", "content": accumulated_response},
+        ][-12:]
 
         await self.session.commit()
 
@@ -239,7 +243,7 @@ class CoachService:
         Returns:
             WeeklyPlanResponse with the generated plan.
         """
-        user_context = await self.context_builder.build_context(user_id)
+        user_context = await self.context_builder.build_context_cached(user_id)
 
         plan = await self.orchestrator.generate_plan(
             user_id=user_id,
@@ -259,7 +263,7 @@ class CoachService:
         Returns:
             InsightsResponse with generated insights.
         """
-        user_context = await self.context_builder.build_context(user_id)
+        user_context = await self.context_builder.build_context_cached(user_id)
 
         insights: list[InsightItem] = []
 
@@ -418,11 +422,11 @@ class CoachService:
             if existing:
                 return existing
 
-        # Create new session
+        # Create new session; its database-set timestamps come back with the
+        # INSERT's RETURNING, so no refresh is needed
         new_session = AISession(user_id=user_id)
         self.session.add(new_session)
         await self.session.commit()
-        await self.session.refresh(new_session)
         return new_session
 
     def _calculate_confidence(self, context: CoachContext) -> float:
@@ -6,7 +6,9 @@ import hashlib
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
+
+from app.coach_ai.providers.base import ToolDefinition
 
 
 @dataclass
@@ -29,6 +31,9 @@ class BaseTool(ABC):
     cacheable: bool = True
     cache_ttl_seconds: int = 300  # 5 minutes default
 
+    # Built on first use per tool class; see get_definition()
+    _definition: ClassVar[ToolDefinition | None] = None
+
     @abstractmethod
     def get_parameters_schema(self) -> dict[str, Any]:
         """Return JSON Schema for tool parameters."""
@@ -39,6 +44,24 @@ class BaseTool(ABC):
         """Execute the tool with given parameters."""
         pass
 
+    def get_definition(self) -> ToolDefinition:
+        """Get the tool definition for the LLM.
+
+        Tools are instantiated per request, but the name, description and
+        parameter schema are fixed per class, so the definition is built
+        once per class and shared.
+        """
+        cls = type(self)
+        definition = cls.__dict__.get("_definition")
+        if definition is None:
+            definition = ToolDefinition(
+                name=self.name,
+                description=self.description,
+                parameters=self.get_parameters_schema(),
+            )
+            cls._definition = definition
+        return definition
+
     def get_openai_definition(self) -> dict[str, Any]:
         """Get OpenAI function calling definition."""
         return {
@@ -8,7 +8,6 @@ from typing import TYPE_CHECKING, Any
 
 import structlog
 
-from app.coach_ai.providers.base import ToolDefinition
 from app.coach_ai.tools.base import BaseTool, ToolResult
 from app.users.models import ConsentType
 
@@ -16,6 +15,8 @@ if TYPE_CHECKING:
     import redis.asyncio as redis
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from app.coach_ai.providers.base import ToolDefinition
+
 logger = structlog.get_logger()
 
 # Mapping from tool names to consent types
@@ -84,14 +85,7 @@ class ToolRegistry:
             List of tool definitions for the LLM.
         """
         tools = self.get_available_tools(user_id, include_external)
-        return [
-            ToolDefinition(
-                name=tool.name,
-                description=tool.description,
-                parameters=tool.get_parameters_schema(),
-            )
-            for tool in tools
-        ]
+        return [tool.get_definition() for tool in tools]
 
     async def execute_tool(
         self,
@@ -30,14 +30,20 @@ class Settings(BaseSettings):
 
     # Database
     database_url: PostgresDsn
-    database_pool_size: int = 5
-    database_max_overflow: int = 10
+    database_pool_size: int = 20
+    database_max_overflow: int = 40
+    database_pool_recycle: int = 1800  # seconds
+    # Checks each connection on checkout so dropped connections are not handed
+    # out; pool_recycle only retires connections by age. Opt out per environment.
+    database_pool_pre_ping: bool = True
 
     # Redis
     redis_url: RedisDsn
 
     # JWT
     jwt_secret_key: str = Field(default=_DEV_JWT_SECRET_KEY)
+    # HMAC verification is a single keyed SHA-256 pass, cheaper than RS256 or EdDSA.
+    # Asymmetric keys only pay off once other services must verify tokens without the secret.
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
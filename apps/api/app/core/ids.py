@@ -0,0 +1,27 @@
+"""Identifier generation."""
+
+import os
+import time
+import uuid
+
+_TIMESTAMP_MASK = (1 << 48) - 1
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The first 48 bits are the Unix time in milliseconds and the rest is
+    random, so keys generated later sort after earlier ones and inserts land
+    at the right-hand edge of a primary key index instead of on random pages.
+    Ordering within the same millisecond is random.
+
+    Returns:
+        A new version 7 UUID.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & _TIMESTAMP_MASK) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~_VERSION_MASK) | (0x7 << 76)
+    value = (value & ~_VARIANT_MASK) | (0x2 << 62)
+    return uuid.UUID(int=value)
@@ -0,0 +1,25 @@
+"""Shared HTTP response helpers."""
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Serialize a response model directly, skipping response-model re-validation.
+
+    FastAPI would otherwise dump the model, validate the dump against the
+    response model and serialize it again, once per row on list responses.
+    Pydantic's own JSON serializer writes the body in one pass.
+
+    Args:
+        model: The response model to serialize.
+        status_code: The HTTP status code for the response.
+
+    Returns:
+        JSON response with the model's fields.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -18,13 +18,14 @@ _pool_kwargs = (
     else {
         "pool_size": settings.database_pool_size,
         "max_overflow": settings.database_max_overflow,
+        "pool_recycle": settings.database_pool_recycle,
     }
 )
 
 engine = create_async_engine(
     str(settings.database_url),
     echo=settings.debug,
-    pool_pre_ping=True,
+    pool_pre_ping=settings.database_pool_pre_ping,
     poolclass=_pool_class,
     **_pool_kwargs,
 )
@@ -6,7 +6,9 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import CurrentUser
+from app.coach_ai.context_builder import invalidate_cached_context
 from app.database import get_session
+from app.dependencies import RedisClient
 from app.nutrition.schemas import MFPImportResponse
 from app.nutrition.service import NutritionService
 
@@ -20,6 +22,7 @@ MAX_FILE_SIZE = 50 * 1024 * 1024
 async def import_mfp_csv(
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis_client: RedisClient,
     file: UploadFile = File(..., description="MFP export ZIP file"),
     overwrite: bool = Query(False, description="Overwrite existing entries"),
 ) -> MFPImportResponse:
@@ -58,6 +61,7 @@ async def import_mfp_csv(
         zip_content=content,
         overwrite_existing=overwrite,
     )
+    await invalidate_cached_context(current_user.id, redis_client)
 
     # Check if import had critical errors (no rows processed)
     if result.total_rows == 0 and result.errors:
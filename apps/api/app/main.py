@@ -1,17 +1,22 @@
 """FastAPI application entry point."""
 
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.api.v1.router import api_router
+from app.auth.password import shutdown_password_executor
+from app.auth.revocation import listen_for_revocations
 from app.auth.router import router as auth_router
 from app.checkins.router import router as checkins_router
+from app.coach_ai.orchestrator import close_providers
 from app.coach_ai.router import router as coach_router
 from app.config import get_settings
 from app.database import close_db, init_db
@@ -38,12 +43,18 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     logger.info("Starting application", app_name=settings.app_name, env=settings.app_env)
     await init_db()
-    await init_redis()
+    redis_client = await init_redis()
+    revocation_listener = asyncio.create_task(listen_for_revocations(redis_client))
     yield
     # Shutdown
     logger.info("Shutting down application")
+    revocation_listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await revocation_listener
+    await close_providers()
     await close_redis()
     await close_db()
+    shutdown_password_executor()
 
 
 def create_application() -> FastAPI:
@@ -55,6 +66,7 @@ def create_application() -> FastAPI:
         docs_url="/docs" if settings.is_development else None,
         redoc_url="/redoc" if settings.is_development else None,
         openapi_url="/openapi.json" if settings.is_development else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -7,7 +7,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import CurrentUser
+from app.coach_ai.context_builder import invalidate_cached_context
 from app.database import get_session
+from app.dependencies import RedisClient
 
 from .calculator import calculate_bmr, calculate_macro_targets, calculate_tdee
 from .schemas import (
@@ -28,6 +30,7 @@ async def create_nutrition_day(
     data: NutritionDayCreate,
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis_client: RedisClient,
 ) -> NutritionDayResponse:
     """Create or update nutrition for a day.
 
@@ -35,7 +38,8 @@ async def create_nutrition_day(
     """
     service = NutritionService(session)
     nutrition = await service.create_or_update(current_user.id, data)
-    return NutritionDayResponse.model_validate(nutrition, from_attributes=True)
+    await invalidate_cached_context(current_user.id, redis_client)
+    return NutritionDayResponse.from_row(nutrition)
 
 
 @router.get("/day", response_model=NutritionDayResponse | None)
@@ -51,7 +55,7 @@ async def get_nutrition_day(
     service = NutritionService(session)
     nutrition = await service.get_by_date(current_user.id, target_date)
     if nutrition:
-        return NutritionDayResponse.model_validate(nutrition, from_attributes=True)
+        return NutritionDayResponse.from_row(nutrition)
     return None
 
 
@@ -93,7 +97,7 @@ async def get_nutrition_range(
     else:
         items = await service.get_by_date_range(current_user.id, from_date, to_date)
         return NutritionListResponse(
-            items=[NutritionDayResponse.model_validate(n, from_attributes=True) for n in items],
+            items=[NutritionDayResponse.from_row(n) for n in items],
             total=len(items),
             from_date=from_date,
             to_date=to_date,
@@ -104,11 +108,13 @@ async def get_nutrition_range(
 async def delete_nutrition_day(
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis_client: RedisClient,
     target_date: Annotated[date, Query(alias="date")],
 ) -> None:
     """Delete nutrition for a specific date."""
     service = NutritionService(session)
     deleted = await service.delete_by_date(current_user.id, target_date)
+    await invalidate_cached_context(current_user.id, redis_client)
     if not deleted:
         raise HTTPException(status_code=404, detail="Nutrition entry not found")
 
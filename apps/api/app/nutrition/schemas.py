@@ -2,9 +2,15 @@
 
 import uuid
 from datetime import date, datetime
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
+from .models import NutritionSource
+
+if TYPE_CHECKING:
+    from .models import NutritionDay
+
 
 class NutritionDayCreate(BaseModel):
     """Create or update nutrition for a day."""
@@ -33,6 +39,30 @@ class NutritionDayResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_row(cls, day: "NutritionDay") -> "NutritionDayResponse":
+        """Build a response from a nutrition row without re-validating it.
+
+        Args:
+            day: The nutrition day row.
+
+        Returns:
+            The nutrition day response.
+        """
+        return cls.model_construct(
+            id=day.id,
+            date=day.date,
+            calories=day.calories,
+            protein_g=None if day.protein_g is None else float(day.protein_g),
+            carbs_g=None if day.carbs_g is None else float(day.carbs_g),
+            fat_g=None if day.fat_g is None else float(day.fat_g),
+            fiber_g=None if day.fiber_g is None else float(day.fiber_g),
+            source=NutritionSource(day.source).value,
+            notes=day.notes,
+            created_at=day.created_at,
+            updated_at=day.updated_at,
+        )
+
 
 class NutritionListResponse(BaseModel):
     """List of nutrition days response."""
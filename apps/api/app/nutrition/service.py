@@ -1,9 +1,11 @@
 """Nutrition business logic service."""
 
 import uuid
+from collections.abc import Sequence
 from datetime import date, datetime
+from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import Float, Row, bindparam, cast, func, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -12,6 +14,26 @@ from app.integrations.mfp_parser import MFPParseResult, parse_mfp_zip
 from .models import NutritionDay, NutritionSource
 from .schemas import MFPImportResponse, NutritionDayCreate
 
+# Read on every coach context build; as a lambda statement it is compiled once
+# and only the bound values change per call
+_macros_between = lambda_stmt(
+    lambda: (
+        select(  # type: ignore[call-overload]
+            NutritionDay.date,
+            NutritionDay.calories,
+            cast(NutritionDay.protein_g, Float).label("protein_g"),
+            cast(NutritionDay.carbs_g, Float).label("carbs_g"),
+            cast(NutritionDay.fat_g, Float).label("fat_g"),
+        )
+        .where(
+            NutritionDay.user_id == bindparam("user_id"),
+            NutritionDay.date >= bindparam("from_date"),
+            NutritionDay.date <= bindparam("to_date"),
+        )
+        .order_by(NutritionDay.date.desc())  # type: ignore[attr-defined]
+    )
+)
+
 
 class NutritionService:
     """Nutrition service."""
@@ -110,6 +132,31 @@ class NutritionService:
         )
         return list(result.scalars().all())
 
+    async def get_macros_by_date_range(
+        self,
+        user_id: uuid.UUID,
+        from_date: date,
+        to_date: date,
+    ) -> Sequence[Row[Any]]:
+        """Get daily calories and macros within date range, newest first.
+
+        Returns plain rows rather than NutritionDay instances, with the macro
+        columns cast to floats by the database.
+
+        Args:
+            user_id: The user's unique identifier.
+            from_date: Start date (inclusive).
+            to_date: End date (inclusive).
+
+        Returns:
+            Rows of date, calories, protein_g, carbs_g and fat_g.
+        """
+        result = await self.session.execute(
+            _macros_between,
+            {"user_id": user_id, "from_date": from_date, "to_date": to_date},
+        )
+        return result.all()
+
     async def get_aggregated_stats(
         self,
         user_id: uuid.UUID,
@@ -8,7 +8,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import CurrentUser
 from app.auth.schemas import MessageResponse
+from app.coach_ai.context_builder import invalidate_cached_context
 from app.database import get_session
+from app.dependencies import RedisClient
 
 from .consent_service import UserConsentService
 from .models import ConsentType, UserConsent
@@ -91,6 +93,7 @@ async def update_profile(
     data: UserProfileUpdate,
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis_client: RedisClient,
 ) -> UserProfileResponse:
     """Update current user's profile.
 
@@ -99,6 +102,7 @@ async def update_profile(
     """
     service = UserService(session)
     profile = await service.update_profile(current_user.id, data)
+    await invalidate_cached_context(current_user.id, redis_client)
 
     return UserProfileResponse(
         display_name=profile.display_name,
@@ -115,6 +119,7 @@ async def update_goals(
     data: UserGoalUpdate,
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis_client: RedisClient,
 ) -> UserGoalResponse:
     """Update current user's goals.
 
@@ -123,6 +128,7 @@ async def update_goals(
     """
     service = UserService(session)
     goal = await service.update_goal(current_user.id, data)
+    await invalidate_cached_context(current_user.id, redis_client)
 
     return UserGoalResponse(
         goal_type=goal.goal_type,
@@ -137,6 +143,7 @@ async def update_preferences(
     data: DietPreferencesUpdate,
     current_user: CurrentUser,
     session: Annotated[AsyncSession, Depends(get_session)],
+    redis_client: RedisClient,
 ) -> DietPreferencesResponse:
     """Update current user's diet preferences.
 
@@ -145,6 +152,7 @@ async def update_preferences(
     """
     service = UserService(session)
     preferences = await service.update_preferences(current_user.id, data)
+    await invalidate_cached_context(current_user.id, redis_client)
 
     return DietPreferencesResponse(
         diet_type=preferences.diet_type,
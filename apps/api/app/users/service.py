@@ -5,7 +5,7 @@ from datetime import datetime
 
 from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
 from sqlmodel import select
 
 from app.checkins.models import CheckIn
@@ -42,13 +42,16 @@ class UserService:
         Returns:
             User with loaded relations or None if not found.
         """
+        # Each relation is one-to-one, so joining them returns a single row and
+        # loads everything in one round trip; any other relation access raises
         result = await self.session.execute(
             select(User)
             .where(User.id == user_id)
             .options(
-                selectinload(User.profile),  # type: ignore[arg-type]
-                selectinload(User.goal),  # type: ignore[arg-type]
-                selectinload(User.diet_preferences),  # type: ignore[arg-type]
+                joinedload(User.profile),  # type: ignore[arg-type]
+                joinedload(User.goal),  # type: ignore[arg-type]
+                joinedload(User.diet_preferences),  # type: ignore[arg-type]
+                raiseload("*"),
             )
         )
         return result.scalar_one_or_none()
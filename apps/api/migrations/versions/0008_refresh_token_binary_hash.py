@@ -0,0 +1,58 @@
+"""Store refresh token hashes as binary digests.
+
+Revision ID: 0008_refresh_token_binary_hash
+Revises: 0007_consent_tracking
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_refresh_token_binary_hash"
+down_revision: str | None = "0007_consent_tracking"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Switch token_hash to a 16-byte BLAKE2b digest with a partial index."""
+    # Existing SHA-256 hex hashes cannot be converted to BLAKE2b without the raw
+    # tokens, so outstanding refresh tokens are dropped and clients must log in again.
+    op.execute("DELETE FROM refresh_token")
+
+    op.drop_index("ix_refresh_token_token_hash", table_name="refresh_token")
+    op.alter_column(
+        "refresh_token",
+        "token_hash",
+        type_=sa.LargeBinary(16),
+        existing_type=sa.String(255),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+    op.create_index(
+        "ix_refresh_token_active",
+        "refresh_token",
+        ["token_hash"],
+        unique=True,
+        postgresql_where=sa.text("revoked_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Restore hex string token hashes with a plain index."""
+    op.execute("DELETE FROM refresh_token")
+
+    op.drop_index("ix_refresh_token_active", table_name="refresh_token")
+    op.alter_column(
+        "refresh_token",
+        "token_hash",
+        type_=sa.String(255),
+        existing_type=sa.LargeBinary(16),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
+    op.create_index("ix_refresh_token_token_hash", "refresh_token", ["token_hash"])
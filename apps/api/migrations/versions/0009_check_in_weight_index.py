@@ -0,0 +1,36 @@
+"""Add a covering index for the weight trend query.
+
+Revision ID: 0009_check_in_weight_index
+Revises: 0008_refresh_token_binary_hash
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0009_check_in_weight_index"
+down_revision: str | None = "0008_refresh_token_binary_hash"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add a partial (user_id, date) index that includes weight_kg."""
+    # Weight trends only read check-ins with a weight, so the index skips the
+    # rest and carries weight_kg for an index-only scan
+    op.create_index(
+        "ix_check_in_user_date_weight",
+        "check_in",
+        ["user_id", "date"],
+        postgresql_include=["weight_kg"],
+        postgresql_where=sa.text("weight_kg IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Remove the weight trend index."""
+    op.drop_index("ix_check_in_user_date_weight", table_name="check_in")
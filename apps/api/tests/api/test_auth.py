@@ -1,7 +1,14 @@
 """API tests for authentication endpoints."""
 
+import time
+from unittest.mock import patch
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.auth.models import RefreshToken
 
 
 @pytest.mark.asyncio
@@ -280,3 +287,43 @@ async def test_logout_all(client: AsyncClient) -> None:
 
     assert response1.status_code == 401
     assert response2.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_logout_all_revokes_access_tokens(client: AsyncClient) -> None:
+    """Test that access tokens issued before logout-all are rejected."""
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "revokeaccess@example.com", "password": "SecurePass123!"},
+    )
+    headers = {"Authorization": f"Bearer {register_response.json()['access_token']}"}
+    assert (await client.get("/api/v1/me", headers=headers)).status_code == 200
+
+    # Log out a second later so the token's iat falls before the cutoff
+    with patch("app.auth.revocation.time.time", return_value=time.time() + 1):
+        logout_response = await client.post("/api/v1/auth/logout-all", headers=headers)
+        assert logout_response.status_code == 200
+
+        me_response = await client.get("/api/v1/me", headers=headers)
+    assert me_response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_records_client_info(client: AsyncClient, db_session: AsyncSession) -> None:
+    """Test that login stores the client user agent with the refresh token."""
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "clientinfo@example.com", "password": "SecurePass123!"},
+    )
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "clientinfo@example.com", "password": "SecurePass123!"},
+        headers={"User-Agent": "SleekCoach/1.0"},
+    )
+    assert response.status_code == 200
+
+    result = await db_session.execute(
+        select(RefreshToken).where(RefreshToken.user_agent == "SleekCoach/1.0")
+    )
+    assert result.scalar_one_or_none() is not None
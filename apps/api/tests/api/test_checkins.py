@@ -131,6 +131,38 @@ async def test_list_checkins(client: AsyncClient) -> None:
     assert data["total"] == 5
 
 
+@pytest.mark.asyncio
+async def test_list_checkins_keyset_pagination(client: AsyncClient) -> None:
+    """Test paging through check-ins with the keyset cursor."""
+    headers = await get_auth_headers(client, "checkin_keyset@example.com")
+    today = date.today()
+    for i in range(5):
+        await client.post(
+            "/api/v1/checkins",
+            headers=headers,
+            json={"date": str(today - timedelta(days=i)), "weight_kg": 75.0},
+        )
+
+    first = (await client.get("/api/v1/checkins", headers=headers, params={"limit": 3})).json()
+    assert [item["date"] for item in first["items"]] == [
+        str(today - timedelta(days=i)) for i in range(3)
+    ]
+    assert first["next_before"] == str(today - timedelta(days=2))
+
+    second = (
+        await client.get(
+            "/api/v1/checkins",
+            headers=headers,
+            params={"limit": 3, "before": first["next_before"]},
+        )
+    ).json()
+    assert [item["date"] for item in second["items"]] == [
+        str(today - timedelta(days=i)) for i in range(3, 5)
+    ]
+    assert second["total"] == 2
+    assert second["next_before"] is None
+
+
 @pytest.mark.asyncio
 async def test_list_checkins_with_date_range(client: AsyncClient) -> None:
     """Test listing check-ins with date range filter."""
@@ -277,6 +309,50 @@ async def test_get_weight_trends_empty(client: AsyncClient) -> None:
     assert data["start_weight"] is None
 
 
+@pytest.mark.asyncio
+async def test_get_checkin_dashboard(client: AsyncClient) -> None:
+    """Test that the dashboard matches the latest and trends endpoints."""
+    headers = await get_auth_headers(client, "checkin_dashboard@example.com")
+    today = date.today()
+
+    for i in range(5):
+        await client.post(
+            "/api/v1/checkins",
+            headers=headers,
+            json={"date": str(today - timedelta(days=4 - i)), "weight_kg": 80.0 - i},
+        )
+    # The latest check-in need not carry a weight
+    await client.post(
+        "/api/v1/checkins",
+        headers=headers,
+        json={"date": str(today + timedelta(days=1)), "mood": 4},
+    )
+
+    response = await client.get("/api/v1/checkins/dashboard", headers=headers)
+    latest = await client.get("/api/v1/checkins/latest", headers=headers)
+    trends = await client.get("/api/v1/checkins/trends", headers=headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["latest"] == latest.json()
+    assert data["latest"]["mood"] == 4
+    assert data["trend"] == trends.json()
+    assert len(data["trend"]["data"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_get_checkin_dashboard_empty(client: AsyncClient) -> None:
+    """Test the dashboard for a user with no check-ins."""
+    headers = await get_auth_headers(client, "dashboard_empty@example.com")
+
+    response = await client.get("/api/v1/checkins/dashboard", headers=headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["latest"] is None
+    assert data["trend"]["data"] == []
+
+
 @pytest.mark.asyncio
 async def test_sync_checkins(client: AsyncClient) -> None:
     """Test batch syncing check-ins."""
@@ -4,8 +4,8 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Any
 
+import jwt
 import pytest
-from jose import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
@@ -69,7 +69,7 @@ def create_token_wrong_secret(valid_user_id: uuid.UUID) -> str:
         "iat": datetime.utcnow(),
         "jti": secrets.token_urlsafe(16),
     }
-    return jwt.encode(payload, "wrong-secret-key", algorithm="HS256")
+    return jwt.encode(payload, "wrong-secret-key-of-at-least-32-bytes", algorithm="HS256")
 
 
 @pytest.fixture
@@ -0,0 +1,180 @@
+"""Unit tests for authentication dependencies."""
+
+import time
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth import dependencies
+from app.auth.dependencies import (
+    clear_token_cache,
+    get_current_token_payload,
+    get_current_user,
+    get_token_from_header,
+)
+from app.auth.tokens import (
+    TokenPayload,
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+    hash_token,
+)
+from app.exceptions import UnauthorizedError
+from app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    """Start every test with an empty token cache."""
+    clear_token_cache()
+
+
+class TestTokenPayloadCache:
+    """Tests for the decoded token cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_token_decoded_once(self) -> None:
+        """Test that a repeated bearer token skips decoding."""
+        token, _ = create_access_token(uuid.uuid4(), "test@example.com")
+
+        with patch("app.auth.dependencies.decode_token", wraps=decode_token) as mock_decode:
+            first = await get_current_token_payload(f"Bearer {token}")
+            second = await get_current_token_payload(f"Bearer {token}")
+
+        assert first == second
+        assert mock_decode.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_not_cached(self) -> None:
+        """Test that invalid tokens are rejected every time."""
+        with patch("app.auth.dependencies.decode_token", return_value=None) as mock_decode:
+            for _ in range(2):
+                with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
+                    await get_current_token_payload("Bearer invalid.token.here")
+
+        assert mock_decode.call_count == 2
+        assert len(dependencies._token_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_not_cached(self) -> None:
+        """Test that refresh tokens are rejected and not cached."""
+        token, _, _ = create_refresh_token(uuid.uuid4(), "test@example.com")
+
+        with pytest.raises(UnauthorizedError, match="Invalid token type"):
+            await get_current_token_payload(f"Bearer {token}")
+
+        assert len(dependencies._token_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self) -> None:
+        """Test that the cache evicts the oldest entries past maxsize."""
+        with patch.object(dependencies, "_TOKEN_CACHE_MAXSIZE", 2):
+            for _ in range(3):
+                token, _ = create_access_token(uuid.uuid4(), "test@example.com")
+                await get_current_token_payload(f"Bearer {token}")
+
+        assert len(dependencies._token_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self) -> None:
+        """Test that a token is decoded again once its cache entry expires."""
+        token, _ = create_access_token(uuid.uuid4(), "test@example.com")
+        start = time.time()
+
+        with patch("app.auth.dependencies.decode_token", wraps=decode_token) as mock_decode:
+            with patch("app.auth.dependencies.time.time", return_value=start):
+                await get_current_token_payload(f"Bearer {token}")
+            with patch(
+                "app.auth.dependencies.time.time",
+                return_value=start + dependencies._TOKEN_CACHE_TTL_SECONDS + 1,
+            ):
+                await get_current_token_payload(f"Bearer {token}")
+
+        assert mock_decode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_at_token_exp(self) -> None:
+        """Test that a token expiring before the TTL is cached only until exp."""
+        now = datetime.now()
+        payload = TokenPayload(
+            sub=uuid.uuid4(),
+            email="test@example.com",
+            token_type="access",
+            exp=now + timedelta(seconds=60),
+            iat=now,
+            jti="jti",
+        )
+
+        with patch("app.auth.dependencies.decode_token", return_value=payload):
+            await get_current_token_payload("Bearer short.lived.token")
+
+        expires_at, _ = dependencies._token_cache[hash_token("short.lived.token")]
+        assert expires_at == pytest.approx(payload.exp.timestamp())
+        assert expires_at < time.time() + dependencies._TOKEN_CACHE_TTL_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_cached_payload_is_immutable(self) -> None:
+        """Test that a shared cached payload cannot be mutated by callers."""
+        token, _ = create_access_token(uuid.uuid4(), "test@example.com")
+        payload = await get_current_token_payload(f"Bearer {token}")
+
+        with pytest.raises(ValidationError):
+            payload.sub = uuid.uuid4()  # type: ignore[misc]
+
+
+class TestGetTokenFromHeader:
+    """Tests for Bearer token extraction."""
+
+    def test_extracts_bearer_token(self) -> None:
+        """Test that the token is extracted from a Bearer header."""
+        assert get_token_from_header("Bearer abc.def.ghi") == "abc.def.ghi"
+
+    def test_missing_header(self) -> None:
+        """Test that a missing header is rejected."""
+        with pytest.raises(UnauthorizedError, match="Missing authorization header"):
+            get_token_from_header(None)
+
+    def test_wrong_scheme(self) -> None:
+        """Test that non-Bearer schemes are rejected."""
+        with pytest.raises(UnauthorizedError, match="Invalid authorization header format"):
+            get_token_from_header("Basic abc")
+
+
+class TestGetCurrentUser:
+    """Tests for the current user lookup."""
+
+    @pytest.mark.asyncio
+    async def test_loads_only_needed_columns(self, db_session: AsyncSession) -> None:
+        """Test that the password hash and relationships are not loaded."""
+        user = User(email="test@example.com", hashed_password="hashed")
+        db_session.add(user)
+        await db_session.commit()
+        db_session.expunge_all()
+
+        token, _ = create_access_token(user.id, user.email)
+        payload = await get_current_token_payload(f"Bearer {token}")
+        current_user = await get_current_user(payload, db_session)
+
+        loaded = inspect(current_user).dict
+        assert current_user.id == user.id
+        assert current_user.email == "test@example.com"
+        assert "hashed_password" not in loaded
+        assert "profile" not in loaded
+
+    @pytest.mark.asyncio
+    async def test_inactive_user_rejected(self, db_session: AsyncSession) -> None:
+        """Test that inactive users are rejected."""
+        user = User(email="inactive@example.com", hashed_password="hashed", is_active=False)
+        db_session.add(user)
+        await db_session.commit()
+
+        token, _ = create_access_token(user.id, user.email)
+        payload = await get_current_token_payload(f"Bearer {token}")
+
+        with pytest.raises(UnauthorizedError, match="User not found or inactive"):
+            await get_current_user(payload, db_session)
@@ -7,7 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.models import RefreshToken
+from app.auth.password import DUMMY_PASSWORD_HASH
 from app.auth.schemas import LoginRequest, RegisterRequest
 from app.auth.service import AuthService
 from app.exceptions import ConflictError, UnauthorizedError
@@ -31,10 +31,12 @@ class TestAuthServiceRegister:
     def mock_session(self) -> AsyncMock:
         """Create a mock database session."""
         session = AsyncMock(spec=AsyncSession)
-        # Mock the execute result for checking existing user
+        # Mock the INSERT ... RETURNING result for the new user
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        session.execute.return_value = mock_result
+        mock_result.one_or_none.return_value = User(
+            email="test@example.com", hashed_password="hashed"
+        )
+        session.scalars.return_value = mock_result
         return session
 
     @pytest.mark.asyncio
@@ -43,12 +45,14 @@ class TestAuthServiceRegister:
         service = AuthService(mock_session)
         data = RegisterRequest(email="test@example.com", password="SecurePass123!")
 
-        with patch("app.auth.service.hash_password", return_value="hashed"):
+        with patch(
+            "app.auth.service.ahash_password", new_callable=AsyncMock, return_value="hashed"
+        ):
             with patch("app.auth.service.create_token_pair") as mock_create:
                 mock_create.return_value = (
                     MagicMock(access_token="access", refresh_token="refresh"),
                     datetime.utcnow() + timedelta(days=7),
-                    "refresh_hash",
+                    b"refresh_hash",
                 )
                 _user, _token_pair = await service.register(data)
 
@@ -59,36 +63,42 @@ class TestAuthServiceRegister:
     async def test_register_conflict_existing_email(self) -> None:
         """Test that register raises ConflictError for existing email."""
         mock_session = AsyncMock(spec=AsyncSession)
-        # Mock finding existing user
+        # ON CONFLICT DO NOTHING returns no row for an existing email
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = User(
-            email="test@example.com", hashed_password="hash"
-        )
-        mock_session.execute.return_value = mock_result
+        mock_result.one_or_none.return_value = None
+        mock_session.scalars.return_value = mock_result
 
         service = AuthService(mock_session)
         data = RegisterRequest(email="test@example.com", password="SecurePass123!")
 
-        with pytest.raises(ConflictError, match="Email already registered"):
+        with (
+            patch("app.auth.service.ahash_password", new_callable=AsyncMock, return_value="hashed"),
+            pytest.raises(ConflictError, match="Email already registered"),
+        ):
             await service.register(data)
 
+        assert not mock_session.commit.called
+
     @pytest.mark.asyncio
     async def test_register_normalizes_email(self, mock_session: AsyncMock) -> None:
         """Test that register normalizes email to lowercase."""
         service = AuthService(mock_session)
         data = RegisterRequest(email="TEST@EXAMPLE.COM", password="SecurePass123!")
 
-        with patch("app.auth.service.hash_password", return_value="hashed"):
+        with patch(
+            "app.auth.service.ahash_password", new_callable=AsyncMock, return_value="hashed"
+        ):
             with patch("app.auth.service.create_token_pair") as mock_create:
                 mock_create.return_value = (
                     MagicMock(access_token="access", refresh_token="refresh"),
                     datetime.utcnow() + timedelta(days=7),
-                    "refresh_hash",
+                    b"refresh_hash",
                 )
                 await service.register(data)
 
-        # Check the query used lowercase email
-        # The select statement should query with lowercase email
+        # Check the insert used the lowercase email
+        insert_stmt = mock_session.scalars.call_args.args[0]
+        assert insert_stmt.compile().params["email"] == "test@example.com"
 
 
 class TestAuthServiceLogin:
@@ -113,12 +123,12 @@ class TestAuthServiceLogin:
         service = AuthService(mock_session)
         data = LoginRequest(email="test@example.com", password="correct_password")
 
-        with patch("app.auth.service.verify_password", return_value=True):
+        with patch("app.auth.service.averify_password", new_callable=AsyncMock, return_value=True):
             with patch("app.auth.service.create_token_pair") as mock_create:
                 mock_create.return_value = (
                     MagicMock(access_token="access", refresh_token="refresh"),
                     datetime.utcnow() + timedelta(days=7),
-                    "refresh_hash",
+                    b"refresh_hash",
                 )
                 user, _token_pair = await service.login(data)
 
@@ -136,7 +146,7 @@ class TestAuthServiceLogin:
         service = AuthService(mock_session)
         data = LoginRequest(email="test@example.com", password="wrong_password")
 
-        with patch("app.auth.service.verify_password", return_value=False):
+        with patch("app.auth.service.averify_password", new_callable=AsyncMock, return_value=False):
             with pytest.raises(UnauthorizedError, match="Invalid email or password"):
                 await service.login(data)
 
@@ -151,7 +161,36 @@ class TestAuthServiceLogin:
         service = AuthService(mock_session)
         data = LoginRequest(email="unknown@example.com", password="password")
 
-        with pytest.raises(UnauthorizedError, match="Invalid email or password"):
+        with (
+            patch(
+                "app.auth.service.averify_password", new_callable=AsyncMock, return_value=False
+            ) as mock_verify,
+            pytest.raises(UnauthorizedError, match="Invalid email or password"),
+        ):
+            await service.login(data)
+
+        # A dummy hash is still verified so timing doesn't reveal unknown emails
+        mock_verify.assert_awaited_once_with("password", DUMMY_PASSWORD_HASH)
+
+    @pytest.mark.asyncio
+    async def test_login_releases_connection_before_verify(self, mock_user: User) -> None:
+        """Test that the read transaction ends before the Argon2 verify runs."""
+        mock_session = AsyncMock(spec=AsyncSession)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = mock_user
+        mock_session.execute.return_value = mock_result
+
+        service = AuthService(mock_session)
+        data = LoginRequest(email="test@example.com", password="wrong_password")
+
+        async def verify(*_args: object) -> bool:
+            assert mock_session.commit.await_count == 1
+            return False
+
+        with (
+            patch("app.auth.service.averify_password", side_effect=verify),
+            pytest.raises(UnauthorizedError),
+        ):
             await service.login(data)
 
     @pytest.mark.asyncio
@@ -166,7 +205,7 @@ class TestAuthServiceLogin:
         service = AuthService(mock_session)
         data = LoginRequest(email="test@example.com", password="correct_password")
 
-        with patch("app.auth.service.verify_password", return_value=True):
+        with patch("app.auth.service.averify_password", new_callable=AsyncMock, return_value=True):
             with pytest.raises(UnauthorizedError, match="Account is disabled"):
                 await service.login(data)
 
@@ -215,7 +254,7 @@ class TestAuthServiceRefreshTokens:
 
         with patch("app.auth.service.decode_token") as mock_decode:
             mock_decode.return_value = MagicMock(token_type="refresh")
-            with patch("app.auth.service.hash_token", return_value="hashed"):
+            with patch("app.auth.service.hash_token", return_value=b"hashed"):
                 with pytest.raises(UnauthorizedError, match="Refresh token is invalid or expired"):
                     await service.refresh_tokens("valid_format_token")
 
@@ -224,15 +263,9 @@ class TestAuthServiceRefreshTokens:
         """Test successful token refresh."""
         mock_session = AsyncMock(spec=AsyncSession)
 
-        # Create mock stored token
-        stored_token = MagicMock(spec=RefreshToken)
-        stored_token.is_valid = True
-        stored_token.user_id = mock_user.id
-        stored_token.revoked_at = None
-
-        # First call returns stored token, second returns user
+        # First call revokes the stored token and returns its user_id, second returns user
         mock_result_token = MagicMock()
-        mock_result_token.scalar_one_or_none.return_value = stored_token
+        mock_result_token.scalar_one_or_none.return_value = mock_user.id
 
         mock_result_user = MagicMock()
         mock_result_user.scalar_one_or_none.return_value = mock_user
@@ -243,17 +276,19 @@ class TestAuthServiceRefreshTokens:
 
         with patch("app.auth.service.decode_token") as mock_decode:
             mock_decode.return_value = MagicMock(token_type="refresh")
-            with patch("app.auth.service.hash_token", return_value="hashed"):
+            with patch("app.auth.service.hash_token", return_value=b"hashed"):
                 with patch("app.auth.service.create_token_pair") as mock_create:
                     mock_create.return_value = (
                         MagicMock(access_token="new_access", refresh_token="new_refresh"),
                         datetime.utcnow() + timedelta(days=7),
-                        "new_hash",
+                        b"new_hash",
                     )
                     _token_pair = await service.refresh_tokens("valid_token")
 
-        # Verify old token was revoked
-        assert stored_token.revoked_at is not None
+        # Verify old token was revoked via a single UPDATE ... RETURNING
+        revoke_stmt = mock_session.execute.call_args_list[0].args[0]
+        assert revoke_stmt.is_dml
+        assert "revoked_at" in str(revoke_stmt)
         assert mock_session.commit.called
 
 
@@ -262,76 +297,47 @@ class TestAuthServiceLogout:
 
     @pytest.mark.asyncio
     async def test_logout_revokes_token(self) -> None:
-        """Test that logout revokes the token."""
+        """Test that logout revokes the token in one UPDATE."""
         mock_session = AsyncMock(spec=AsyncSession)
-
-        stored_token = MagicMock(spec=RefreshToken)
-        stored_token.revoked_at = None
-
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = stored_token
+        mock_result.rowcount = 1
         mock_session.execute.return_value = mock_result
 
         service = AuthService(mock_session)
 
-        with patch("app.auth.service.hash_token", return_value="hashed"):
+        with patch("app.auth.service.hash_token", return_value=b"hashed"):
             await service.logout("some_token")
 
-        assert stored_token.revoked_at is not None
+        assert mock_session.execute.call_count == 1
+        assert mock_session.execute.call_args.args[0].is_dml
         assert mock_session.commit.called
 
     @pytest.mark.asyncio
     async def test_logout_token_not_found(self) -> None:
-        """Test logout when token not found (no error)."""
+        """Test logout when no active token matches (unknown or already revoked)."""
         mock_session = AsyncMock(spec=AsyncSession)
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
+        mock_result.rowcount = 0
         mock_session.execute.return_value = mock_result
 
         service = AuthService(mock_session)
 
-        with patch("app.auth.service.hash_token", return_value="hashed"):
+        with patch("app.auth.service.hash_token", return_value=b"hashed"):
             await service.logout("unknown_token")
 
         # Should not raise, just silently complete
         assert not mock_session.commit.called
 
-    @pytest.mark.asyncio
-    async def test_logout_already_revoked(self) -> None:
-        """Test logout when token already revoked."""
-        mock_session = AsyncMock(spec=AsyncSession)
-
-        stored_token = MagicMock(spec=RefreshToken)
-        stored_token.revoked_at = datetime.utcnow()  # Already revoked
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = stored_token
-        mock_session.execute.return_value = mock_result
-
-        service = AuthService(mock_session)
-
-        with patch("app.auth.service.hash_token", return_value="hashed"):
-            await service.logout("some_token")
-
-        # Should not commit since token was already revoked
-        assert not mock_session.commit.called
-
 
 class TestAuthServiceLogoutAll:
     """Tests for AuthService.logout_all method."""
 
     @pytest.mark.asyncio
     async def test_logout_all_revokes_all_tokens(self) -> None:
-        """Test that logout_all revokes all user tokens."""
+        """Test that logout_all revokes all user tokens in one UPDATE."""
         mock_session = AsyncMock(spec=AsyncSession)
-
-        token1 = MagicMock(spec=RefreshToken)
-        token1.revoked_at = None
-        token2 = MagicMock(spec=RefreshToken)
-        token2.revoked_at = None
-
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [token1, token2]
+        mock_result.rowcount = 2
         mock_session.execute.return_value = mock_result
 
         service = AuthService(mock_session)
@@ -340,8 +346,8 @@ class TestAuthServiceLogoutAll:
         count = await service.logout_all(user_id)
 
         assert count == 2
-        assert token1.revoked_at is not None
-        assert token2.revoked_at is not None
+        assert mock_session.execute.call_count == 1
+        assert mock_session.execute.call_args.args[0].is_dml
         assert mock_session.commit.called
 
     @pytest.mark.asyncio
@@ -349,7 +355,7 @@ class TestAuthServiceLogoutAll:
         """Test logout_all when user has no active tokens."""
         mock_session = AsyncMock(spec=AsyncSession)
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.rowcount = 0
         mock_session.execute.return_value = mock_result
 
         service = AuthService(mock_session)
@@ -380,8 +386,10 @@ class TestAuthServiceChangePassword:
 
         service = AuthService(mock_session)
 
-        with patch("app.auth.service.verify_password", return_value=True):
-            with patch("app.auth.service.hash_password", return_value="new_hash"):
+        with patch("app.auth.service.averify_password", new_callable=AsyncMock, return_value=True):
+            with patch(
+                "app.auth.service.ahash_password", new_callable=AsyncMock, return_value="new_hash"
+            ):
                 await service.change_password(mock_user.id, "old_password", "new_password")
 
         assert mock_user.hashed_password == "new_hash"
@@ -398,7 +406,7 @@ class TestAuthServiceChangePassword:
         service = AuthService(mock_session)
 
         with (
-            patch("app.auth.service.verify_password", return_value=False),
+            patch("app.auth.service.averify_password", new_callable=AsyncMock, return_value=False),
             pytest.raises(UnauthorizedError, match="Current password is incorrect"),
         ):
             await service.change_password(mock_user.id, "wrong_password", "new_password")
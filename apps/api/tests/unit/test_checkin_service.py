@@ -7,7 +7,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.checkins.models import CheckIn
-from app.checkins.schemas import CheckInCreate, CheckInSyncItem
+from app.checkins.schemas import CheckInCreate, CheckInResponse, CheckInSyncItem
 from app.checkins.service import CheckInService
 
 
@@ -77,6 +77,72 @@ async def test_update_existing_checkin(
     assert updated.mood == 5
 
 
+@pytest.mark.asyncio
+async def test_update_keeps_unsent_fields(
+    service: CheckInService,
+    user_id: uuid.UUID,
+) -> None:
+    """Test that an update leaves fields the client didn't send unchanged."""
+    initial = await service.create_or_update(
+        user_id,
+        CheckInCreate(date=date.today(), weight_kg=75.0, notes="Morning weight"),
+    )
+
+    updated = await service.create_or_update(user_id, CheckInCreate(date=date.today(), mood=3))
+
+    assert updated.id == initial.id
+    assert float(updated.weight_kg) == 75.0  # type: ignore[arg-type]
+    assert updated.notes == "Morning weight"
+    assert updated.mood == 3
+    assert updated.updated_at >= initial.updated_at
+
+
+@pytest.mark.asyncio
+async def test_update_sets_naive_utc_updated_at(
+    service: CheckInService,
+    user_id: uuid.UUID,
+) -> None:
+    """Test that updates stamp naive UTC, so sync compares it against client timestamps."""
+    await service.create_or_update(user_id, CheckInCreate(date=date.today(), weight_kg=75.0))
+
+    before = datetime.utcnow()
+    updated = await service.create_or_update(user_id, CheckInCreate(date=date.today(), mood=3))
+    after = datetime.utcnow()
+
+    assert updated.updated_at.tzinfo is None
+    assert before <= updated.updated_at <= after
+
+    results = await service.sync_checkins(
+        user_id,
+        [
+            CheckInSyncItem(
+                date=date.today(),
+                weight_kg=74.0,
+                client_updated_at=updated.updated_at - timedelta(seconds=1),
+            )
+        ],
+    )
+    assert results[0]["status"] == "conflict"
+
+    before = datetime.utcnow()
+    results = await service.sync_checkins(
+        user_id,
+        [
+            CheckInSyncItem(
+                date=date.today(),
+                weight_kg=74.0,
+                client_updated_at=after + timedelta(seconds=1),
+            )
+        ],
+    )
+    after = datetime.utcnow()
+
+    assert results[0]["status"] == "updated"
+    server_version = results[0]["server_version"]
+    assert isinstance(server_version, CheckIn)
+    assert before <= server_version.updated_at <= after
+
+
 @pytest.mark.asyncio
 async def test_get_by_date_range(
     service: CheckInService,
@@ -138,6 +204,30 @@ async def test_get_by_date_range_with_pagination(
     assert len(items) == 3
 
 
+@pytest.mark.asyncio
+async def test_get_by_date_range_offset_past_end(
+    service: CheckInService,
+    user_id: uuid.UUID,
+    db_session: AsyncSession,
+) -> None:
+    """Test that the total is still reported when paging past the last row."""
+    today = date.today()
+    for i in range(3):
+        db_session.add(CheckIn(user_id=user_id, date=today - timedelta(days=i), weight_kg=75.0))
+    await db_session.commit()
+
+    items, total = await service.get_by_date_range(
+        user_id,
+        from_date=today - timedelta(days=30),
+        to_date=today,
+        limit=10,
+        offset=5,
+    )
+
+    assert items == []
+    assert total == 3
+
+
 @pytest.mark.asyncio
 async def test_get_latest(
     service: CheckInService,
@@ -245,6 +335,34 @@ async def test_calculate_weight_trend_moving_average(
     assert abs(trend.data[-1].moving_average_7d - expected_avg) < 0.01
 
 
+@pytest.mark.asyncio
+async def test_calculate_weight_trend_moving_average_window_slides(
+    service: CheckInService,
+    user_id: uuid.UUID,
+    db_session: AsyncSession,
+) -> None:
+    """Test that the moving average only covers the last 7 entries."""
+    today = date.today()
+    weights = [80.0, 80.2, 79.8, 80.1, 79.9, 80.0, 79.7, 79.5, 79.6, 79.2, 79.4]
+
+    for i, weight in enumerate(weights):
+        db_session.add(
+            CheckIn(
+                user_id=user_id,
+                date=today - timedelta(days=len(weights) - 1 - i),
+                weight_kg=weight,
+            )
+        )
+    await db_session.commit()
+
+    trend = await service.calculate_weight_trend(user_id, days=30)
+
+    assert [point.moving_average_7d for point in trend.data[:2]] == [None, None]
+    for i, point in enumerate(trend.data[2:], start=2):
+        window = weights[max(0, i - 6) : i + 1]
+        assert point.moving_average_7d == round(sum(window) / len(window), 2)
+
+
 @pytest.mark.asyncio
 async def test_sync_checkins_create_new(
     service: CheckInService,
@@ -339,6 +457,52 @@ async def test_sync_checkins_update(
     assert float(server_version.weight_kg) == 74.0  # type: ignore[arg-type]
 
 
+@pytest.mark.asyncio
+async def test_sync_checkins_mixed_batch(
+    service: CheckInService,
+    user_id: uuid.UUID,
+    db_session: AsyncSession,
+) -> None:
+    """Test a batch that creates, updates and conflicts in one sync."""
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    older = today - timedelta(days=2)
+    for day in (yesterday, older):
+        db_session.add(CheckIn(user_id=user_id, date=day, weight_kg=75.0, notes="Server"))
+    await db_session.commit()
+
+    server_updated_at = (await service.get_latest(user_id)).updated_at  # type: ignore[union-attr]
+    items = [
+        CheckInSyncItem(date=today, weight_kg=74.0, client_updated_at=datetime.utcnow()),
+        CheckInSyncItem(
+            date=yesterday,
+            weight_kg=74.5,
+            client_updated_at=server_updated_at + timedelta(minutes=5),
+        ),
+        CheckInSyncItem(
+            date=older,
+            weight_kg=73.0,
+            client_updated_at=server_updated_at - timedelta(days=1),
+        ),
+    ]
+
+    results = await service.sync_checkins(user_id, items)
+
+    assert [r["status"] for r in results] == ["created", "updated", "conflict"]
+    created, updated, conflict = (r["server_version"] for r in results)
+    assert isinstance(created, CheckIn)
+    assert isinstance(updated, CheckIn)
+    assert isinstance(conflict, CheckIn)
+    assert float(created.weight_kg) == 74.0  # type: ignore[arg-type]
+    assert float(updated.weight_kg) == 74.5  # type: ignore[arg-type]
+    # Fields the client didn't send are kept
+    assert updated.notes == "Server"
+    assert float(conflict.weight_kg) == 75.0  # type: ignore[arg-type]
+
+    _, total = await service.get_by_date_range(user_id, from_date=older, to_date=today)
+    assert total == 3
+
+
 @pytest.mark.asyncio
 async def test_create_checkin_with_timezone_aware_datetime(
     service: CheckInService,
@@ -435,3 +599,20 @@ async def test_sync_checkins_conflict_with_timezone_aware_datetime(
 
     assert len(results) == 1
     assert results[0]["status"] == "conflict"
+
+
+@pytest.mark.asyncio
+async def test_response_from_row_matches_validation(
+    service: CheckInService,
+    user_id: uuid.UUID,
+) -> None:
+    """Test that the unvalidated fast path builds the same response as validation."""
+    checkin = await service.create_or_update(
+        user_id,
+        CheckInCreate(date=date.today(), weight_kg=75.5, notes="Fast path", mood=4),
+    )
+
+    fast = CheckInResponse.from_row(checkin)
+
+    assert fast == CheckInResponse.model_validate(checkin, from_attributes=True)
+    assert isinstance(fast.weight_kg, float)
@@ -1,6 +1,10 @@
 """Unit tests for CoachOrchestrator."""
 
+import asyncio
+import json
 import uuid
+from collections.abc import AsyncIterator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,7 +12,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.coach_ai.context_builder import CoachContext
 from app.coach_ai.models import AISession, SessionStatus
-from app.coach_ai.orchestrator import CoachOrchestrator, OrchestratorResult
+from app.coach_ai.orchestrator import (
+    CoachOrchestrator,
+    OrchestratorResult,
+    _coalesce_tokens,
+    _providers,
+    close_providers,
+)
 from app.coach_ai.schemas import ChatMessage, DailyTarget, WeeklyPlanResponse
 from app.coach_ai.tools.base import ToolResult
 from tests.fixtures.llm_mocks import MockLLMResponse
@@ -93,12 +103,47 @@ class TestCoachOrchestratorGetProvider:
 
     def test_get_provider_creates_instance(self, orchestrator: CoachOrchestrator) -> None:
         """Test that _get_provider creates provider instance."""
+        _providers.clear()
         with patch("app.coach_ai.orchestrator.get_settings") as mock_settings:
             mock_settings.return_value.openai_api_key = "test-key"
             with patch("app.coach_ai.orchestrator.OpenAIProvider") as mock_provider:
                 _provider = orchestrator._get_provider("standard")
 
                 mock_provider.assert_called_once()
+        _providers.clear()
+
+    def test_get_provider_is_shared_across_orchestrators(self, mock_db_session: AsyncMock) -> None:
+        """Test that providers are reused per tier, so their HTTP clients are too."""
+        _providers.clear()
+        with patch("app.coach_ai.orchestrator.get_settings") as mock_settings:
+            mock_settings.return_value.openai_api_key = "test-key"
+            with patch("app.coach_ai.orchestrator.OpenAIProvider") as mock_provider:
+                mock_provider.side_effect = lambda **_kwargs: MagicMock()
+                first = CoachOrchestrator(mock_db_session)._get_provider("standard")
+                second = CoachOrchestrator(mock_db_session)._get_provider("standard")
+                premium = CoachOrchestrator(mock_db_session)._get_provider("premium")
+
+        _providers.clear()
+        assert first is second
+        assert premium is not first
+        assert mock_provider.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_providers_closes_and_forgets_them(
+        self, mock_db_session: AsyncMock
+    ) -> None:
+        """Test that shutdown closes each shared provider's client."""
+        _providers.clear()
+        with patch("app.coach_ai.orchestrator.get_settings") as mock_settings:
+            mock_settings.return_value.openai_api_key = "test-key"
+            with patch("app.coach_ai.orchestrator.OpenAIProvider") as mock_provider:
+                mock_provider.side_effect = lambda **_kwargs: MagicMock(close=AsyncMock())
+                provider = CoachOrchestrator(mock_db_session)._get_provider("standard")
+
+                await close_providers()
+
+        provider.close.assert_awaited_once()
+        assert _providers == {}
 
 
 class TestCoachOrchestratorGetToolRegistry:
@@ -223,6 +268,91 @@ class TestCoachOrchestratorProcessMessage:
         assert result.response == "Based on your profile, here's my recommendation."
         assert len(result.tool_calls) == 1
         assert result.tool_calls[0]["name"] == "get_user_profile"
+        tool_message = mock_provider.chat.call_args.kwargs["messages"][-1]
+        assert tool_message.role == "tool"
+        assert json.loads(tool_message.content) == {"name": "Test User", "height_cm": 175}
+
+    @pytest.mark.asyncio
+    async def test_process_message_runs_tool_calls_concurrently(
+        self,
+        mock_db_session: AsyncMock,
+        sample_user_id: uuid.UUID,
+        sample_ai_session: AISession,
+        sample_coach_context: CoachContext,
+    ) -> None:
+        """Test that a round's tool calls overlap on their own sessions, in call order."""
+        tool_sessions = [AsyncMock(spec=AsyncSession) for _ in range(2)]
+        session_factory = MagicMock(side_effect=tool_sessions)
+        for tool_session in tool_sessions:
+            tool_session.__aenter__.return_value = tool_session
+        orchestrator = CoachOrchestrator(mock_db_session, session_factory=session_factory)
+
+        running = 0
+        max_running = 0
+        sessions_used: list[AsyncSession] = []
+
+        def build_registry(session: AsyncSession) -> MagicMock:
+            async def execute_tool(
+                tool_name: str, _user_id: str, _arguments: dict[str, object]
+            ) -> ToolResult:
+                nonlocal running, max_running
+                sessions_used.append(session)
+                running += 1
+                max_running = max(max_running, running)
+                # The first call finishes last, so results must be put back in order
+                await asyncio.sleep(0.02 if tool_name == "get_user_profile" else 0.01)
+                running -= 1
+                return ToolResult(success=True, data={"tool": tool_name})
+
+            registry = MagicMock()
+            registry.execute_tool = execute_tool
+            return registry
+
+        tool_calls = [
+            {
+                "id": f"call_{name}",
+                "type": "function",
+                "function": {"name": name, "arguments": "{}"},
+            }
+            for name in ("get_user_profile", "get_recent_checkins")
+        ]
+
+        with patch.object(orchestrator, "_get_provider") as mock_get_provider:
+            mock_provider = AsyncMock()
+            mock_provider.chat = AsyncMock(
+                side_effect=[
+                    MockLLMResponse(
+                        content=None, tool_calls=tool_calls, finish_reason="tool_calls"
+                    ),
+                    MockLLMResponse(content="Done.", tool_calls=None, finish_reason="stop"),
+                ]
+            )
+            mock_get_provider.return_value = mock_provider
+
+            with (
+                patch.object(orchestrator, "_get_tool_registry") as mock_get_registry,
+                patch.object(orchestrator, "_build_tool_registry", side_effect=build_registry),
+                patch.object(orchestrator, "_log_tool_call", new_callable=AsyncMock),
+            ):
+                mock_get_registry.return_value.get_tool_definitions.return_value = []
+                result = await orchestrator.process_message(
+                    user_id=sample_user_id,
+                    message="How am I doing?",
+                    user_context=sample_coach_context,
+                    session=sample_ai_session,
+                )
+
+        assert max_running == 2
+        assert sorted(map(id, sessions_used)) == sorted(map(id, tool_sessions))
+        assert [trace["name"] for trace in result.tool_calls] == [
+            "get_user_profile",
+            "get_recent_checkins",
+        ]
+        final_messages = mock_provider.chat.call_args.kwargs["messages"]
+        assert [m.tool_call_id for m in final_messages if m.role == "tool"] == [
+            "call_get_user_profile",
+            "call_get_recent_checkins",
+        ]
 
     @pytest.mark.asyncio
     async def test_process_message_max_iterations(
@@ -384,6 +514,25 @@ class TestCoachOrchestratorBuildMessages:
         # Should have: system + 6 history + current = 8
         assert len(messages) == 8
 
+    def test_build_messages_limits_history_by_token_budget(
+        self,
+        orchestrator: CoachOrchestrator,
+        sample_coach_context: CoachContext,
+    ) -> None:
+        """Test that long messages are dropped oldest first once over the budget."""
+        history = [
+            ChatMessage(role="user", content="short question"),
+            ChatMessage(role="assistant", content="x" * 5000),
+            ChatMessage(role="user", content="follow-up"),
+            ChatMessage(role="assistant", content="y" * 1500),
+        ]
+
+        messages = orchestrator._build_messages("Current", sample_coach_context, history)
+
+        # The 5000-character reply doesn't fit after the newest two, so it and
+        # everything older are left out
+        assert [m.content for m in messages[1:]] == ["follow-up", "y" * 1500, "Current"]
+
 
 class TestCoachOrchestratorGeneratePlan:
     """Tests for generate_plan method."""
@@ -449,6 +598,100 @@ class TestCoachOrchestratorGeneratePlan:
         assert result.daily_targets.calories > 0
 
 
+class TestCoalesceTokens:
+    """Tests for _coalesce_tokens function."""
+
+    @staticmethod
+    async def _collect(*chunks: str | dict[str, Any]) -> list[str | dict[str, Any]]:
+        async def stream() -> AsyncIterator[str | dict[str, Any]]:
+            for chunk in chunks:
+                yield chunk
+
+        return [chunk async for chunk in _coalesce_tokens(stream())]
+
+    @pytest.mark.asyncio
+    async def test_first_chunk_is_sent_alone_and_the_rest_batched(self) -> None:
+        """Test that the first token goes out at once and later ones are merged."""
+        result = await self._collect("Hi", " there", ",", " how", " are", " you", "?")
+
+        assert result == ["Hi", " there, how are you?"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_size_threshold(self) -> None:
+        """Test that a full buffer is sent without waiting for the stream to end."""
+        result = await self._collect("a", "b" * 20, "c" * 20, "d")
+
+        assert result == ["a", "b" * 20 + "c" * 20, "d"]
+
+    @pytest.mark.asyncio
+    async def test_non_text_chunks_flush_and_pass_through(self) -> None:
+        """Test that buffered text precedes a tool-call chunk, which is kept intact."""
+        tool_calls = {"tool_calls": [{"id": "call_1"}]}
+
+        result = await self._collect("Let", " me", " check", tool_calls)
+
+        assert result == ["Let", " me check", tool_calls]
+
+
+class TestCoachOrchestratorExecuteToolCalls:
+    """Tests for _execute_tool_calls method."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_arguments_not_shared(
+        self,
+        orchestrator: CoachOrchestrator,
+        sample_user_id: uuid.UUID,
+    ) -> None:
+        """Test that identical argument strings parse to independent structures."""
+        registry = MagicMock()
+        registry.execute_tool = AsyncMock(return_value=ToolResult(success=True, data={}))
+        call = {
+            "id": "call_1",
+            "function": {"name": "get_recent_checkins", "arguments": '{"filters": {"days": 7}}'},
+        }
+
+        executed = await orchestrator._execute_tool_calls(
+            registry, sample_user_id, [call, {**call, "id": "call_2"}]
+        )
+
+        (first_args, _, _), (second_args, _, _) = executed
+        assert first_args == second_args == {"filters": {"days": 7}}
+        assert first_args["filters"] is not second_args["filters"]
+
+
+class TestCoachOrchestratorLogToolCall:
+    """Tests for _log_tool_call method."""
+
+    @pytest.mark.asyncio
+    async def test_logs_with_resolved_tool(
+        self,
+        orchestrator: CoachOrchestrator,
+        mock_db_session: AsyncMock,
+        sample_user_id: uuid.UUID,
+    ) -> None:
+        """Test that the caller's tool is used and the input hash fits the column."""
+        tool = MagicMock(category="internal", get_input_summary=MagicMock(return_value="7 days"))
+
+        with patch.object(orchestrator, "_get_tool_registry") as mock_get_registry:
+            await orchestrator._log_tool_call(
+                session_id=uuid.uuid4(),
+                user_id=sample_user_id,
+                tool=tool,
+                tool_name="get_recent_checkins",
+                arguments={"days": 7},
+                result=ToolResult(success=True, data={"count": 3}),
+                output_summary="count: 3",
+                latency_ms=12,
+            )
+
+        mock_get_registry.assert_not_called()
+        log_entry = mock_db_session.add.call_args.args[0]
+        assert log_entry.tool_category == "internal"
+        assert log_entry.input_summary == "7 days"
+        assert log_entry.output_summary == "count: 3"
+        assert len(log_entry.input_hash) == 64
+
+
 class TestCoachOrchestratorSummarizeOutput:
     """Tests for _summarize_output method."""
 
@@ -466,6 +709,15 @@ class TestCoachOrchestratorSummarizeOutput:
         assert "value: 123" in result
         assert "items: 3 items" in result
 
+    def test_summarize_output_dict_first_five_items(self, orchestrator: CoachOrchestrator) -> None:
+        """Test that only the first five dict items are summarized."""
+        data = {f"key{i}": i for i in range(1000)}
+        data["key1"] = (1, 2)
+
+        result = orchestrator._summarize_output(data)
+
+        assert result == "key0: 0, key1: 2 items, key2: 2, key3: 3, key4: 4"
+
     def test_summarize_output_string(self, orchestrator: CoachOrchestrator) -> None:
         """Test summarizing string."""
         result = orchestrator._summarize_output("Simple string")
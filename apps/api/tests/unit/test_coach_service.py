@@ -5,6 +5,7 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.coach_ai.context_builder import CoachContext
@@ -16,6 +17,7 @@ from app.coach_ai.schemas import (
     InsightsResponse,
 )
 from app.coach_ai.service import CoachService
+from app.users.models import User
 
 
 @pytest.fixture
@@ -308,6 +310,7 @@ class TestCoachServiceChat:
         # Session should be updated
         assert sample_ai_session.message_count == initial_count + 2  # User + assistant
         assert len(sample_ai_session.conversation_history) == 2
+        assert sample_ai_session.context_summary == sample_coach_context.get_compact_summary()
         mock_db_session.commit.assert_called()
 
     @pytest.mark.asyncio
@@ -322,9 +325,8 @@ class TestCoachServiceChat:
         service = CoachService(mock_db_session)
 
         # Pre-populate with 22 messages
-        sample_ai_session.conversation_history = [
-            {"role": "user", "content": f"msg{i}"} for i in range(22)
-        ]
+        original_history = [{"role": "user", "content": f"msg{i}"} for i in range(22)]
+        sample_ai_session.conversation_history = original_history
 
         with patch.object(
             service, "_get_or_create_session", new_callable=AsyncMock
@@ -363,6 +365,39 @@ class TestCoachServiceChat:
 
         # Should be trimmed to 12 (6 rounds for token optimization)
         assert len(sample_ai_session.conversation_history) == 12
+        assert sample_ai_session.conversation_history[-2:] == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Response"},
+        ]
+        # A new list is assigned so the JSON column change is flushed
+        assert sample_ai_session.conversation_history is not original_history
+
+
+class TestCoachServiceGetOrCreateSession:
+    """Tests for session creation."""
+
+    @pytest.mark.asyncio
+    async def test_new_session_gets_database_timestamps(self, db_session: AsyncSession) -> None:
+        """Test that a new session's timestamps are set by the database in one INSERT."""
+        user = User(email="coach@example.com", hashed_password="hash")
+        db_session.add(user)
+        await db_session.commit()
+
+        statements: list[str] = []
+
+        def record(*args: object) -> None:
+            statements.append(str(args[2]))
+
+        engine = db_session.bind.sync_engine  # type: ignore[union-attr]
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            ai_session = await CoachService(db_session)._get_or_create_session(user.id, None)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert isinstance(ai_session.started_at, datetime)
+        assert isinstance(ai_session.created_at, datetime)
+        assert not any(s.lstrip().upper().startswith("SELECT") for s in statements)
 
 
 class TestCoachServiceCalculateConfidence:
@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
 
 import pytest
@@ -9,6 +10,9 @@ import pytest
 from app.coach_ai.context_builder import CoachContext, ContextBuilder
 from app.coach_ai.policies.base import UserContext
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 
 class TestCoachContext:
     """Tests for CoachContext dataclass."""
@@ -191,11 +195,10 @@ class TestContextBuilder:
         # Mock all loader methods
         with patch.object(builder, "_load_user_data", new_callable=AsyncMock):
             with patch.object(builder, "_load_checkins", new_callable=AsyncMock):
-                with patch.object(builder, "_load_weight_trend", new_callable=AsyncMock):
-                    with patch.object(builder, "_load_nutrition", new_callable=AsyncMock):
-                        with patch.object(builder, "_load_adherence", new_callable=AsyncMock):
-                            with patch.object(builder, "_load_targets", new_callable=AsyncMock):
-                                context = await builder.build_context(user_id)
+                with patch.object(builder, "_load_nutrition", new_callable=AsyncMock):
+                    with patch.object(builder, "_load_adherence", new_callable=AsyncMock):
+                        with patch.object(builder, "_load_targets", new_callable=AsyncMock):
+                            context = await builder.build_context(user_id)
 
         assert isinstance(context, CoachContext)
         assert context.user_id == user_id
@@ -212,25 +215,22 @@ class TestContextBuilder:
                 builder, "_load_checkins", new_callable=AsyncMock
             ) as mock_load_checkins:
                 with patch.object(
-                    builder, "_load_weight_trend", new_callable=AsyncMock
-                ) as mock_load_trend:
+                    builder, "_load_nutrition", new_callable=AsyncMock
+                ) as mock_load_nutrition:
                     with patch.object(
-                        builder, "_load_nutrition", new_callable=AsyncMock
-                    ) as mock_load_nutrition:
+                        builder, "_load_adherence", new_callable=AsyncMock
+                    ) as mock_load_adherence:
                         with patch.object(
-                            builder, "_load_adherence", new_callable=AsyncMock
-                        ) as mock_load_adherence:
-                            with patch.object(
-                                builder, "_load_targets", new_callable=AsyncMock
-                            ) as mock_load_targets:
-                                await builder.build_context(user_id)
-
-                                mock_load_user.assert_called_once()
-                                mock_load_checkins.assert_called_once()
-                                mock_load_trend.assert_called_once()
-                                mock_load_nutrition.assert_called_once()
-                                mock_load_adherence.assert_called_once()
-                                mock_load_targets.assert_called_once()
+                            builder, "_load_targets", new_callable=AsyncMock
+                        ) as mock_load_targets:
+                            await builder.build_context(user_id)
+
+                            mock_load_user.assert_called_once()
+                            mock_load_checkins.assert_called_once()
+                            assert mock_load_checkins.call_args.kwargs["include_weight_trend"]
+                            mock_load_nutrition.assert_called_once()
+                            mock_load_adherence.assert_called_once()
+                            mock_load_targets.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_build_context_respects_flags(self, builder: ContextBuilder) -> None:
@@ -240,31 +240,30 @@ class TestContextBuilder:
         user_id = uuid.uuid4()
 
         with patch.object(builder, "_load_user_data", new_callable=AsyncMock):
-            with patch.object(builder, "_load_checkins", new_callable=AsyncMock):
+            with patch.object(
+                builder, "_load_checkins", new_callable=AsyncMock
+            ) as mock_load_checkins:
                 with patch.object(
-                    builder, "_load_weight_trend", new_callable=AsyncMock
-                ) as mock_load_trend:
+                    builder, "_load_nutrition", new_callable=AsyncMock
+                ) as mock_load_nutrition:
                     with patch.object(
-                        builder, "_load_nutrition", new_callable=AsyncMock
-                    ) as mock_load_nutrition:
+                        builder, "_load_adherence", new_callable=AsyncMock
+                    ) as mock_load_adherence:
                         with patch.object(
-                            builder, "_load_adherence", new_callable=AsyncMock
-                        ) as mock_load_adherence:
-                            with patch.object(
-                                builder, "_load_targets", new_callable=AsyncMock
-                            ) as mock_load_targets:
-                                await builder.build_context(
-                                    user_id,
-                                    include_nutrition=False,
-                                    include_weight_trend=False,
-                                    include_adherence=False,
-                                    include_targets=False,
-                                )
-
-                                mock_load_trend.assert_not_called()
-                                mock_load_nutrition.assert_not_called()
-                                mock_load_adherence.assert_not_called()
-                                mock_load_targets.assert_not_called()
+                            builder, "_load_targets", new_callable=AsyncMock
+                        ) as mock_load_targets:
+                            await builder.build_context(
+                                user_id,
+                                include_nutrition=False,
+                                include_weight_trend=False,
+                                include_adherence=False,
+                                include_targets=False,
+                            )
+
+                            assert not mock_load_checkins.call_args.kwargs["include_weight_trend"]
+                            mock_load_nutrition.assert_not_called()
+                            mock_load_adherence.assert_not_called()
+                            mock_load_targets.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_load_adherence_calculates_streak(self, builder: ContextBuilder) -> None:
@@ -288,6 +287,25 @@ class TestContextBuilder:
         assert context.adherence_metrics is not None
         assert context.adherence_metrics["current_streak"] == 3
 
+    @pytest.mark.asyncio
+    async def test_load_adherence_streak_ignores_order(self, builder: ContextBuilder) -> None:
+        """Test that the streak doesn't depend on check-in order."""
+        from datetime import date, timedelta
+
+        today = date.today()
+        context = CoachContext(user_id=uuid.uuid4())
+        context.recent_checkins = [
+            {"date": str(today - timedelta(days=2))},
+            {"date": str(today - timedelta(days=6))},
+            {"date": str(today)},
+            {"date": str(today - timedelta(days=1))},
+        ]
+
+        await builder._load_adherence(context, days=14)
+
+        assert context.adherence_metrics is not None
+        assert context.adherence_metrics["current_streak"] == 3
+
     @pytest.mark.asyncio
     async def test_load_adherence_calculates_rates(self, builder: ContextBuilder) -> None:
         """Test that _load_adherence calculates completion rates."""
@@ -311,3 +329,226 @@ class TestContextBuilder:
         assert context.adherence_metrics["weight_logging_rate"] == round(2 / 14, 2)
         # 2 nutrition days / 14 days
         assert context.adherence_metrics["nutrition_logging_rate"] == round(2 / 14, 2)
+
+    @pytest.mark.asyncio
+    async def test_build_context_runs_loaders_concurrently_with_factory(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that loaders overlap when each can get its own session."""
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        builder = ContextBuilder(mock_session, session_factory=MagicMock())
+        events: list[str] = []
+
+        def loader(name: str) -> AsyncMock:
+            async def load(*_args: object, **_kwargs: object) -> None:
+                events.append(f"start {name}")
+                await asyncio.sleep(0)
+                events.append(f"end {name}")
+
+            return AsyncMock(side_effect=load)
+
+        with (
+            patch.object(builder, "_load_user_data", loader("user")),
+            patch.object(builder, "_load_checkins", loader("checkins")),
+            patch.object(builder, "_load_nutrition", loader("nutrition")),
+            patch.object(builder, "_load_adherence", new_callable=AsyncMock),
+            patch.object(builder, "_load_targets", new_callable=AsyncMock),
+        ):
+            await builder.build_context(uuid.uuid4())
+
+        assert events[:3] == ["start user", "start checkins", "start nutrition"]
+
+    @pytest.mark.asyncio
+    async def test_loader_session_uses_factory(self, mock_session: AsyncMock) -> None:
+        """Test that loaders get their own session when a factory is given."""
+        from unittest.mock import MagicMock
+
+        own_session = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__.return_value = own_session
+
+        async with ContextBuilder(mock_session)._loader_session() as session:
+            assert session is mock_session
+        async with ContextBuilder(mock_session, factory)._loader_session() as session:
+            assert session is own_session
+
+
+class TestContextCache:
+    """Tests for cached context builds."""
+
+    @pytest.fixture
+    def redis_store(self) -> dict[str, bytes]:
+        """Backing store for the fake Redis client."""
+        return {}
+
+    @pytest.fixture
+    def redis_client(self, redis_store: dict[str, bytes]) -> AsyncMock:
+        """Create a dict-backed Redis mock."""
+
+        async def get(key: str) -> bytes | None:
+            return redis_store.get(key)
+
+        async def set_(key: str, value: object, ex: int | None = None) -> None:  # noqa: ARG001
+            redis_store[key] = str(value).encode()
+
+        async def setex(key: str, ttl: int, value: str) -> None:  # noqa: ARG001
+            redis_store[key] = value.encode()
+
+        client = AsyncMock()
+        client.get.side_effect = get
+        client.set.side_effect = set_
+        client.setex.side_effect = setex
+        return client
+
+    @pytest.fixture
+    def built_context(self) -> CoachContext:
+        """A context as build_context would return it."""
+        return CoachContext(
+            user_id=uuid.uuid4(),
+            user_profile={"display_name": "Test User", "height_cm": 175.0},
+            recent_checkins=[{"date": "2024-01-15", "weight_kg": 80.0}],
+            weight_trend={"current_weight_kg": 80.0},
+        )
+
+    @pytest.mark.asyncio
+    async def test_second_build_is_served_from_cache(
+        self, redis_client: AsyncMock, built_context: CoachContext
+    ) -> None:
+        """Test that a repeat build reuses the cached context."""
+        from unittest.mock import patch
+
+        builder = ContextBuilder(AsyncMock(), redis_client=redis_client)
+        with patch.object(
+            builder, "build_context", AsyncMock(return_value=built_context)
+        ) as mock_build:
+            first = await builder.build_context_cached(built_context.user_id)
+            second = await builder.build_context_cached(built_context.user_id)
+
+        mock_build.assert_awaited_once()
+        assert first is built_context
+        assert second == built_context
+
+    @pytest.mark.asyncio
+    async def test_invalidation_forces_rebuild(
+        self, redis_client: AsyncMock, built_context: CoachContext
+    ) -> None:
+        """Test that a data change makes the next build skip the cache."""
+        from unittest.mock import patch
+
+        from app.coach_ai.context_builder import invalidate_cached_context
+
+        builder = ContextBuilder(AsyncMock(), redis_client=redis_client)
+        with patch.object(
+            builder, "build_context", AsyncMock(return_value=built_context)
+        ) as mock_build:
+            await builder.build_context_cached(built_context.user_id)
+            await invalidate_cached_context(built_context.user_id, redis_client)
+            await builder.build_context_cached(built_context.user_id)
+
+        assert mock_build.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_flags_are_cached_separately(
+        self, redis_client: AsyncMock, built_context: CoachContext
+    ) -> None:
+        """Test that different include flags don't share a cache entry."""
+        from unittest.mock import patch
+
+        builder = ContextBuilder(AsyncMock(), redis_client=redis_client)
+        with patch.object(
+            builder, "build_context", AsyncMock(return_value=built_context)
+        ) as mock_build:
+            await builder.build_context_cached(built_context.user_id)
+            await builder.build_context_cached(built_context.user_id, include_nutrition=False)
+
+        assert mock_build.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_fall_back_to_building(self, built_context: CoachContext) -> None:
+        """Test that an unreachable Redis still yields a context."""
+        from unittest.mock import patch
+
+        redis_client = AsyncMock()
+        redis_client.get.side_effect = ConnectionError("redis down")
+        builder = ContextBuilder(AsyncMock(), redis_client=redis_client)
+        with patch.object(builder, "build_context", AsyncMock(return_value=built_context)):
+            context = await builder.build_context_cached(built_context.user_id)
+
+        assert context is built_context
+        redis_client.setex.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_load_checkins_matches_separate_queries(db_session: "AsyncSession") -> None:
+    """Test that the fused check-in load gives what the two separate queries did."""
+    from datetime import date, timedelta
+
+    from app.checkins.models import CheckIn
+    from app.checkins.service import CheckInService
+
+    user_id = uuid.uuid4()
+    today = date.today()
+    days = 14
+    # Every day in range logged, one without a weight, plus a future-dated entry
+    for offset in range(-days, 2):
+        weight = None if offset == -3 else 80.0 + offset * 0.1
+        db_session.add(
+            CheckIn(user_id=user_id, date=today + timedelta(days=offset), weight_kg=weight)
+        )
+    await db_session.commit()
+
+    context = CoachContext(user_id=user_id)
+    await ContextBuilder(db_session)._load_checkins(context, days)
+
+    service = CheckInService(db_session)
+    checkins, _ = await service.get_by_date_range(
+        user_id, from_date=today - timedelta(days=days), to_date=today, limit=days
+    )
+    trend = await service.calculate_weight_trend(user_id, days)
+
+    assert [c["date"] for c in context.recent_checkins] == [str(c.date) for c in checkins]
+    assert context.weight_trend == {
+        "weekly_rate_of_change_kg": trend.weekly_rate_of_change,
+        "total_change_kg": trend.total_change,
+        "start_weight_kg": trend.start_weight,
+        "current_weight_kg": trend.current_weight,
+        "data_points": len(trend.data),
+    }
+
+
+@pytest.mark.asyncio
+async def test_load_targets_matches_calculator_and_is_memoized() -> None:
+    """Test that targets match the calculators and repeat inputs hit the cache."""
+    from app.coach_ai.context_builder import _calculate_targets
+    from app.nutrition.calculator import calculate_bmr, calculate_macro_targets, calculate_tdee
+
+    builder = ContextBuilder(AsyncMock())
+
+    def make_context() -> CoachContext:
+        return CoachContext(
+            user_id=uuid.uuid4(),
+            user_profile={
+                "height_cm": 180.0,
+                "birth_year": 1985,
+                "sex": "female",
+                "activity_level": "active",
+            },
+            user_goal={"goal_type": "fat_loss", "pace_preference": "slow"},
+            weight_trend={"current_weight_kg": 72.35},
+        )
+
+    _calculate_targets.cache_clear()
+    first, second = make_context(), make_context()
+    await builder._load_targets(first)
+    await builder._load_targets(second)
+
+    age = datetime.now().year - 1985
+    tdee = calculate_tdee(calculate_bmr(72.35, 180.0, age, "female"), "active")
+    targets = calculate_macro_targets(tdee, 72.35, "fat_loss", "slow", "female")
+    assert first.calculated_targets == second.calculated_targets
+    assert first.calculated_targets is not None
+    assert first.calculated_targets["tdee"] == round(targets.tdee)
+    assert first.calculated_targets["protein_g"] == round(targets.protein_g)
+    assert _calculate_targets.cache_info().hits == 1
@@ -64,6 +64,18 @@ class TestEatingDisorderPolicyInput:
         assert result.message is not None
         assert "wellbeing" in result.message.lower() or "support" in result.message.lower()
 
+    @pytest.mark.parametrize(
+        "message", ["I purged last night", "Thinking about BINGED snacks", "some thinspo pics"]
+    )
+    def test_detects_keywords_inside_longer_words(
+        self, policy: EatingDisorderPolicy, user_context: UserContext, message: str
+    ) -> None:
+        """Test that keywords match anywhere in the text, not only as whole words."""
+        result = policy.check_input(message, user_context)
+
+        assert result.passed is False
+        assert result.action == PolicyAction.FLAG
+
     def test_detects_purge_keyword(
         self, policy: EatingDisorderPolicy, user_context: UserContext
     ) -> None:
@@ -238,6 +250,15 @@ class TestEatingDisorderPolicyOutput:
         assert result.passed is False
         assert result.action == PolicyAction.BLOCK
 
+    def test_blocks_extreme_diet_pattern(
+        self, policy: EatingDisorderPolicy, user_context: UserContext
+    ) -> None:
+        """Test that extreme diet recommendations are blocked."""
+        result = policy.check_output("An extreme diet is the quickest route.", user_context)
+
+        assert result.passed is False
+        assert result.action == PolicyAction.BLOCK
+
     def test_blocks_fast_for_days_pattern(
         self, policy: EatingDisorderPolicy, user_context: UserContext
     ) -> None:
@@ -0,0 +1,39 @@
+"""Unit tests for identifier generation."""
+
+import time
+import uuid
+
+from app.core.ids import uuid7
+
+
+class TestUuid7:
+    """Tests for uuid7 function."""
+
+    def test_version_and_variant(self) -> None:
+        """Test that generated UUIDs are RFC 9562 version 7."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_current_unix_milliseconds(self) -> None:
+        """Test that the leading 48 bits are the generation time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_later_uuids_sort_after_earlier_ones(self) -> None:
+        """Test that UUIDs from different milliseconds sort by creation time."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+
+    def test_unique(self) -> None:
+        """Test that UUIDs generated in the same millisecond still differ."""
+        values = {uuid7() for _ in range(1000)}
+
+        assert len(values) == 1000
@@ -203,6 +203,26 @@ class TestMedicalClaimsPolicyOutput:
             PolicyAction.BLOCK,
         )
 
+    @pytest.mark.parametrize("condition", MEDICAL_CONDITIONS)
+    def test_adds_disclaimer_for_each_condition(
+        self, policy: MedicalClaimsPolicy, user_context: UserContext, condition: str
+    ) -> None:
+        """Test that every listed condition gets a disclaimer."""
+        result = policy.check_output(
+            f"Talk to your doctor about {condition}-related changes.", user_context
+        )
+
+        assert result.action == PolicyAction.MODIFY
+        assert result.disclaimer is not None
+
+    def test_blocks_diagnosis_regardless_of_case(
+        self, policy: MedicalClaimsPolicy, user_context: UserContext
+    ) -> None:
+        """Test that diagnostic language is caught in any case."""
+        result = policy.check_output("YOU PROBABLY HAVE DIABETES.", user_context)
+
+        assert result.action == PolicyAction.BLOCK
+
     def test_disclaimer_mentions_consult_provider(
         self, policy: MedicalClaimsPolicy, user_context: UserContext
     ) -> None:
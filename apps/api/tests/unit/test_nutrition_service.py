@@ -7,7 +7,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.nutrition.models import NutritionSource
-from app.nutrition.schemas import NutritionDayCreate
+from app.nutrition.schemas import NutritionDayCreate, NutritionDayResponse
 from app.nutrition.service import NutritionService
 
 
@@ -178,6 +178,33 @@ class TestGetByDateRange:
         assert len(items) == 0
 
 
+class TestGetMacrosByDateRange:
+    """Tests for get_macros_by_date_range method."""
+
+    @pytest.mark.asyncio
+    async def test_rows_carry_float_macros(
+        self, service: NutritionService, user_id: uuid.UUID
+    ) -> None:
+        """Test that macro rows come back newest first with float macros."""
+        for i in range(3):
+            await service.create_or_update(
+                user_id,
+                NutritionDayCreate(
+                    date=date.today() - timedelta(days=i),
+                    calories=2000 + i,
+                    protein_g=150.5,
+                ),
+            )
+
+        rows = await service.get_macros_by_date_range(
+            user_id, date.today() - timedelta(days=1), date.today()
+        )
+
+        assert [row.calories for row in rows] == [2000, 2001]
+        assert all(type(row.protein_g) is float and row.protein_g == 150.5 for row in rows)
+        assert all(row.carbs_g is None for row in rows)
+
+
 class TestGetAggregatedStats:
     """Tests for get_aggregated_stats method."""
 
@@ -240,3 +267,21 @@ class TestDeleteByDate:
         deleted = await service.delete_by_date(user_id, date.today())
 
         assert deleted is False
+
+
+@pytest.mark.asyncio
+async def test_response_from_row_matches_validation(
+    service: NutritionService,
+    user_id: uuid.UUID,
+) -> None:
+    """Test that the unvalidated fast path builds the same response as validation."""
+    day = await service.create_or_update(
+        user_id,
+        NutritionDayCreate(date=date.today(), calories=2000, protein_g=150.5, notes="Fast path"),
+    )
+
+    fast = NutritionDayResponse.from_row(day)
+
+    assert fast == NutritionDayResponse.model_validate(day, from_attributes=True)
+    assert fast.source == "manual"
+    assert type(fast.source) is str
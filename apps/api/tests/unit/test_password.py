@@ -1,6 +1,14 @@
 """Unit tests for password hashing."""
 
-from app.auth.password import hash_password, verify_password
+from argon2 import PasswordHasher
+
+from app.auth.password import (
+    ahash_password,
+    averify_password,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
 
 
 def test_hash_password() -> None:
@@ -47,3 +55,25 @@ def test_same_password_different_hashes() -> None:
     # But both should verify correctly
     assert verify_password(password, hash1) is True
     assert verify_password(password, hash2) is True
+
+
+async def test_averify_password_correct() -> None:
+    """Test async password verification offloaded to the executor."""
+    password = "SecurePassword123!"
+    hashed = await ahash_password(password)
+
+    assert await averify_password(password, hashed) is True
+    assert await averify_password("WrongPassword123!", hashed) is False
+
+
+def test_verify_password_invalid_hash() -> None:
+    """Test that a malformed hash fails verification instead of raising."""
+    assert verify_password("SecurePassword123!", "not-a-valid-hash") is False
+
+
+def test_password_needs_rehash() -> None:
+    """Test rehash detection for hashes with outdated parameters."""
+    weak_hash = PasswordHasher(memory_cost=8192, time_cost=1, parallelism=1).hash("Password1!")
+
+    assert password_needs_rehash(hash_password("Password1!")) is False
+    assert password_needs_rehash(weak_hash) is True
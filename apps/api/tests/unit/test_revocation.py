@@ -0,0 +1,146 @@
+"""Unit tests for access token revocation."""
+
+import time
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.auth.dependencies import clear_token_cache, get_current_token_payload
+from app.auth.revocation import (
+    REVOCATION_CHANNEL,
+    _handle_revocation_message,
+    clear_revocations,
+    is_revoked,
+    revoke_user_tokens,
+    sync_revocation,
+)
+from app.auth.tokens import TokenPayload, create_access_token
+from app.exceptions import UnauthorizedError
+
+
+@pytest.fixture(autouse=True)
+def _clear_state() -> None:
+    """Start every test without cached tokens or revocations."""
+    clear_token_cache()
+    clear_revocations()
+
+
+def _payload(user_id: uuid.UUID, issued_at: float) -> TokenPayload:
+    """Build an access token payload issued at the given epoch time."""
+    iat = datetime.fromtimestamp(int(issued_at))
+    return TokenPayload(
+        sub=user_id,
+        email="test@example.com",
+        exp=iat + timedelta(minutes=15),
+        iat=iat,
+        token_type="access",
+        jti=str(uuid.uuid4()),
+    )
+
+
+class TestRevokeUserTokens:
+    """Tests for recording and checking revocations."""
+
+    @pytest.mark.asyncio
+    async def test_earlier_tokens_revoked(self) -> None:
+        """Test that tokens issued before logout-all are revoked."""
+        user_id = uuid.uuid4()
+        now = time.time()
+
+        await revoke_user_tokens(user_id, None)
+
+        assert is_revoked(_payload(user_id, now - 60))
+        assert not is_revoked(_payload(user_id, now + 1))
+        assert not is_revoked(_payload(uuid.uuid4(), now - 60))
+
+    @pytest.mark.asyncio
+    async def test_same_second_token_honored(self) -> None:
+        """Test that a token issued in the logout-all second stays valid."""
+        user_id = uuid.uuid4()
+        now = time.time()
+
+        with patch("app.auth.revocation.time.time", return_value=now):
+            await revoke_user_tokens(user_id, None)
+            assert not is_revoked(_payload(user_id, now))
+
+    @pytest.mark.asyncio
+    async def test_record_expires(self) -> None:
+        """Test that records are dropped once every covered token has expired."""
+        user_id = uuid.uuid4()
+        now = time.time()
+        await revoke_user_tokens(user_id, None)
+
+        with patch("app.auth.revocation.time.time", return_value=now + 24 * 3600):
+            assert not is_revoked(_payload(user_id, now - 60))
+
+    @pytest.mark.asyncio
+    async def test_published_to_redis(self) -> None:
+        """Test that revocations are stored and published for other workers."""
+        user_id = uuid.uuid4()
+        redis_client = AsyncMock()
+
+        await revoke_user_tokens(user_id, redis_client)
+
+        redis_client.set.assert_awaited_once()
+        channel, message = redis_client.publish.await_args.args
+        assert channel == REVOCATION_CHANNEL
+        assert message.startswith(f"{user_id}:")
+
+    @pytest.mark.asyncio
+    async def test_redis_error_keeps_local_record(self) -> None:
+        """Test that a Redis failure still revokes tokens on this worker."""
+        user_id = uuid.uuid4()
+        redis_client = AsyncMock()
+        redis_client.set.side_effect = ConnectionError("redis down")
+
+        await revoke_user_tokens(user_id, redis_client)
+
+        assert is_revoked(_payload(user_id, time.time() - 60))
+
+
+class TestSyncRevocation:
+    """Tests for loading revocations from other workers."""
+
+    @pytest.mark.asyncio
+    async def test_sync_from_redis(self) -> None:
+        """Test that a stored cutoff is applied on a cache miss."""
+        user_id = uuid.uuid4()
+        payload = _payload(user_id, time.time() - 60)
+        redis_client = MagicMock()
+        redis_client.get = AsyncMock(return_value=str(int(time.time())).encode())
+
+        await sync_revocation(payload, redis_client)
+
+        assert is_revoked(payload)
+
+    def test_pubsub_message_applied(self) -> None:
+        """Test that published revocations are applied locally."""
+        user_id = uuid.uuid4()
+        payload = _payload(user_id, time.time() - 60)
+
+        _handle_revocation_message(f"{user_id}:{int(time.time())}".encode())
+
+        assert is_revoked(payload)
+
+    def test_invalid_message_ignored(self) -> None:
+        """Test that malformed messages don't raise."""
+        _handle_revocation_message(b"not-a-uuid:123")
+
+
+class TestCachedTokenRevocation:
+    """Tests for revocation of cached access tokens."""
+
+    @pytest.mark.asyncio
+    async def test_cached_token_rejected_after_logout_all(self) -> None:
+        """Test that logout-all applies to tokens already in the cache."""
+        user_id = uuid.uuid4()
+        now = time.time()
+        token, _ = create_access_token(user_id, "test@example.com")
+        await get_current_token_payload(f"Bearer {token}")
+
+        with patch("app.auth.revocation.time.time", return_value=now + 1):
+            await revoke_user_tokens(user_id, None)
+            with pytest.raises(UnauthorizedError, match="Token has been revoked"):
+                await get_current_token_payload(f"Bearer {token}")
@@ -1,6 +1,7 @@
 """Unit tests for SafetyPolicyEngine."""
 
 import uuid
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -132,6 +133,54 @@ class TestSafetyPolicyEngineCheckInput:
 
         assert len(logs) >= 1
 
+    @pytest.mark.asyncio
+    async def test_skips_policies_without_triggers(
+        self, engine_no_session: SafetyPolicyEngine, user_context: UserContext
+    ) -> None:
+        """Test that input with no policy trigger words isn't run through the policies."""
+        with patch.object(engine_no_session._policies[0], "check_input") as mock_check:
+            result = await engine_no_session.check_input("How often should I train?", user_context)
+
+        mock_check.assert_not_called()
+        assert result.action == PolicyAction.ALLOW
+
+    @pytest.mark.parametrize(
+        "user_input",
+        [
+            "I'll eat 50 calories today",
+            "I only want 800 CALORIES a day",
+            "I keep BINGING at night",
+            "How should I punish myself for eating too much?",
+            "How do I make myself throw up?",
+            "I just want to get rid of the food",
+            "I've been starving myself all week",
+            "I am disgusted by my body",
+            "pro-ana tips",
+            "How can I drop 5 kg fast?",
+            "Can I lose 5 lbs a week?",
+            "I want to lose 3 Kilos per week",
+            "Do I have anorexia?",
+            "Should I stop my medication?",
+            "Which drug should I use?",
+            "Is it safe to fast?",
+            "What should I eat while pregnant?",
+        ],
+    )
+    def test_triggers_cover_policy_matches(
+        self, engine_no_session: SafetyPolicyEngine, user_context: UserContext, user_input: str
+    ) -> None:
+        """Test that every input a policy acts on contains one of the triggers."""
+        acted = [
+            policy
+            for policy in engine_no_session._policies
+            if (result := policy.check_input(user_input, user_context)).passed is False
+            or result.disclaimer
+        ]
+
+        assert acted
+        assert engine_no_session._input_triggers is not None
+        assert engine_no_session._input_triggers.search(user_input.lower())
+
 
 class TestSafetyPolicyEngineCheckOutput:
     """Tests for check_output method."""
@@ -212,6 +261,24 @@ class TestSafetyPolicyEngineCheckOutput:
             # Allow up to 2 (one per policy type) but not excessive duplication
             assert disclaimer_count <= 3
 
+    @pytest.mark.asyncio
+    async def test_check_output_lowercases_once(
+        self, engine_no_session: SafetyPolicyEngine, user_context: UserContext
+    ) -> None:
+        """Test that the policies share one lowercased copy of the output."""
+        mocks = [
+            patch.object(policy, "check_output", wraps=policy.check_output)
+            for policy in engine_no_session._policies
+        ]
+        with mocks[0] as first, mocks[1] as second, mocks[2] as third, mocks[3] as fourth:
+            await engine_no_session.check_output(
+                "A Balanced Plan Helps You Eat Well.", user_context
+            )
+
+        lowered = [mock.call_args.kwargs["text_lower"] for mock in (first, second, third, fourth)]
+        assert lowered[0] == "a balanced plan helps you eat well."
+        assert all(text is lowered[0] for text in lowered)
+
 
 class TestSafetyPolicyEngineLogging:
     """Tests for violation logging."""
@@ -1,7 +1,14 @@
 """Unit tests for JWT token service."""
 
+import base64
+import hashlib
+import hmac
+import json
+import time
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
+
+import jwt
 
 from app.auth.tokens import (
     create_access_token,
@@ -10,6 +17,7 @@ from app.auth.tokens import (
     decode_token,
     hash_token,
 )
+from app.config import get_settings
 
 
 def test_create_access_token() -> None:
@@ -32,9 +40,9 @@ def test_create_refresh_token() -> None:
     token, expires, token_hash = create_refresh_token(user_id, email)
 
     assert isinstance(token, str)
-    assert isinstance(token_hash, str)
+    assert isinstance(token_hash, bytes)
     assert expires > datetime.utcnow()
-    assert len(token_hash) == 64  # SHA-256 hex length
+    assert len(token_hash) == 16  # BLAKE2b-128 digest length
 
 
 def test_decode_valid_access_token() -> None:
@@ -46,7 +54,7 @@ def test_decode_valid_access_token() -> None:
     payload = decode_token(token)
 
     assert payload is not None
-    assert payload.sub == str(user_id)
+    assert payload.sub == user_id
     assert payload.email == email
     assert payload.token_type == "access"
 
@@ -60,7 +68,7 @@ def test_decode_valid_refresh_token() -> None:
     payload = decode_token(token)
 
     assert payload is not None
-    assert payload.sub == str(user_id)
+    assert payload.sub == user_id
     assert payload.email == email
     assert payload.token_type == "refresh"
 
@@ -98,18 +106,18 @@ def test_token_pair_creation() -> None:
     assert token_pair.token_type == "bearer"
     assert token_pair.expires_in > 0
     assert refresh_expires > datetime.utcnow()
-    assert len(refresh_hash) == 64
+    assert len(refresh_hash) == 16
 
 
 def test_hash_token() -> None:
-    """Test token hashing produces consistent SHA-256 hash."""
+    """Test token hashing produces a consistent BLAKE2b-128 digest."""
     token = "test_token_string"
 
     hash1 = hash_token(token)
     hash2 = hash_token(token)
 
     assert hash1 == hash2
-    assert len(hash1) == 64  # SHA-256 produces 64 hex characters
+    assert len(hash1) == 16  # BLAKE2b-128 produces 16 bytes
 
 
 def test_different_tokens_different_hashes() -> None:
@@ -118,3 +126,99 @@ def test_different_tokens_different_hashes() -> None:
     hash2 = hash_token("token2")
 
     assert hash1 != hash2
+
+
+def test_decode_token_with_non_uuid_subject() -> None:
+    """Test that a validly signed token with a malformed subject is rejected."""
+    settings = get_settings()
+    token = jwt.encode(
+        {
+            "sub": "not-a-uuid",
+            "email": "test@example.com",
+            "token_type": "access",
+            "exp": datetime.utcnow() + timedelta(minutes=5),
+            "iat": datetime.utcnow(),
+            "jti": "jti",
+        },
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+    )
+
+    assert decode_token(token) is None
+
+
+def test_decode_token_with_non_object_payload() -> None:
+    """Test that a validly signed token whose claims aren't a JSON object is rejected."""
+    settings = get_settings()
+    token = jwt.api_jws.encode(b"[1, 2, 3]", settings.jwt_secret_key, algorithm="HS256")
+
+    assert decode_token(token) is None
+
+
+def test_access_token_matches_pyjwt_encoding() -> None:
+    """Test that the HS256 fast path produces the same token PyJWT would."""
+    settings = get_settings()
+    token, _ = create_access_token(uuid.uuid4(), "test@example.com")
+
+    claims = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+    assert jwt.encode(claims, settings.jwt_secret_key, algorithm="HS256") == token
+
+
+def _sign(header: bytes, claims: dict[str, object]) -> str:
+    """Build an HS256-signed token with an arbitrary header."""
+    settings = get_settings()
+    segments = [
+        base64.urlsafe_b64encode(header).rstrip(b"="),
+        base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"="),
+    ]
+    signing_input = b".".join(segments)
+    signature = hmac.new(settings.jwt_secret_key.encode(), signing_input, hashlib.sha256).digest()
+    return b".".join([signing_input, base64.urlsafe_b64encode(signature).rstrip(b"=")]).decode()
+
+
+def _claims(**overrides: object) -> dict[str, object]:
+    """Valid access token claims, with overrides."""
+    now = int(time.time())
+    return {
+        "sub": str(uuid.uuid4()),
+        "email": "test@example.com",
+        "token_type": "access",
+        "exp": now + 300,
+        "iat": now,
+        "jti": "jti",
+        **overrides,
+    }
+
+
+def test_decode_token_rejects_other_header_alg() -> None:
+    """Test that the HS256 fast path requires the header to name HS256."""
+    token = _sign(b'{"alg":"HS512","typ":"JWT"}', _claims())
+
+    assert decode_token(token) is None
+
+
+def test_decode_token_rejects_future_iat() -> None:
+    """Test that tokens issued in the future are rejected."""
+    token = _sign(b'{"alg":"HS256","typ":"JWT"}', _claims(iat=int(time.time()) + 60))
+
+    assert decode_token(token) is None
+
+
+def test_decode_token_rejects_non_base64url_signature() -> None:
+    """Test that junk characters in the signature aren't silently dropped."""
+    token = _sign(b'{"alg":"HS256","typ":"JWT"}', _claims())
+
+    assert decode_token(token) is not None
+    assert decode_token(token + "!") is None
+
+
+def test_returned_expiry_matches_exp_claim() -> None:
+    """Test that the returned expiry is the token's exp as naive UTC."""
+    token, expires = create_access_token(uuid.uuid4(), "test@example.com")
+
+    claims = jwt.decode(token, options={"verify_signature": False})
+
+    assert expires.tzinfo is None
+    assert expires == datetime.fromtimestamp(claims["exp"], UTC).replace(tzinfo=None)
@@ -176,6 +176,20 @@ class TestToolRegistryToolDefinitions:
         assert definitions[0].description == "A mock tool for testing"
         assert "param1" in definitions[0].parameters["properties"]
 
+    def test_tool_definitions_are_shared_across_registries(self) -> None:
+        """Test that per-request registries reuse each tool class's definition."""
+        first = ToolRegistry()
+        first.register(MockTool())
+        second = ToolRegistry()
+        second.register(MockTool())
+        second.register(MockFailingTool())
+
+        first_definitions = first.get_tool_definitions("user123")
+        second_definitions = second.get_tool_definitions("user123")
+
+        assert second_definitions[0] is first_definitions[0]
+        assert second_definitions[1].name == "failing_tool"
+
 
 class TestToolRegistryExecute:
     """Tests for tool execution."""
@@ -63,6 +63,41 @@ class TestUserServiceGetUserWithRelations:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_loads_relations_in_one_query(self, db_session: AsyncSession) -> None:
+        """Test that all relations arrive in a single query and nothing lazy-loads."""
+        from sqlalchemy import event
+        from sqlalchemy.exc import InvalidRequestError
+
+        user = User(email="relations@example.com", hashed_password="hash")
+        db_session.add(user)
+        await db_session.flush()
+        db_session.add(UserProfile(user_id=user.id))
+        db_session.add(UserGoal(user_id=user.id))
+        await db_session.commit()
+        user_id = user.id
+        db_session.expunge_all()
+
+        statements: list[str] = []
+
+        def record(*args: object) -> None:
+            statements.append(str(args[2]))
+
+        engine = db_session.bind.sync_engine  # type: ignore[union-attr]
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = await UserService(db_session).get_user_with_relations(user_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert result is not None
+        assert result.profile is not None
+        assert result.goal is not None
+        assert result.diet_preferences is None
+        with pytest.raises(InvalidRequestError):
+            _ = result.profile.user
+
 
 class TestUserServiceUpdateProfile:
     """Tests for UserService.update_profile method."""
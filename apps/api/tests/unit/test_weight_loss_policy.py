@@ -216,6 +216,28 @@ class TestWeightLossPolicyOutput:
         assert result.disclaimer is not None
         assert "muscle" in result.disclaimer.lower()
 
+    def test_reads_units_from_the_match(
+        self, policy: WeightLossPolicy, user_context: UserContext
+    ) -> None:
+        """Test that kilograms aren't converted as if they were pounds."""
+        assert policy.check_output("You could lose 2 lbs per week.", user_context).passed is True
+        assert policy.check_output("You could lose 2 kg per week.", user_context).passed is False
+
+    def test_matches_regardless_of_case(
+        self, policy: WeightLossPolicy, user_context: UserContext
+    ) -> None:
+        """Test that upper-case text is matched, units included."""
+        assert policy.check_output("LOSE 2 LBS PER WEEK.", user_context).passed is True
+        assert policy.check_output("LOSE 2 KG PER WEEK.", user_context).passed is False
+
+    def test_checks_every_match(self, policy: WeightLossPolicy, user_context: UserContext) -> None:
+        """Test that a safe amount earlier in the text doesn't hide a later one."""
+        result = policy.check_output(
+            "Most people lose 1 lb per week, but some lose 5 lbs per week.", user_context
+        )
+
+        assert result.passed is False
+
     def test_allows_borderline_recommendation(
         self, policy: WeightLossPolicy, user_context: UserContext
     ) -> None: